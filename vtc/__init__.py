@@ -4,5 +4,22 @@ from ._version import __version__  # noqa
 
 from ._framerate import Framerate, FramerateSource, RATE  # noqa
 from ._timecode import Timecode, TimecodeSource, TimecodeSourceTypes  # noqa
+from ._timecode_sections import TimecodeSections  # noqa
 from ._range import Range  # noqa
 from ._premiere_ticks import PremiereTicks  # noqa
+from ._flicks import Flicks  # noqa
+from ._pts import PTS  # noqa
+from ._samples import Samples, SampleRateSource  # noqa
+from ._merge import merge  # noqa
+from ._external_sort import external_sort  # noqa
+
+from . import ranges  # noqa
+from . import convert  # noqa
+from . import bwf  # noqa
+from . import quicktime  # noqa
+from . import mxf  # noqa
+from . import image  # noqa
+from . import smpte12m  # noqa
+from . import ltc  # noqa
+from . import mtc  # noqa
+from . import vitc  # noqa
@@ -0,0 +1,83 @@
+from typing import Any, Tuple
+
+from ._framerate import Framerate
+from ._timecode_dropframe import _drop_frames, _dropped_frames
+
+
+def _unpack_time_word(word: Any) -> Tuple[Any, Any, Any, Any, Any]:
+    """
+    _unpack_time_word unpacks the BCD digits and drop-frame flag of 32-bit SMPTE
+    time words as used by DPX and OpenEXR headers, with frames in the lowest byte and
+    hours in the highest.
+
+    Works on both ints and NumPy integer arrays of words.
+
+    :returns: hours, minutes, seconds, frames and the drop-frame flag.
+    """
+    frames = (word & 0xF) + ((word >> 4) & 0x3) * 10
+    dropframe = (word >> 6) & 0x1
+    seconds = ((word >> 8) & 0xF) + ((word >> 12) & 0x7) * 10
+    minutes = ((word >> 16) & 0xF) + ((word >> 20) & 0x7) * 10
+    hours = ((word >> 24) & 0xF) + ((word >> 28) & 0x3) * 10
+    return hours, minutes, seconds, frames, dropframe
+
+
+def _sections_to_frames(
+    hours: Any, minutes: Any, seconds: Any, frames: Any, rate: Framerate
+) -> Any:
+    """
+    _sections_to_frames converts timecode sections to frame counts with integer
+    arithmetic, applying the drop-frame adjustment for drop-frame rates.
+
+    Works on both ints and NumPy integer arrays of sections. Unlike parsing a timecode
+    string, frames dropped by drop-frame timecode are not rejected.
+
+    :raises ValueError: If rate does not have a whole-number timebase.
+    """
+    timebase = rate.timebase
+    if timebase.denominator != 1:
+        raise ValueError(
+            f"timecode sections require a whole-number timebase, got {timebase}"
+        )
+
+    fps = timebase.numerator
+    total = (hours * 3600 + minutes * 60 + seconds) * fps + frames
+
+    if rate.dropframe:
+        total -= _dropped_frames(hours * 60 + minutes, _drop_frames(fps))
+
+    return total
+
+
+def _frames_to_sections(frames: Any, rate: Framerate) -> Tuple[Any, Any, Any, Any]:
+    """
+    _frames_to_sections converts frame counts to timecode sections with integer
+    arithmetic, applying the drop-frame adjustment for drop-frame rates. This is the
+    inverse of :func:`_sections_to_frames`.
+
+    Works on both non-negative ints and NumPy integer arrays of frame counts. Callers
+    must check that rate has a whole-number timebase.
+
+    :returns: hours, minutes, seconds and frames.
+    """
+    fps = rate.timebase.numerator
+
+    if rate.dropframe:
+        drop_frames = _drop_frames(fps)
+        frames_per_minute = fps * 60
+        frames_per_minute_drop = frames_per_minute - drop_frames
+        frames_per_10_minutes = frames_per_minute_drop * 9 + frames_per_minute
+
+        tens_of_minutes, remainder = divmod(frames, frames_per_10_minutes)
+        # Frames are dropped at the start of every minute after the first in each
+        # ten. Multiplying by the comparison zeroes the adjustment within the first
+        # minute without branching, so arrays are adjusted in one pass.
+        drop_minutes = (remainder >= frames_per_minute) * (
+            (remainder - frames_per_minute) // frames_per_minute_drop + 1
+        )
+        frames = frames + drop_frames * (9 * tens_of_minutes + drop_minutes)
+
+    hours, frames = divmod(frames, fps * 3600)
+    minutes, frames = divmod(frames, fps * 60)
+    seconds, frames = divmod(frames, fps)
+    return hours, minutes, seconds, frames
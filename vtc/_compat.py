@@ -0,0 +1,7 @@
+# numpy is an optional dependency used to accelerate bulk operations when it is
+# installed. Modules should check "_compat.numpy is not None" at call time rather than
+# importing the name directly, so the pure-python paths can be tested by patching it.
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
@@ -29,5 +29,17 @@ _SECONDS_PER_HOUR: int = 3600
 # value is constant regardless of framerate.
 _PPRO_TICKS_PER_SECOND: fractions.Fraction = fractions.Fraction(254016000000, 1)
 
+# _FLICKS_PER_SECOND is the number of flicks in a second. A flick divides evenly into a
+# frame at all common video framerates, including NTSC, and into a sample at all common
+# audio sample rates.
+_FLICKS_PER_SECOND: int = 705600000
+
 # _FRAMES_PER_FOOT is the number of frames in a foot of 35mm, 4-perf film.
 _FRAMES_PER_FOOT: int = 16
+
+# _PTS_TICKS_PER_SECOND is the number of ticks in a second of the 90 kHz clock used for
+# MPEG presentation timestamps.
+_PTS_TICKS_PER_SECOND: int = 90000
+
+# _PTS_WRAP is the value at which 33-bit MPEG presentation timestamps wrap back to 0.
+_PTS_WRAP: int = 2**33
@@ -0,0 +1,159 @@
+import heapq
+import struct
+import sys
+import tempfile
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from ._framerate import Framerate
+from ._timecode import Timecode
+
+# _RECORD_HEADER is the header of a record in a spilled run: a signed 64-bit frame count
+# followed by the unsigned 32-bit length of the payload that comes after it.
+_RECORD_HEADER = struct.Struct("<qI")
+
+# _FrameRecord is a record as it is held while sorting: (frame count, payload).
+_FrameRecord = Tuple[int, bytes]
+
+# _RECORD_OVERHEAD is the approximate memory each buffered record takes beyond the bytes
+# of its payload: its tuple and list slot, its frame count and the payload object.
+_RECORD_OVERHEAD = (
+    sys.getsizeof((0, b""))
+    + struct.calcsize("P")
+    + sys.getsizeof(24 * 60 * 60 * 24)
+    + sys.getsizeof(b"")
+)
+
+
+def external_sort(
+    records: Iterable[Tuple[Timecode, bytes]],
+    *,
+    memory_limit: int = 64 * 1024 * 1024,
+    temp_dir: Optional[str] = None,
+) -> Iterator[Tuple[Timecode, bytes]]:
+    """
+    Sorts ``(timecode, payload)`` records by timecode, using temporary files so that
+    more records can be sorted than fit in memory.
+
+    Records are gathered until they reach ``memory_limit``, then sorted by frame count
+    and written to a temporary file as a compact binary run. Once every record has been
+    read, the runs are merged back together into a single, globally sorted stream.
+
+    :param records: The records to sort. Every timecode must have the same framerate.
+        Payloads must be ``bytes``, and should be serialized by the caller.
+
+    :param memory_limit: The approximate number of bytes of records to hold in memory
+        at once. Each record counts as the length of its payload plus the memory Python
+        needs to hold it, about 130 bytes on 64-bit builds.
+
+    :param temp_dir: The directory to write runs to. Uses the system default when not
+        set. Runs are deleted as soon as the returned iterator is exhausted or closed.
+
+    :returns: An iterator of the records in timecode order. Records with equal
+        timecodes are returned in the order they were read. Returned timecodes are
+        new :class:`Timecode` values with the same framerate as the input.
+
+    :raises ValueError: If ``memory_limit`` is less than 1. When iterating, if the
+        timecodes do not all have the same framerate.
+    """
+    if memory_limit < 1:
+        raise ValueError(f"memory_limit must be at least 1, got {memory_limit}")
+
+    return _iter_external_sort(records, memory_limit, temp_dir)
+
+
+def _iter_external_sort(
+    records: Iterable[Tuple[Timecode, bytes]],
+    memory_limit: int,
+    temp_dir: Optional[str],
+) -> Iterator[Tuple[Timecode, bytes]]:
+    """_iter_external_sort is the lazy body of external_sort."""
+    rate: Optional[Framerate] = None
+    runs: List[IO[bytes]] = list()
+    buffer: List[_FrameRecord] = list()
+    buffer_size = 0
+
+    try:
+        for timecode, payload in records:
+            if rate is None:
+                rate = timecode.rate
+            elif timecode.rate is not rate and timecode.rate != rate:
+                raise ValueError("all record timecodes must have matching framerate")
+
+            buffer.append((timecode.frames, payload))
+            buffer_size += _RECORD_OVERHEAD + len(payload)
+
+            if buffer_size >= memory_limit:
+                runs.append(_spill_run(buffer, temp_dir))
+                buffer = list()
+                buffer_size = 0
+
+        if rate is None:
+            return
+
+        # list.sort is stable, and heapq.merge returns equal keys in the order of the
+        # runs, which keeps records with equal timecodes in the order they were read.
+        buffer.sort(key=_frames_key)
+        sorted_records = heapq.merge(
+            *(_read_run(run, memory_limit // (len(runs) + 1)) for run in runs),
+            buffer,
+            key=_frames_key,
+        )
+
+        for frames, payload in sorted_records:
+            yield Timecode._from_frames(frames, rate), payload
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _frames_key(record: _FrameRecord) -> int:
+    """_frames_key is the sort key of a record."""
+    return record[0]
+
+
+def _spill_run(buffer: List[_FrameRecord], temp_dir: Optional[str]) -> IO[bytes]:
+    """
+    _spill_run sorts the buffered records and writes them to a new temporary file,
+    which is returned rewound to the start.
+    """
+    buffer.sort(key=_frames_key)
+
+    run = tempfile.TemporaryFile(dir=temp_dir)
+    pack = _RECORD_HEADER.pack
+    for frames, payload in buffer:
+        run.write(pack(frames, len(payload)))
+        run.write(payload)
+
+    run.seek(0)
+    return run
+
+
+def _read_run(run: IO[bytes], read_size: int) -> Iterator[_FrameRecord]:
+    """
+    _read_run lazily reads the records of a spilled run, reading the file in blocks of
+    about read_size bytes.
+    """
+    unpack_from = _RECORD_HEADER.unpack_from
+    header_size = _RECORD_HEADER.size
+    read_size = max(read_size, 4096)
+
+    data = b""
+    offset = 0
+
+    while True:
+        block = run.read(read_size)
+        if not block:
+            return
+
+        data = data[offset:] + block
+        offset = 0
+
+        while offset + header_size <= len(data):
+            frames, length = unpack_from(data, offset)
+            start = offset + header_size
+            end = start + length
+            if end > len(data):
+                break
+
+            yield frames, data[start:end]
+            offset = end
@@ -0,0 +1,13 @@
+from ._time_int import _TimeInt
+
+
+class Flicks(_TimeInt):
+
+    """
+    Flicks signals than an int value represents a flicks value and can be used to wrap
+    ints for parsing tc and doing mathematical operations.
+
+    A flick is 1/705600000 of a second, which divides evenly into a frame at all common
+    video framerates, including NTSC, and into a sample at all common audio sample
+    rates.
+    """
@@ -0,0 +1,114 @@
+import fractions
+import heapq
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._framerate import Framerate
+from ._timecode import Timecode
+
+_T = TypeVar("_T")
+
+# _MergeKey is the sort key of a merge heap entry: a frame count while every timecode
+# shares a framerate, otherwise rational seconds.
+_MergeKey = Union[int, fractions.Fraction]
+
+# _MergeEntry is a merge heap entry of (key, iterable index, item, iterator). The
+# iterable index is unique within the heap, so items themselves are never compared.
+_MergeEntry = Tuple[_MergeKey, int, Any, Iterator[Any]]
+
+
+def merge(
+    *iterables: Iterable[_T],
+    key: Optional[Callable[[_T], Timecode]] = None,
+) -> Iterator[_T]:
+    """
+    Lazily merges many iterables that are each already sorted by timecode into a single
+    sorted iterator, like :func:`heapq.merge`. Only one item from each iterable is held
+    in memory at a time.
+
+    Items are ordered by frame count while every timecode seen has the same framerate,
+    and by exact rational time once timecodes of differing framerates are found, so
+    :class:`Timecode` comparisons are never needed.
+
+    :param iterables: The sorted iterables to merge.
+
+    :param key: A function that returns the :class:`Timecode` of an item. When not set,
+        the items must be :class:`Timecode` values themselves.
+
+    :returns: An iterator of every item, in timecode order. Items with equal timecodes
+        are returned in the order of the iterables they came from.
+    """
+    get_timecode = key if key is not None else _item_timecode
+    keys = _MergeKeys()
+    heap: List[_MergeEntry] = list()
+
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append((keys.key(get_timecode(item), heap), index, item, iterator))
+            break
+
+    heapq.heapify(heap)
+
+    while heap:
+        _, index, item, iterator = heap[0]
+        yield item
+
+        for item in iterator:
+            entry = (keys.key(get_timecode(item), heap), index, item, iterator)
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+
+
+class _MergeKeys:
+    """
+    _MergeKeys builds the sort keys for merge. Keys are frame counts until the first
+    timecode with a differing framerate is found, at which point every key in the heap
+    is converted to rational time, and rational time is used from then on.
+    """
+
+    def __init__(self) -> None:
+        self._rate: Optional[Framerate] = None
+        self._by_frames = True
+
+    def key(self, timecode: Timecode, heap: List[_MergeEntry]) -> _MergeKey:
+        """key returns the sort key for timecode, converting the heap if needed."""
+        if self._by_frames:
+            rate = self._rate
+            if rate is None:
+                rate = self._rate = timecode.rate
+
+            if timecode.rate is rate or timecode.rate == rate:
+                return timecode.frames
+
+            self._convert_to_rational(heap, rate)
+
+        return timecode.rational
+
+    def _convert_to_rational(self, heap: List[_MergeEntry], rate: Framerate) -> None:
+        """
+        _convert_to_rational converts frame count keys at rate to rational time. The
+        conversion preserves ordering, so the heap does not need to be re-heapified.
+        """
+        self._by_frames = False
+        playback = rate.playback
+        heap[:] = [
+            (frames / playback, index, item, iterator)
+            for frames, index, item, iterator in heap
+        ]
+
+
+def _item_timecode(item: Any) -> Timecode:
+    """_item_timecode is the default merge key, for merging Timecode values."""
+    return item
@@ -0,0 +1,10 @@
+from ._time_int import _TimeInt
+
+
+class PTS(_TimeInt):
+
+    """
+    PTS signals than an int value represents an MPEG presentation timestamp on the
+    90 kHz system clock, as found in transport streams and MP4 files, and can be used to
+    wrap ints for parsing tc and doing mathematical operations.
+    """
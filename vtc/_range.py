@@ -1,9 +1,16 @@
-from typing import Union, Optional, Container
+from typing import Union, Optional, Container, Iterator, Tuple, Iterable, Sequence, Any
 
-from ._timecode import Timecode, TimecodeSource, TimecodeSourceTypes
+from . import _compat
+from ._framerate import Framerate, FramerateSource
+from ._timecode import Timecode, TimecodeSource, TimecodeSourceTypes, _frame_positions
 
 
 class Range(Container[Union[TimecodeSource, "Range"]]):
+    # Ranges are often created by the hundreds of thousands for a timeline, so we store
+    # the bounds as bare frame counts with a single shared Framerate rather than as two
+    # full Timecode values.
+    __slots__ = ("_frame_in", "_frame_out", "_rate")
+
     def __init__(self, tc1: Timecode, tc2: Timecode) -> None:
         """
         Represents the range between two timecodes. A timecode Range is exclusive.
@@ -26,51 +33,163 @@ class Range(Container[Union[TimecodeSource, "Range"]]):
         if tc1.rate != tc2.rate:
             raise ValueError("Range in and out must have matching framerate")
 
-        self._in: Timecode
-        self._out: Timecode
+        self._rate: Framerate = tc1.rate
+        self._frame_in: int
+        self._frame_out: int
+
+        frames1 = tc1.frames
+        frames2 = tc2.frames
 
-        if tc1 < tc2:
-            self._in = tc1
-            self._out = tc2
+        if frames1 < frames2:
+            self._frame_in = frames1
+            self._frame_out = frames2
         else:
-            self._in = tc2
-            self._out = tc1
+            self._frame_in = frames2
+            self._frame_out = frames1
+
+    @classmethod
+    def from_frames(
+        cls,
+        frame_in: int,
+        frame_out: int,
+        *,
+        rate: FramerateSource,
+    ) -> "Range":
+        """
+        Creates a range directly from in and out frame counts, without creating any
+        intermediate :class:`Timecode` values.
+
+        :param frame_in: The frame count of the in point.
+
+        :param frame_out: The frame count of the out point.
+
+        :param rate: The framerate of the range. May be any value which can be passed to
+            the constructor of :class:`Framerate`.
+
+        :returns: The new range. As with the regular constructor, the in and out
+            points are flipped if ``frame_out`` comes before ``frame_in``.
+        """
+        if frame_out < frame_in:
+            frame_in, frame_out = frame_out, frame_in
+
+        return cls._from_frames(frame_in, frame_out, Framerate(rate))
+
+    @classmethod
+    def _from_frames(cls, frame_in: int, frame_out: int, rate: Framerate) -> "Range":
+        """
+        _from_frames creates a range from ordered frame counts and an already-parsed
+        Framerate without validating either.
+        """
+        tc_range = cls.__new__(cls)
+        tc_range._frame_in = frame_in
+        tc_range._frame_out = frame_out
+        tc_range._rate = rate
+        return tc_range
 
     def __str__(self) -> str:
-        return f"{self._in.timecode} - {self._out.timecode}"
+        return f"{self.tc_in.timecode} - {self.tc_out.timecode}"
 
     def __repr__(self) -> str:
-        return f"[{self._in.timecode} - {self._out.timecode} @ {repr(self._in.rate)}]"
+        return f"[{self.tc_in.timecode} - {self.tc_out.timecode} @ {repr(self._rate)}]"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Range):
             return NotImplemented
 
-        return self._in == other._in and self._out == other._out
+        if self._rate == other._rate:
+            return (
+                self._frame_in == other._frame_in
+                and self._frame_out == other._frame_out
+            )
+
+        # Ranges of differing framerates are equal when their rational times are.
+        return self.tc_in == other.tc_in and self.tc_out == other.tc_out
 
     def __len__(self) -> int:
-        return abs(self._out - self._in).frames
+        return self._frame_out - self._frame_in
 
     def __contains__(self, item: object) -> bool:
         if isinstance(item, Range):
-            # The range is not overlapping if this range ends before the other begins or
-            # beings after the other ends
-            return not (self._in >= item._out or self._out <= item._in)
+            if self._rate == item._rate:
+                # The range is not overlapping if this range ends before the other
+                # begins or beings after the other ends
+                return not (
+                    self._frame_in >= item._frame_out
+                    or self._frame_out <= item._frame_in
+                )
+
+            return not (self.tc_in >= item.tc_out or self.tc_out <= item.tc_in)
+
+        # Plain frame counts can be compared as-is. We check the exact type so int
+        # subclasses like PremiereTicks are still parsed.
+        if type(item) is int:
+            return self._frame_in <= item < self._frame_out
 
         if not isinstance(item, TimecodeSourceTypes):
             return False
 
-        return self._in <= item < self._out
+        if isinstance(item, Timecode):
+            if item.rate != self._rate:
+                return self.tc_in <= item < self.tc_out
+        else:
+            item = Timecode(item, rate=self._rate)
+
+        return self._frame_in <= item.frames < self._frame_out
+
+    def contains_many(self, values: Iterable[TimecodeSource]) -> Sequence[bool]:
+        """
+        Checks which of many values fall within the range. This is the bulk version of
+        ``value in tc_range`` for timecode values, and compares frame counts rather
+        than building a :class:`Timecode` for every value.
+
+        :param values: The values to check. May contain any value that can be passed
+            to the :class:`Timecode` constructor, and is parsed at the range's
+            framerate. Ints are treated as frame counts. May also be a NumPy array of
+            integer frame counts.
+
+        :returns: A mask with a bool for each value, ``True`` where the value falls
+            within the range. When ``values`` is a NumPy array, the mask is a NumPy
+            bool array, otherwise it is a list.
+
+        :raises TypeError: If a value is of a type that cannot be parsed as a
+            timecode.
+        """
+        numpy = _compat.numpy
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return _contains_many_array(self, values)
+
+        frame_in = self._frame_in
+        frame_out = self._frame_out
+
+        return [
+            frame_in <= position < frame_out
+            for position in _frame_positions(values, self._rate)
+        ]
 
     @property
     def tc_in(self) -> Timecode:
         """The in point of the range."""
-        return self._in
+        return Timecode._from_frames(self._frame_in, self._rate)
 
     @property
     def tc_out(self) -> Timecode:
         """The out point of the range."""
-        return self._out
+        return Timecode._from_frames(self._frame_out, self._rate)
+
+    @property
+    def frame_in(self) -> int:
+        """The frame count of the in point of the range."""
+        return self._frame_in
+
+    @property
+    def frame_out(self) -> int:
+        """The frame count of the out point of the range."""
+        return self._frame_out
+
+    @property
+    def rate(self) -> Framerate:
+        """The framerate shared by the in and out points of the range."""
+        return self._rate
 
     def intersection(self, other: "Range") -> Optional["Range"]:
         """
@@ -80,8 +199,15 @@ class Range(Container[Union[TimecodeSource, "Range"]]):
         if other not in self:
             return None
 
-        overlap_in = max(self._in, other._in)
-        overlap_out = min(self._out, other._out)
+        if self._rate == other._rate:
+            return Range._from_frames(
+                max(self._frame_in, other._frame_in),
+                min(self._frame_out, other._frame_out),
+                self._rate,
+            )
+
+        overlap_in = max(self.tc_in, other.tc_in)
+        overlap_out = min(self.tc_out, other.tc_out)
 
         return Range(overlap_in, overlap_out)
 
@@ -93,7 +219,177 @@ class Range(Container[Union[TimecodeSource, "Range"]]):
         if other in self:
             return None
 
-        overlap_in = max(self._in, other._in)
-        overlap_out = min(self._out, other._out)
+        if self._rate == other._rate:
+            return Range._from_frames(
+                min(self._frame_out, other._frame_out),
+                max(self._frame_in, other._frame_in),
+                self._rate,
+            )
+
+        overlap_in = max(self.tc_in, other.tc_in)
+        overlap_out = min(self.tc_out, other.tc_out)
 
         return Range(overlap_in, overlap_out)
+
+    def chunks(
+        self,
+        *,
+        size: Optional[int] = None,
+        count: Optional[int] = None,
+        align: Optional[int] = None,
+    ) -> Iterator["Range"]:
+        """
+        Lazily splits the range into consecutive sub-ranges that together cover it
+        exactly. Chunk boundaries are calculated with integer frame math, so no
+        intermediate timecodes are created.
+
+        :param size: The length, in frames, of each chunk. The final chunk will be
+            shorter if the range does not divide evenly.
+
+        :param count: The number of chunks to split the range into. Chunk lengths will
+            differ by at most one frame. If the range has fewer frames than ``count``,
+            one chunk per frame is returned.
+
+        :param align: When set, each boundary between two chunks is moved to a frame
+            count divisible by ``align``, such as a GOP length or
+            ``int(rate.timebase)`` for whole seconds. With ``size``, each boundary is
+            placed ``size`` frames after the previous one, then moved to the nearest
+            aligned frame, so no chunk is longer than ``size + align - 1`` frames.
+            With ``count``, each boundary is moved back to the previous aligned frame.
+            Boundaries that collapse onto each other are merged, so fewer chunks than
+            requested may be returned.
+
+        :returns: An iterator of :class:`Range` values.
+
+        :raises ValueError: If both or neither of ``size`` and ``count`` are set, or if
+            any argument is less than 1.
+        """
+        rate = self._rate
+        bounds = _chunk_bounds(
+            self._frame_in, self._frame_out, size=size, count=count, align=align
+        )
+
+        return (
+            Range._from_frames(chunk_in, chunk_out, rate)
+            for chunk_in, chunk_out in bounds
+        )
+
+
+def _contains_many_array(tc_range: Range, values: Any) -> Any:
+    """
+    _contains_many_array is the NumPy implementation of :func:`Range.contains_many`.
+    """
+    numpy = _compat.numpy
+
+    # Arrays of frame counts can be compared directly. Anything else (strings, objects,
+    # float seconds) needs to be parsed value-by-value first.
+    if values.dtype.kind in "iu":
+        return (values >= tc_range._frame_in) & (values < tc_range._frame_out)
+
+    return numpy.array(
+        tc_range.contains_many(values.ravel().tolist()), dtype=bool
+    ).reshape(values.shape)
+
+
+def _chunk_bounds(
+    start: int,
+    end: int,
+    *,
+    size: Optional[int],
+    count: Optional[int],
+    align: Optional[int],
+) -> Iterator[Tuple[int, int]]:
+    """
+    _chunk_bounds validates the chunking arguments, then returns an iterator of the
+    (in, out) frame counts for each chunk of the frame range between start and end. See
+    :func:`Range.chunks` for argument details.
+    """
+    _validate_chunk_args(size=size, count=count, align=align)
+
+    length = end - start
+    if size is not None:
+        # Ceiling division so the final, partial chunk is included.
+        chunk_count = -(-length // size)
+    elif count is not None:
+        # Never return empty chunks, even if we are asked for more chunks than there
+        # are frames.
+        chunk_count = min(count, length)
+
+    if size is not None and align is not None:
+        return _iter_aligned_size_bounds(start, end, size, align)
+
+    return _iter_chunk_bounds(start, end, chunk_count, size, align)
+
+
+def _validate_chunk_args(
+    *,
+    size: Optional[int],
+    count: Optional[int],
+    align: Optional[int],
+) -> None:
+    """_validate_chunk_args validates the arguments to :func:`Range.chunks`."""
+    if size is None and count is None:
+        raise ValueError("one of size or count must be set")
+    if size is not None and count is not None:
+        raise ValueError("only one of size or count may be set")
+    if size is not None and size < 1:
+        raise ValueError(f"chunk size must be at least 1, got {size}")
+    if count is not None and count < 1:
+        raise ValueError(f"chunk count must be at least 1, got {count}")
+    if align is not None and align < 1:
+        raise ValueError(f"chunk align must be at least 1, got {align}")
+
+
+def _iter_chunk_bounds(
+    start: int,
+    end: int,
+    chunk_count: int,
+    size: Optional[int],
+    align: Optional[int],
+) -> Iterator[Tuple[int, int]]:
+    """_iter_chunk_bounds lazily yields the bounds calculated by _chunk_bounds."""
+    length = end - start
+    chunk_in = start
+
+    for i in range(1, chunk_count + 1):
+        if i == chunk_count:
+            chunk_out = end
+        elif size is not None:
+            chunk_out = start + i * size
+        else:
+            chunk_out = start + i * length // chunk_count
+
+        if align is not None and chunk_out != end:
+            chunk_out -= chunk_out % align
+
+        # Alignment can collapse a boundary onto the previous one.
+        if chunk_out <= chunk_in:
+            continue
+
+        yield chunk_in, chunk_out
+        chunk_in = chunk_out
+
+
+def _iter_aligned_size_bounds(
+    start: int, end: int, size: int, align: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    _iter_aligned_size_bounds lazily yields the bounds of chunks of about size frames,
+    with each boundary between chunks on a frame count divisible by align. Each
+    boundary is placed from the previous one, so rounding does not build up into the
+    final chunk.
+    """
+    chunk_in = start
+
+    while chunk_in < end:
+        # Round to the nearest aligned frame, with halfway cases rounded down.
+        chunk_out = (chunk_in + size + (align - 1) // 2) // align * align
+        # Chunks shorter than the alignment end at the next aligned frame instead.
+        if chunk_out <= chunk_in:
+            chunk_out = (chunk_in // align + 1) * align
+
+        if chunk_in + size >= end or chunk_out > end:
+            chunk_out = end
+
+        yield chunk_in, chunk_out
+        chunk_in = chunk_out
@@ -0,0 +1,63 @@
+import os
+import struct
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+# Chunk ids of the RIFF and RF64 (> 4 GiB) WAVE container headers.
+_RIFF_IDS = (b"RIFF", b"RF64")
+
+# Chunk sizes of RF64 files that are too large for 32 bits are set to this value, and
+# the real size is stored in the ds64 chunk.
+_RF64_SIZE_PLACEHOLDER = 0xFFFFFFFF
+
+# The ds64 chunk field layout we need: riff size, then data size.
+_DS64_STRUCT = struct.Struct("<QQ")
+
+_CHUNK_HEADER_STRUCT = struct.Struct("<4sI")
+
+
+def _iter_chunks(file: BinaryIO, path: str) -> Iterator[Tuple[bytes, int]]:
+    """
+    _iter_chunks walks the chunks of an open RIFF or RF64 WAVE file, yielding the id and
+    body size of each with the file positioned at the start of its body. Chunk bodies
+    may be read or not; each following chunk is found with a seek.
+
+    The ds64 chunk of RF64 files is read here, so the real size of a data chunk too
+    large for 32 bits is yielded in place of its placeholder size.
+
+    :raises ValueError: If the file is not a WAVE file, or has a truncated ds64 chunk.
+    """
+    header = file.read(12)
+    if len(header) < 12 or header[:4] not in _RIFF_IDS or header[8:] != b"WAVE":
+        raise ValueError(f"{path} is not a RIFF WAVE file")
+
+    data_size: Optional[int] = None
+
+    while True:
+        chunk_header = file.read(_CHUNK_HEADER_STRUCT.size)
+        if len(chunk_header) < _CHUNK_HEADER_STRUCT.size:
+            return
+
+        chunk_id, size = _CHUNK_HEADER_STRUCT.unpack(chunk_header)
+        body_start = file.tell()
+
+        if chunk_id == b"ds64":
+            body = _read_body(file, size, _DS64_STRUCT.size, path)
+            _, data_size = _DS64_STRUCT.unpack_from(body)
+        elif chunk_id == b"data" and size == _RF64_SIZE_PLACEHOLDER and data_size:
+            size = data_size
+
+        yield chunk_id, size
+
+        # Chunks are padded to an even number of bytes.
+        file.seek(body_start + size + size % 2, os.SEEK_SET)
+
+
+def _read_body(file: BinaryIO, size: int, needed: int, path: str) -> bytes:
+    """
+    _read_body reads the start of a chunk body, which must be at least needed bytes
+    long.
+    """
+    body = file.read(needed)
+    if size < needed or len(body) < needed:
+        raise ValueError(f"{path} has a truncated chunk")
+    return body
@@ -0,0 +1,53 @@
+import fractions
+from typing import Tuple, Type, Union
+
+from ._time_int import _TimeInt
+
+SampleRateSource = Union[int, fractions.Fraction]
+"""
+SampleRateSource is the types an audio sample rate can be given as. Pull-down rates
+that are not a whole number of samples per second, like 48000 * 1000/1001, can be
+given as a :class:`fractions.Fraction`.
+"""
+
+
+class Samples(_TimeInt):
+
+    """
+    Samples signals than an int value represents a count of audio samples at a given
+    sample rate, and can be used to wrap ints for parsing tc and doing mathematical
+    operations. The results of mathematical operations keep the sample rate of the left
+    operand.
+    """
+
+    _sample_rate: fractions.Fraction
+
+    def __new__(cls, value: int, sample_rate: SampleRateSource) -> "Samples":
+        """
+        Creates a new sample count.
+
+        :param value: The number of samples.
+
+        :param sample_rate: The number of samples in a second.
+
+        :raises ValueError: If ``sample_rate`` is not a positive value.
+        """
+        sample_rate = fractions.Fraction(sample_rate)
+        if sample_rate <= 0:
+            raise ValueError(f"sample rate must be positive, got {sample_rate}")
+
+        samples = super().__new__(cls, value)
+        samples._sample_rate = sample_rate
+        return samples
+
+    def _with_value(self, value: int) -> "Samples":
+        return Samples(value, self._sample_rate)
+
+    def __reduce__(self) -> Tuple[Type["Samples"], Tuple[int, fractions.Fraction]]:
+        """__reduce__ passes the sample rate on when copying or pickling."""
+        return Samples, (int(self), self._sample_rate)
+
+    @property
+    def sample_rate(self) -> fractions.Fraction:
+        """The number of samples in a second."""
+        return self._sample_rate
@@ -0,0 +1,100 @@
+from typing import Tuple, TypeVar, Union
+
+_T = TypeVar("_T", bound="_TimeInt")
+
+
+class _TimeInt(int):
+    """
+    _TimeInt is the base for int types that signal which unit of time an int value is
+    in, like :class:`PremiereTicks`, so they can be used to wrap ints for parsing tc
+    and doing mathematical operations.
+    """
+
+    def _with_value(self: _T, value: int) -> _T:
+        """
+        _with_value returns a new value of this type. Subclasses that carry extra
+        information alongside the int should override this to pass it on.
+        """
+        return self.__class__(value)
+
+    # We need to override all of the mathematical magic methods or math operations,
+    # even on two instances of the same type, will return a generic int.
+    def __add__(self: _T, other: Union[_T, int]) -> _T:
+        """__add__ applies the int operation then casts to the correct type."""
+        res = super().__add__(other)
+        return self._with_value(res)
+
+    def __radd__(self: _T, other: Union[_T, int]) -> _T:
+        """__radd__ applies the int operation then casts to the correct type."""
+        res = super().__radd__(other)
+        return self._with_value(res)
+
+    def __sub__(self: _T, other: Union[_T, int]) -> _T:
+        """__sub__ applies the int operation then casts to the correct type."""
+        res = super().__sub__(other)
+        return self._with_value(res)
+
+    def __rsub__(self: _T, other: Union[_T, int]) -> _T:
+        """__rsub__ applies the int operation then casts to the correct type."""
+        res = super().__rsub__(other)
+        return self._with_value(res)
+
+    def __mul__(self: _T, other: Union[_T, int]) -> _T:
+        """__mul__ applies the int operation then casts to the correct type."""
+        res = super().__mul__(other)
+        return self._with_value(res)
+
+    def __rmul__(self: _T, other: Union[_T, int]) -> _T:
+        """__rmul__ applies the int operation then casts to the correct type."""
+        res = super().__rmul__(other)
+        return self._with_value(res)
+
+    def __floordiv__(self: _T, other: Union[_T, int]) -> _T:
+        """__floordiv__ applies the int operation then casts to the correct type."""
+        res = super().__floordiv__(other)
+        return self._with_value(res)
+
+    def __rfloordiv__(self: _T, other: Union[_T, int]) -> _T:
+        """__rfloordiv__ applies the int operation then casts to the correct type."""
+        res = super().__rfloordiv__(other)
+        return self._with_value(res)
+
+    def __mod__(self: _T, other: Union[_T, int]) -> _T:
+        """__mod__ applies the int operation then casts to the correct type."""
+        res = super().__mod__(other)
+        return self._with_value(res)
+
+    def __rmod__(self: _T, other: Union[_T, int]) -> _T:
+        """__rmod__ applies the int operation then casts to the correct type."""
+        res = super().__rmod__(other)
+        return self._with_value(res)
+
+    def __divmod__(self: _T, other: Union[_T, int]) -> Tuple[_T, _T]:
+        """__divmod__ applies the int operation then casts to the correct type."""
+        res = super().__divmod__(other)
+        return self._with_value(res[0]), self._with_value(res[1])
+
+    def __rdivmod__(self: _T, other: Union[_T, int]) -> Tuple[_T, _T]:
+        """__rdivmod__ applies the int operation then casts to the correct type."""
+        res = super().__rdivmod__(other)
+        return self._with_value(res[0]), self._with_value(res[1])
+
+    def __floor__(self: _T) -> _T:
+        """__floor__ applies the int operation then casts to the correct type."""
+        res = super().__floor__()
+        return self._with_value(res)
+
+    def __ceil__(self: _T) -> _T:
+        """__ceil__ applies the int operation then casts to the correct type."""
+        res = super().__ceil__()
+        return self._with_value(res)
+
+    def __neg__(self: _T) -> _T:
+        """__neg__ applies the int operation then casts to the correct type."""
+        res = super().__neg__()
+        return self._with_value(res)
+
+    def __abs__(self: _T) -> _T:
+        """__abs__ applies the int operation then casts to the correct type."""
+        res = super().__abs__()
+        return self._with_value(res)
@@ -1,17 +1,27 @@
 import decimal
 import fractions
-from typing import Union, Tuple, Optional
+from typing import Union, Tuple, Optional, Iterable, Iterator
 
 from ._framerate import Framerate, FramerateSource
 from ._premiere_ticks import PremiereTicks
+from ._flicks import Flicks
+from ._pts import PTS
+from ._samples import Samples, SampleRateSource
 from ._consts import (
     _PPRO_TICKS_PER_SECOND,
+    _FLICKS_PER_SECOND,
+    _PTS_TICKS_PER_SECOND,
     _FRAMES_PER_FOOT,
     _SECONDS_PER_MINUTE,
     _SECONDS_PER_HOUR,
 )
 from ._timecode_sections import TimecodeSections
-from ._timecode_parsers import _TimecodeParseSource, _parse, _rational_to_frames
+from ._timecode_parsers import (
+    _TimecodeParseSource,
+    _parse,
+    _parse_int,
+    _rational_to_frames,
+)
 from ._timecode_dropframe import _frame_num_to_drop_frame_num
 
 
@@ -51,6 +61,12 @@ class Timecode:
 
             - ``vtc.PremiereTicks``: Adobe Premiere Pro ticks value.
 
+            - ``vtc.Flicks``: flicks value.
+
+            - ``vtc.PTS``: 90 kHz MPEG presentation timestamp.
+
+            - ``vtc.Samples``: audio sample count at the sample rate of the value.
+
         :param rate: The framerate to use for this timecode. May be any value which
             can be passed to the constructor of :class:`Framerate` or a
             :class:`Framerate`. May only be ``None`` if ``src`` is  a :class:`Framerate`
@@ -80,6 +96,18 @@ class Timecode:
         self._rate: Framerate = Framerate(rate)
         self._value: fractions.Fraction = _parse(src, self._rate)
 
+    @classmethod
+    def _from_frames(cls, frames: int, rate: Framerate) -> "Timecode":
+        """
+        _from_frames builds a timecode from a frame count and an already-parsed
+        Framerate, skipping the source parsing and rate re-construction done by the
+        public constructor.
+        """
+        timecode = cls.__new__(cls)
+        timecode._rate = rate
+        timecode._value = _parse_int(frames, rate)
+        return timecode
+
     def __repr__(self) -> str:
         """__repr__ prints a timecode as [01:00:00:00 @ [23.98 NTSC]]"""
         return f"[{self.timecode} @ {repr(self._rate)}]"
@@ -287,6 +315,80 @@ class Timecode:
         """
         return PremiereTicks(round(self._value * _PPRO_TICKS_PER_SECOND))
 
+    @property
+    def flicks(self) -> Flicks:
+        """
+        flicks returns the number of elapsed flicks this timecode represents.
+
+        A second contains 705600000 flicks, regardless of framerate. A flick divides
+        evenly into a frame at all common framerates, including NTSC, which makes it
+        useful as an exact integer time base when exchanging timing with other tools.
+
+        Values at unusual framerates are rounded to the nearest flick.
+        """
+        return Flicks(round(self._value * _FLICKS_PER_SECOND))
+
+    @property
+    def pts(self) -> PTS:
+        """
+        pts returns the number of elapsed ticks of the 90 kHz MPEG system clock this
+        timecode represents, as used for presentation timestamps in transport streams
+        and MP4 files.
+
+        The value is not wrapped to 33 bits like the timestamps in a stream. See
+        :func:`vtc.convert.frames_to_pts` for converting many frames at once with
+        wraparound.
+
+        Values that do not fall on a tick, like most frames at 23.98, are rounded to
+        the nearest tick.
+        """
+        return PTS(round(self._value * _PTS_TICKS_PER_SECOND))
+
+    def samples(self, sample_rate: SampleRateSource) -> Samples:
+        """
+        samples returns the number of elapsed audio samples this timecode represents at
+        a sample rate.
+
+        Values that do not fall on a sample, like frames at pull-down sample rates, are
+        rounded to the nearest sample.
+
+        :param sample_rate: The number of samples in a second. Pull-down rates that are
+            not a whole number of samples per second, like 48000 * 1000/1001, can be
+            given as a :class:`fractions.Fraction`.
+
+        :returns: The sample count, which carries ``sample_rate``.
+
+        :raises ValueError: If ``sample_rate`` is not a positive value.
+        """
+        sample_rate = fractions.Fraction(sample_rate)
+        return Samples(round(self._value * sample_rate), sample_rate)
+
+    @property
+    def time_key(self) -> int:
+        """
+        time_key returns an exact integer representation of the rational time of this
+        timecode, for use as a sort, dict or index key across timecodes of differing
+        framerates without the overhead of comparing :func:`Timecode.rational` values.
+
+        Ordering and equality of time keys always match that of rational time, and
+        therefore of timecodes themselves. Unlike :func:`Timecode.frames`, time keys of
+        timecodes with differing framerates can be mixed.
+
+        The key is the elapsed time in flicks (705600000 per second). A flick divides
+        evenly into a frame at all common framerates, including NTSC and drop-frame.
+
+        :raises ValueError: If this timecode does not fall on a whole number of flicks,
+            which is only possible for unusual framerates.
+        """
+        value = self._value
+        key, remainder = divmod(value.numerator * _FLICKS_PER_SECOND, value.denominator)
+        if remainder:
+            raise ValueError(
+                f"time key of {repr(self)} is not a whole number of flicks",
+            )
+
+        return key
+
     def runtime(self, precision: Optional[int] = 9) -> str:
         """
         Runtime returns the true runtime of the timecode in HH:MM:SS.FFFFFFFFF format.
@@ -357,6 +459,32 @@ def _coerce_other(other: TimecodeSource, this_rate: Framerate) -> Timecode:
     return Timecode(other, rate=this_rate)
 
 
+def _frame_positions(
+    values: Iterable[TimecodeSource],
+    rate: Framerate,
+) -> Iterator[Union[int, fractions.Fraction]]:
+    """
+    _frame_positions converts each value to its position on the frame count timeline
+    of rate, for comparing many values against frame counts without building a
+    Timecode for each one.
+
+    Plain ints are frame counts and are passed through as-is. Timecodes of another
+    framerate are not rounded to a frame of rate: their exact fractional position is
+    returned so comparisons match rational-time comparisons between Timecodes.
+    """
+    for value in values:
+        # Check the exact type so int subclasses like PremiereTicks are still parsed.
+        if type(value) is int:
+            yield value
+        elif isinstance(value, Timecode):
+            if value._rate is rate or value._rate == rate:
+                yield value.frames
+            else:
+                yield value._value * rate.playback
+        else:
+            yield _rational_to_frames(_parse(value, rate), rate)
+
+
 # Tuple to be used for type checking whether something can be cast to a timecode.
 TimecodeSourceTypes = (
     str,
@@ -365,5 +493,8 @@ TimecodeSourceTypes = (
     fractions.Fraction,
     decimal.Decimal,
     PremiereTicks,
+    Flicks,
+    PTS,
+    Samples,
     Timecode,
 )
@@ -1,9 +1,27 @@
 import fractions
+from typing import Any
 
 from ._framerate import Framerate
 from ._timecode_sections import TimecodeSections
 
 
+def _drop_frames(timebase: Any) -> int:
+    """
+    _drop_frames returns the number of frame numbers drop-frame timecode skips at the
+    start of each minute not divisible by 10, like 2 for 29.97 or 4 for 59.94.
+    """
+    return round(timebase * 0.066666)
+
+
+def _dropped_frames(total_minutes: Any, drop_frames: int) -> Any:
+    """
+    _dropped_frames returns the number of frame numbers drop-frame timecode has skipped
+    before the start of a minute, counting minutes from 00:00. Works on both ints and
+    NumPy integer arrays of minutes.
+    """
+    return drop_frames * (total_minutes - total_minutes // 10)
+
+
 def _parse_drop_frame_adjustment(
     sections: TimecodeSections,
     rate: Framerate,
@@ -14,12 +32,11 @@ def _parse_drop_frame_adjustment(
     Algorithm adapted from:
     https://www.davidheidelberger.com/2010/06/10/drop-frame-timecode/
     """
-    timebase = rate.timebase
-    drop_frames = round(timebase * 0.066666)
+    drop_frames = _drop_frames(rate.timebase)
 
     # We have a bad frame value if our 'frames' place is less than the drop_frames we
-    # skip on minutes not divisible by 10.
-    has_bad_frame = sections.frames < drop_frames
+    # skip at the start of minutes not divisible by 10.
+    has_bad_frame = sections.seconds == 0 and sections.frames < drop_frames
     is_tenth_minute = sections.minutes % 10 == 0 or sections.minutes == 0
     if has_bad_frame and not is_tenth_minute:
         raise ValueError(
@@ -28,7 +45,7 @@ def _parse_drop_frame_adjustment(
         )
 
     total_minutes = 60 * sections.hours + sections.minutes
-    adjustment = drop_frames * (total_minutes - total_minutes // 10)
+    adjustment = _dropped_frames(total_minutes, drop_frames)
 
     return -fractions.Fraction(adjustment, 1)
 
@@ -53,7 +70,7 @@ def _frame_num_to_drop_frame_num(
     # Get the number frames-per-minute at the whole-frame rate
     frames_per_minute_whole = timebase * 60
     # Get the number of frames we need to drop each time we drop frames (ex: 2 or 29.97)
-    drop_frames = round(timebase * 0.066666)
+    drop_frames = _drop_frames(timebase)
 
     # Get the number of frames are in a minute where we have dropped frames at the
     # beginning
@@ -77,7 +94,7 @@ def _frame_num_to_drop_frame_num(
 
     # Remove the first full minute (we don't drop until the next minute) and add the
     # drop-rate to the adjustment.
-    frames -= timebase
+    frames -= frames_per_minute_whole
     adjustment += drop_frames
 
     # Get the number of remaining drop-minutes present, and add a drop adjustment for
@@ -5,6 +5,9 @@ from typing import Union, List
 
 from ._framerate import Framerate
 from ._premiere_ticks import PremiereTicks
+from ._flicks import Flicks
+from ._pts import PTS
+from ._samples import Samples
 from ._timecode_sections import TimecodeSections
 from ._timecode_dropframe import _parse_drop_frame_adjustment
 from ._consts import (
@@ -15,6 +18,8 @@ from ._consts import (
     _SECONDS_PER_HOUR,
     _FRAMES_PER_FOOT,
     _PPRO_TICKS_PER_SECOND,
+    _FLICKS_PER_SECOND,
+    _PTS_TICKS_PER_SECOND,
 )
 
 
@@ -26,6 +31,9 @@ _TimecodeParseSource = Union[
     fractions.Fraction,
     decimal.Decimal,
     PremiereTicks,
+    Flicks,
+    PTS,
+    Samples,
 ]
 
 
@@ -33,9 +41,16 @@ def _parse(src: _TimecodeParseSource, rate: Framerate) -> fractions.Fraction:
     """_parse converts an input value and rate into rational time."""
     if isinstance(src, str):
         return _parse_str(src, rate)
-    # Premiere ticks check needs to come before int since it inherits int.
+    # Premiere ticks, flicks, PTS and samples checks need to come before int since they
+    # inherit int.
     elif isinstance(src, PremiereTicks):
         return _parse_premiere_ticks(src, rate)
+    elif isinstance(src, Flicks):
+        return _parse_flicks(src, rate)
+    elif isinstance(src, PTS):
+        return _parse_pts(src, rate)
+    elif isinstance(src, Samples):
+        return _parse_samples(src, rate)
     elif isinstance(src, int):
         return _parse_int(src, rate)
     elif isinstance(src, float):
@@ -223,6 +238,21 @@ def _parse_premiere_ticks(ticks: PremiereTicks, rate: Framerate) -> fractions.Fr
     return _parse_fraction(seconds, rate)
 
 
+def _parse_flicks(flicks: Flicks, rate: Framerate) -> fractions.Fraction:
+    seconds = fractions.Fraction(flicks, _FLICKS_PER_SECOND)
+    return _parse_fraction(seconds, rate)
+
+
+def _parse_pts(pts: PTS, rate: Framerate) -> fractions.Fraction:
+    seconds = fractions.Fraction(pts, _PTS_TICKS_PER_SECOND)
+    return _parse_fraction(seconds, rate)
+
+
+def _parse_samples(samples: Samples, rate: Framerate) -> fractions.Fraction:
+    seconds = int(samples) / samples.sample_rate
+    return _parse_fraction(seconds, rate)
+
+
 def _rational_to_frames(seconds: fractions.Fraction, rate: Framerate) -> int:
     """_rational_to_frames converts rational seconds to a frame count."""
     # multiply the fraction to frames.
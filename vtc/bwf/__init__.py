@@ -0,0 +1,7 @@
+"""
+The bwf module reads start timecodes from the bext chunk of Broadcast WAV files without
+reading their audio data.
+"""
+
+from ._read import BWFInfo, read, start_timecode  # noqa
+from ._scan import scan  # noqa
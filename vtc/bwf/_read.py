@@ -0,0 +1,107 @@
+import os
+import struct
+from typing import BinaryIO, NamedTuple, Optional, Union
+
+from .._framerate import FramerateSource
+from .._riff import _iter_chunks, _read_body
+from .._samples import Samples
+from .._timecode import Timecode
+
+# The fmt chunk field layout we need: format tag, channel count, sample rate.
+_FMT_STRUCT = struct.Struct("<HHI")
+
+# The bext chunk stores the 64-bit TimeReference after the description, originator,
+# originator reference, origination date and origination time fields.
+_BEXT_TIME_REFERENCE_OFFSET = 256 + 32 + 32 + 10 + 8
+_BEXT_TIME_REFERENCE_STRUCT = struct.Struct("<Q")
+
+
+class BWFInfo(NamedTuple):
+    """
+    BWFInfo holds the timing information read from a Broadcast WAV file header by
+    :func:`read`.
+    """
+
+    path: str
+    # The sample rate from the fmt chunk.
+    sample_rate: int
+    # The number of samples since midnight of the first sample, from the bext chunk.
+    time_reference: int
+
+    def timecode(self, rate: FramerateSource) -> Timecode:
+        """
+        Returns the start timecode of the file.
+
+        :param rate: The framerate of the timecode. May be any value which can be passed
+            to the constructor of :class:`vtc.Framerate`.
+
+        :returns: The time reference as a :class:`vtc.Timecode`, rounded to the nearest
+            frame.
+        """
+        return Timecode(Samples(self.time_reference, self.sample_rate), rate=rate)
+
+
+def read(path: Union[str, "os.PathLike[str]"]) -> BWFInfo:
+    """
+    Reads the sample rate and bext chunk time reference of a Broadcast WAV file.
+
+    Only the RIFF chunk headers and the fmt and bext chunks are read. Every other chunk,
+    including the audio data, is skipped with a seek, so reading is fast regardless of
+    file size. RF64 files are supported.
+
+    :param path: The path of the file to read.
+
+    :returns: The timing information of the file.
+
+    :raises ValueError: If the file is not a WAVE file, or is missing its fmt or bext
+        chunk.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as file:
+        return _read_file(file, path)
+
+
+def start_timecode(
+    path: Union[str, "os.PathLike[str]"], *, rate: FramerateSource
+) -> Timecode:
+    """
+    Reads the start timecode of a Broadcast WAV file from its bext chunk time reference.
+    Shorthand for ``vtc.bwf.read(path).timecode(rate)``.
+
+    :param path: The path of the file to read.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :returns: The start timecode of the file.
+
+    :raises ValueError: If the file is not a WAVE file, or is missing its fmt or bext
+        chunk.
+    """
+    return read(path).timecode(rate)
+
+
+def _read_file(file: BinaryIO, path: str) -> BWFInfo:
+    """_read_file walks the chunks of an open file until fmt and bext are found."""
+    sample_rate: Optional[int] = None
+    time_reference: Optional[int] = None
+
+    for chunk_id, size in _iter_chunks(file, path):
+        if chunk_id == b"fmt ":
+            body = _read_body(file, size, _FMT_STRUCT.size, path)
+            _, _, sample_rate = _FMT_STRUCT.unpack_from(body)
+        elif chunk_id == b"bext":
+            body = _read_body(file, size, _BEXT_TIME_REFERENCE_OFFSET + 8, path)
+            (time_reference,) = _BEXT_TIME_REFERENCE_STRUCT.unpack_from(
+                body, _BEXT_TIME_REFERENCE_OFFSET
+            )
+
+        if sample_rate is not None and time_reference is not None:
+            break
+
+    if sample_rate is None:
+        raise ValueError(f"{path} has no fmt chunk")
+    if time_reference is None:
+        raise ValueError(f"{path} has no bext chunk")
+
+    return BWFInfo(path=path, sample_rate=sample_rate, time_reference=time_reference)
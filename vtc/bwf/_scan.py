@@ -0,0 +1,70 @@
+import concurrent.futures
+import os
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode
+from ._read import BWFInfo, read
+
+# File extensions that are checked for bext chunks when scanning.
+_EXTENSIONS = (".wav", ".bwf")
+
+
+def scan(
+    directory: Union[str, "os.PathLike[str]"],
+    *,
+    rate: FramerateSource,
+    recursive: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[str, Timecode]]:
+    """
+    Reads the start timecode of every Broadcast WAV file in a directory.
+
+    Reading file headers is bound by I/O rather than CPU, so files are read on a pool of
+    threads. Files with a ``.wav`` or ``.bwf`` extension that are not Broadcast WAV
+    files, like plain WAVs without a bext chunk, are skipped.
+
+    :param directory: The directory to scan.
+
+    :param rate: The framerate of the timecodes. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param recursive: Whether to also scan subdirectories.
+
+    :param max_workers: The number of threads to read files with. Defaults to the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+
+    :returns: An iterator of ``(path, start timecode)`` pairs, sorted by path within
+        each directory.
+
+    :raises OSError: If a directory or file cannot be read.
+    """
+    rate = Framerate(rate)
+    paths = _find_files(os.fspath(directory), recursive)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for info in executor.map(_try_read, paths):
+            if info is not None:
+                yield info.path, info.timecode(rate)
+
+
+def _find_files(directory: str, recursive: bool) -> List[str]:
+    """_find_files lists the paths of all files in directory with a WAVE extension."""
+    paths: List[str] = list()
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda found: found.name):
+            if entry.is_dir():
+                if recursive:
+                    paths.extend(_find_files(entry.path, recursive))
+            elif entry.name.lower().endswith(_EXTENSIONS):
+                paths.append(entry.path)
+
+    return paths
+
+
+def _try_read(path: str) -> Optional[BWFInfo]:
+    """_try_read reads path, returning None if it is not a Broadcast WAV file."""
+    try:
+        return read(path)
+    except ValueError:
+        return None
@@ -0,0 +1,14 @@
+"""
+The convert module contains bulk conversions between frame counts and other integer
+time bases, using only integer arithmetic.
+"""
+
+from ._flicks import flicks_to_frames, frames_to_flicks  # noqa
+from ._pts import pts_to_frames, pts_to_timecodes, frames_to_pts  # noqa
+from ._samples import samples_to_frames, frames_to_samples  # noqa
+from ._time_of_day import (  # noqa
+    datetime_to_timecode,
+    epoch_ns_to_frames,
+    epoch_ns_to_timecode,
+    epoch_ns_to_timecodes,
+)
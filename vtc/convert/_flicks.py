@@ -0,0 +1,52 @@
+from typing import Iterable, Sequence
+
+from .._consts import _FLICKS_PER_SECOND
+from .._framerate import Framerate, FramerateSource
+from ._scale import _scale
+
+
+def flicks_to_frames(values: Iterable[int], *, rate: FramerateSource) -> Sequence[int]:
+    """
+    Converts many flicks values to frame counts at once. This is the bulk version of
+    ``vtc.Timecode(vtc.Flicks(value), rate=rate).frames``, and uses only integer
+    arithmetic rather than building a :class:`vtc.Timecode` for each value.
+
+    :param values: The flicks values to convert. May be a NumPy array of ints.
+
+    :param rate: The framerate to count frames at. May be any value which can be passed
+        to the constructor of :class:`vtc.Framerate`.
+
+    :returns: The frame count of each value, rounded to the nearest frame. When
+        ``values`` is a NumPy array, a NumPy array is returned, otherwise a list.
+    """
+    playback = Framerate(rate).playback
+    return _scale(
+        values,
+        playback.numerator,
+        playback.denominator * _FLICKS_PER_SECOND,
+    )
+
+
+def frames_to_flicks(frames: Iterable[int], *, rate: FramerateSource) -> Sequence[int]:
+    """
+    Converts many frame counts to flicks values at once. This is the bulk version of
+    ``vtc.Timecode(frames, rate=rate).flicks``.
+
+    Frames at all common framerates, including NTSC, are a whole number of flicks, so
+    the result is exact. Values at unusual framerates are rounded to the nearest
+    flick.
+
+    :param frames: The frame counts to convert. May be a NumPy array of ints.
+
+    :param rate: The framerate of the frame counts. May be any value which can be
+        passed to the constructor of :class:`vtc.Framerate`.
+
+    :returns: The flicks value of each frame count. When ``frames`` is a NumPy array, a
+        NumPy array is returned, otherwise a list.
+    """
+    playback = Framerate(rate).playback
+    return _scale(
+        frames,
+        playback.denominator * _FLICKS_PER_SECOND,
+        playback.numerator,
+    )
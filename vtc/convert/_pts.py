@@ -0,0 +1,192 @@
+from typing import Any, Iterable, List, Optional, Sequence
+
+from .. import _compat
+from .._consts import _PTS_TICKS_PER_SECOND, _PTS_WRAP
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode, TimecodeSource
+from ._scale import _scale
+
+# Half of the PTS wrap value. Deltas between neighboring timestamps larger than this
+# are assumed to have crossed a wrap.
+_PTS_HALF_WRAP = _PTS_WRAP // 2
+
+
+def pts_to_frames(
+    values: Iterable[int],
+    *,
+    rate: FramerateSource,
+    start: TimecodeSource = 0,
+    start_pts: Optional[int] = None,
+    wrap: bool = True,
+) -> Sequence[int]:
+    """
+    Converts many 90 kHz MPEG presentation timestamps to frame counts at once, using
+    only integer arithmetic rather than building a :class:`vtc.Timecode` for each
+    value.
+
+    Timestamps in a stream are 33-bit values that wrap back to 0 roughly every 26.5
+    hours. By default, values are unwrapped by assuming each one is less than half of a
+    wrap away from the one before it, so streams that cross a wrap, or that are out of
+    presentation order, count on past it.
+
+    :param values: The timestamps to convert, in stream order. May be a NumPy array of
+        ints.
+
+    :param rate: The framerate to count frames at. May be any value which can be passed
+        to the constructor of :class:`vtc.Framerate`.
+
+    :param start: The timecode of ``start_pts``. May be any value which can be passed
+        to the :class:`vtc.Timecode` constructor. Defaults to frame 0.
+
+    :param start_pts: The timestamp at which ``start`` falls. Defaults to the first
+        value.
+
+    :param wrap: Whether values wrap at 33 bits. If ``False``, values are used as-is.
+
+    :returns: The frame count of each value, rounded to the nearest frame. When
+        ``values`` is a NumPy array, a NumPy array is returned, otherwise a list.
+    """
+    rate = Framerate(rate)
+    start_frames = Timecode(start, rate=rate).frames
+    playback = rate.playback
+
+    elapsed = _elapsed_ticks(values, start_pts, wrap)
+    frames = _scale(
+        elapsed,
+        playback.numerator,
+        playback.denominator * _PTS_TICKS_PER_SECOND,
+    )
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(elapsed, numpy.ndarray):
+        return numpy.add(frames, start_frames)
+
+    return [frame + start_frames for frame in frames]
+
+
+def pts_to_timecodes(
+    values: Iterable[int],
+    *,
+    rate: FramerateSource,
+    start: TimecodeSource = 0,
+    start_pts: Optional[int] = None,
+    wrap: bool = True,
+) -> List[Timecode]:
+    """
+    Converts many 90 kHz MPEG presentation timestamps to timecodes at once. Takes the
+    same arguments as :func:`pts_to_frames`.
+
+    :returns: A list with the timecode of each value.
+    """
+    rate = Framerate(rate)
+    frames: Any = pts_to_frames(
+        values, rate=rate, start=start, start_pts=start_pts, wrap=wrap
+    )
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        frames = frames.ravel().tolist()
+
+    return [Timecode._from_frames(frame, rate) for frame in frames]
+
+
+def frames_to_pts(
+    frames: Iterable[int],
+    *,
+    rate: FramerateSource,
+    start: TimecodeSource = 0,
+    start_pts: int = 0,
+    wrap: bool = True,
+) -> Sequence[int]:
+    """
+    Converts many frame counts to 90 kHz MPEG presentation timestamps at once. This is
+    the inverse of :func:`pts_to_frames`.
+
+    :param frames: The frame counts to convert. May be a NumPy array of ints.
+
+    :param rate: The framerate of the frame counts. May be any value which can be
+        passed to the constructor of :class:`vtc.Framerate`.
+
+    :param start: The timecode that falls at ``start_pts``. May be any value which can
+        be passed to the :class:`vtc.Timecode` constructor. Defaults to frame 0.
+
+    :param start_pts: The timestamp of ``start``.
+
+    :param wrap: Whether to wrap the returned timestamps to 33 bits.
+
+    :returns: The timestamp of each frame, rounded to the nearest tick. When ``frames``
+        is a NumPy array, a NumPy array is returned, otherwise a list.
+    """
+    rate = Framerate(rate)
+    start_frames = Timecode(start, rate=rate).frames
+    playback = rate.playback
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        elapsed: Any = frames - start_frames
+    else:
+        elapsed = [frame - start_frames for frame in frames]
+
+    pts: Any = _scale(
+        elapsed,
+        playback.denominator * _PTS_TICKS_PER_SECOND,
+        playback.numerator,
+    )
+
+    if numpy is not None and isinstance(pts, numpy.ndarray):
+        pts = numpy.add(pts, start_pts)
+        return numpy.mod(pts, _PTS_WRAP) if wrap else pts
+
+    if wrap:
+        return [(value + start_pts) % _PTS_WRAP for value in pts]
+    return [value + start_pts for value in pts]
+
+
+def _elapsed_ticks(
+    values: Iterable[int], start_pts: Optional[int], wrap: bool
+) -> Sequence[int]:
+    """
+    _elapsed_ticks returns the number of ticks elapsed between start_pts and each
+    value, unwrapping values if wrap is set.
+    """
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _elapsed_ticks_array(values, start_pts, wrap)
+
+    elapsed: List[int] = list()
+    previous = start_pts
+    total = 0
+
+    for value in values:
+        if previous is None:
+            previous = value
+
+        delta = value - previous
+        if wrap:
+            delta = (delta + _PTS_HALF_WRAP) % _PTS_WRAP - _PTS_HALF_WRAP
+
+        total += delta
+        elapsed.append(total)
+        previous = value
+
+    return elapsed
+
+
+def _elapsed_ticks_array(values: Any, start_pts: Optional[int], wrap: bool) -> Any:
+    """_elapsed_ticks_array is the NumPy implementation of :func:`_elapsed_ticks`."""
+    numpy = _compat.numpy
+
+    if values.dtype.kind not in "iu":
+        elapsed = _elapsed_ticks(values.ravel().tolist(), start_pts, wrap)
+        return numpy.array(elapsed, dtype=numpy.int64).reshape(values.shape)
+
+    flat = values.ravel().astype(numpy.int64)
+    if not flat.size:
+        return flat.reshape(values.shape)
+
+    first = flat[0] if start_pts is None else start_pts
+    deltas = numpy.diff(flat, prepend=numpy.int64(first))
+    if wrap:
+        deltas = (deltas + _PTS_HALF_WRAP) % _PTS_WRAP - _PTS_HALF_WRAP
+
+    return numpy.cumsum(deltas).reshape(values.shape)
@@ -0,0 +1,92 @@
+import fractions
+import functools
+from typing import Iterable, Sequence, Tuple
+
+from .._framerate import Framerate, FramerateSource
+from .._samples import SampleRateSource
+from ._scale import _scale
+
+
+def samples_to_frames(
+    values: Iterable[int],
+    *,
+    rate: FramerateSource,
+    sample_rate: SampleRateSource,
+    rounding: str = "nearest",
+) -> Sequence[int]:
+    """
+    Converts many audio sample positions to frame counts at once. This is the bulk
+    version of ``vtc.Timecode(vtc.Samples(value, sample_rate), rate=rate).frames``,
+    and uses only integer arithmetic rather than building a :class:`vtc.Timecode` for
+    each value.
+
+    :param values: The sample positions to convert. May be a NumPy array of ints.
+
+    :param rate: The framerate to count frames at. May be any value which can be passed
+        to the constructor of :class:`vtc.Framerate`.
+
+    :param sample_rate: The number of samples in a second. Pull-down rates that are not
+        a whole number of samples per second, like 48000 * 1000/1001, can be given as a
+        :class:`fractions.Fraction`.
+
+    :param rounding: How to round positions that fall between frames. ``'nearest'``
+        rounds to the nearest frame, ``'floor'`` to the frame the sample falls within,
+        and ``'ceil'`` to the first frame starting at or after the sample.
+
+    :returns: The frame count of each value. When ``values`` is a NumPy array, a NumPy
+        array is returned, otherwise a list.
+
+    :raises ValueError: If ``sample_rate`` is not a positive value, or ``rounding`` is
+        not a known mode.
+    """
+    numerator, denominator = _frames_per_sample(Framerate(rate).playback, sample_rate)
+    return _scale(values, numerator, denominator, rounding)
+
+
+def frames_to_samples(
+    frames: Iterable[int],
+    *,
+    rate: FramerateSource,
+    sample_rate: SampleRateSource,
+    rounding: str = "nearest",
+) -> Sequence[int]:
+    """
+    Converts many frame counts to audio sample positions at once. This is the bulk
+    version of ``vtc.Timecode(frames, rate=rate).samples(sample_rate)``.
+
+    :param frames: The frame counts to convert. May be a NumPy array of ints.
+
+    :param rate: The framerate of the frame counts. May be any value which can be
+        passed to the constructor of :class:`vtc.Framerate`.
+
+    :param sample_rate: The number of samples in a second. See
+        :func:`samples_to_frames`.
+
+    :param rounding: How to round frames that do not start on a sample. One of
+        ``'nearest'``, ``'floor'`` or ``'ceil'``.
+
+    :returns: The sample position of each frame. When ``frames`` is a NumPy array, a
+        NumPy array is returned, otherwise a list.
+
+    :raises ValueError: If ``sample_rate`` is not a positive value, or ``rounding`` is
+        not a known mode.
+    """
+    numerator, denominator = _frames_per_sample(Framerate(rate).playback, sample_rate)
+    return _scale(frames, denominator, numerator, rounding)
+
+
+@functools.lru_cache(maxsize=64)
+def _frames_per_sample(
+    playback: fractions.Fraction, sample_rate: SampleRateSource
+) -> Tuple[int, int]:
+    """
+    _frames_per_sample returns the reduced integer ratio of frames per sample for a
+    playback rate and sample rate. Ratios are cached, as the same few pairs of rates
+    are used over and over.
+    """
+    sample_rate = fractions.Fraction(sample_rate)
+    if sample_rate <= 0:
+        raise ValueError(f"sample rate must be positive, got {sample_rate}")
+
+    ratio = playback / sample_rate
+    return ratio.numerator, ratio.denominator
@@ -0,0 +1,96 @@
+import math
+from typing import Any, Iterable, List, Sequence
+
+from .. import _compat
+
+# The largest magnitude that can be held in a NumPy int64 without overflowing.
+_INT64_MAX = 2**63 - 1
+
+# The rounding modes that can be passed to _scale.
+_ROUNDING_MODES = ("nearest", "floor", "ceil")
+
+
+def _scale(
+    values: Iterable[int],
+    numerator: int,
+    denominator: int,
+    rounding: str = "nearest",
+) -> Sequence[int]:
+    """
+    _scale multiplies every int in values by numerator / denominator using only
+    integer arithmetic, rounding each result to an int.
+
+    Rounding may be "nearest", "floor" or "ceil". For "nearest", half-way values are
+    rounded to the nearest even int, matching python's builtin ``round()``.
+
+    When values is a NumPy integer array and the scaling cannot overflow an int64, the
+    conversion is vectorized and a NumPy array is returned. Otherwise a list of ints is
+    returned.
+
+    :raises ValueError: If rounding is not a known mode.
+    """
+    if rounding not in _ROUNDING_MODES:
+        raise ValueError(
+            f"rounding must be 'nearest', 'floor' or 'ceil', got {repr(rounding)}"
+        )
+
+    divisor = math.gcd(numerator, denominator)
+    numerator //= divisor
+    denominator //= divisor
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _scale_array(values, numerator, denominator, rounding)
+
+    scaled: List[int] = []
+    for value in values:
+        quotient, remainder = divmod(value * numerator, denominator)
+        scaled.append(quotient + _round_up(quotient, remainder, denominator, rounding))
+
+    return scaled
+
+
+def _round_up(quotient: int, remainder: int, denominator: int, rounding: str) -> int:
+    """
+    _round_up returns 1 if a floored quotient should be rounded up under a rounding
+    mode, otherwise 0.
+    """
+    if rounding == "floor" or not remainder:
+        return 0
+    elif rounding == "ceil":
+        return 1
+
+    doubled = remainder * 2
+    return int(doubled > denominator or (doubled == denominator and quotient % 2 == 1))
+
+
+def _scale_array(values: Any, numerator: int, denominator: int, rounding: str) -> Any:
+    """_scale_array is the NumPy implementation of :func:`_scale`."""
+    numpy = _compat.numpy
+
+    largest = int(numpy.abs(values).max()) if values.size else 0
+    if (
+        values.dtype.kind not in "iu"
+        or largest * numerator > _INT64_MAX
+        or denominator * 2 > _INT64_MAX
+    ):
+        # Fall back to python ints, which cannot overflow.
+        scaled = _scale(values.ravel().tolist(), numerator, denominator, rounding)
+        try:
+            return numpy.array(scaled, dtype=numpy.int64).reshape(values.shape)
+        except OverflowError:
+            return numpy.array(scaled, dtype=object).reshape(values.shape)
+
+    quotient, remainder = numpy.divmod(
+        values.astype(numpy.int64) * numerator, denominator
+    )
+
+    if rounding == "ceil":
+        quotient += remainder != 0
+    elif rounding == "nearest":
+        doubled = remainder * 2
+        quotient += (doubled > denominator) | (
+            (doubled == denominator) & (quotient % 2 == 1)
+        )
+
+    return quotient
@@ -0,0 +1,149 @@
+import datetime
+from typing import Any, Iterable, List, Sequence
+
+from .. import _compat
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode
+from ..smpte12m._word import _frames_per_day
+from ._scale import _scale
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86400 * _NS_PER_SECOND
+
+
+def datetime_to_timecode(
+    value: datetime.datetime, *, rate: FramerateSource
+) -> Timecode:
+    """
+    Converts the wall-clock time of a datetime to time-of-day timecode, using only
+    integer arithmetic. See :func:`epoch_ns_to_frames`.
+
+    :param value: The datetime to convert. Aware datetimes are converted at the time of
+        day in their own timezone.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :returns: The timecode of the frame playing at ``value``.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase.
+    """
+    rate = Framerate(rate)
+    seconds = (value.hour * 60 + value.minute) * 60 + value.second
+    time_of_day = seconds * _NS_PER_SECOND + value.microsecond * 1000
+
+    (frames,) = _time_of_day_frames([time_of_day], rate)
+    return Timecode._from_frames(frames, rate)
+
+
+def epoch_ns_to_frames(
+    values: Iterable[int],
+    *,
+    rate: FramerateSource,
+    utc_offset: int = 0,
+    leap_seconds: int = 0,
+) -> Sequence[int]:
+    """
+    Converts many epoch timestamps in nanoseconds to the frame counts of time-of-day
+    timecode at once, using only integer arithmetic rather than going through float
+    seconds or building a :class:`vtc.Timecode` for each value.
+
+    Time-of-day timecode is jammed to 0 at midnight every day, and counts frames at the
+    playback speed of ``rate`` from there. NTSC drop-frame timecode does not quite keep
+    up with the clock, so it reaches its last frame of the day a few frames early, and
+    holds 23:59:59;29 until the daily jam rather than rolling over and running
+    backwards.
+
+    :param values: Nanoseconds since the Unix epoch, or for PTP (SMPTE ST 2059)
+        timestamps, since the PTP epoch in TAI. May be a NumPy array of ints.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param utc_offset: The offset of the local time of day from UTC in seconds, such as
+        the local time offset of an ST 2059-2 synchronization metadata TLV.
+
+    :param leap_seconds: The offset of the timestamps from UTC in seconds. Pass the
+        ``currentUtcOffset`` of the PTP grandmaster, 37 since 2017, for TAI timestamps.
+
+    :returns: The frame count of each value, within a day. When ``values`` is a NumPy
+        array, a NumPy array is returned, otherwise a list.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase.
+    """
+    rate = Framerate(rate)
+    offset = (utc_offset - leap_seconds) * _NS_PER_SECOND
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        local: Any = numpy.mod(values.astype(numpy.int64) + offset, _NS_PER_DAY)
+        return _time_of_day_frames(local, rate)
+
+    return _time_of_day_frames(
+        [(value + offset) % _NS_PER_DAY for value in values], rate
+    )
+
+
+def epoch_ns_to_timecodes(
+    values: Iterable[int],
+    *,
+    rate: FramerateSource,
+    utc_offset: int = 0,
+    leap_seconds: int = 0,
+) -> List[Timecode]:
+    """
+    Converts many epoch timestamps in nanoseconds to time-of-day timecodes at once.
+    Takes the same arguments as :func:`epoch_ns_to_frames`.
+
+    :returns: A list with the timecode of each value.
+    """
+    rate = Framerate(rate)
+    frames: Any = epoch_ns_to_frames(
+        values, rate=rate, utc_offset=utc_offset, leap_seconds=leap_seconds
+    )
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        frames = frames.ravel().tolist()
+
+    return [Timecode._from_frames(frame, rate) for frame in frames]
+
+
+def epoch_ns_to_timecode(
+    value: int,
+    *,
+    rate: FramerateSource,
+    utc_offset: int = 0,
+    leap_seconds: int = 0,
+) -> Timecode:
+    """
+    Converts an epoch timestamp in nanoseconds to time-of-day timecode. Takes the same
+    arguments as :func:`epoch_ns_to_frames`.
+
+    :returns: The timecode of the frame playing at ``value``.
+    """
+    (timecode,) = epoch_ns_to_timecodes(
+        [value], rate=rate, utc_offset=utc_offset, leap_seconds=leap_seconds
+    )
+    return timecode
+
+
+def _time_of_day_frames(values: Any, rate: Framerate) -> Any:
+    """
+    _time_of_day_frames returns the frame playing at each of a list or NumPy array of
+    nanoseconds since midnight, held at the last frame of the day until midnight.
+    """
+    playback = rate.playback
+    frames_per_day = _frames_per_day(rate)
+    frames: Any = _scale(
+        values,
+        playback.numerator,
+        playback.denominator * _NS_PER_SECOND,
+        rounding="floor",
+    )
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        return numpy.minimum(frames, frames_per_day - 1)
+
+    return [min(frame, frames_per_day - 1) for frame in frames]
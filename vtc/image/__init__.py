@@ -0,0 +1,10 @@
+"""
+The image module reads timecodes from the headers of DPX and OpenEXR image sequence
+frames without reading their image data, and finds the frame ranges of image
+sequences on disk.
+"""
+
+from ._header import FrameHeader, read_header, read_headers  # noqa
+from ._words import decode_sections, frames_from_words  # noqa
+from ._continuity import check_continuity, TimecodeBreak  # noqa
+from ._sequence import scan_sequences, ImageSequence  # noqa
@@ -0,0 +1,70 @@
+from typing import List, NamedTuple, Optional, Sequence
+
+from .._framerate import FramerateSource
+from .._timecode import Timecode
+from ._header import FrameHeader, _header_rate
+from ._words import frames_from_words
+
+
+class TimecodeBreak(NamedTuple):
+    """
+    TimecodeBreak is a frame of an image sequence whose timecode does not follow on
+    from the frame before it, as found by :func:`check_continuity`.
+    """
+
+    # The index of the frame in the checked headers.
+    header_index: int
+    header: FrameHeader
+    # The timecode the frame should have had.
+    expected: Timecode
+    # The timecode the frame has.
+    found: Timecode
+
+
+def check_continuity(
+    headers: Sequence[FrameHeader], *, rate: Optional[FramerateSource] = None
+) -> List[TimecodeBreak]:
+    """
+    Checks that the timecodes of a sequence of image headers count up by one frame from
+    each header to the next. All time words are decoded to frame counts in a single
+    batch.
+
+    :param headers: The headers of the sequence, in frame order.
+
+    :param rate: The framerate of the timecodes. Defaults to the framerate of the first
+        header. May be any value which can be passed to the constructor of
+        :class:`vtc.Framerate`.
+
+    :returns: A break for each header whose timecode does not follow on from the header
+        before it. An empty list means the sequence is continuous.
+
+    :raises ValueError: If a header has no timecode, or no rate is passed and the first
+        header has no framerate.
+    """
+    if not headers:
+        return list()
+
+    framerate = _header_rate(headers[0], rate)
+
+    words: List[int] = list()
+    for header in headers:
+        if header.time_word is None:
+            raise ValueError(f"{header.path} has no timecode")
+        words.append(header.time_word)
+
+    frames = frames_from_words(words, rate=framerate)
+
+    breaks: List[TimecodeBreak] = list()
+    for index in range(1, len(frames)):
+        expected = frames[index - 1] + 1
+        if frames[index] != expected:
+            breaks.append(
+                TimecodeBreak(
+                    header_index=index,
+                    header=headers[index],
+                    expected=Timecode._from_frames(expected, framerate),
+                    found=Timecode._from_frames(frames[index], framerate),
+                )
+            )
+
+    return breaks
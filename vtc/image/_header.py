@@ -0,0 +1,290 @@
+import concurrent.futures
+import fractions
+import math
+import os
+import struct
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .._bcd import _sections_to_frames, _unpack_time_word
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode
+from .._timecode_sections import TimecodeSections
+
+# DPX files start with a magic number that also gives the byte order of the header.
+_DPX_MAGIC = {b"SDPX": ">", b"XPDS": "<"}
+
+# Offsets of the DPX header fields we need. The television header holds the vertical
+# sample rate at 1936, just before the frame rate.
+_DPX_FILM_FRAME_RATE_OFFSET = 1724
+_DPX_TV_TIME_CODE_OFFSET = 1920
+_DPX_TV_FRAME_RATE_OFFSET = 1940
+
+# The size of the header up to the end of the television frame rate field.
+_DPX_HEADER_SIZE = 1944
+
+# Unset DPX integer fields have all bits set.
+_DPX_UNSET = 0xFFFFFFFF
+
+_EXR_MAGIC = b"\x76\x2f\x31\x01"
+
+# EXR headers are read in chunks of this size until the end of the header is found.
+_EXR_READ_SIZE = 4096
+
+_EXR_TIMECODE_STRUCT = struct.Struct("<II")
+_EXR_RATIONAL_STRUCT = struct.Struct("<iI")
+
+
+class FrameHeader(NamedTuple):
+    """
+    FrameHeader holds the timecode information of a DPX or OpenEXR image header, as
+    read by :func:`read_header`.
+    """
+
+    path: str
+    # The packed BCD time word, with frames in the lowest byte and hours in the
+    # highest, or None if the header has no timecode.
+    time_word: Optional[int]
+    # The user bits stored alongside the time word, or None if the header has no
+    # timecode.
+    user_bits: Optional[int]
+    # The framerate from the header, or None if the header has no framerate. Whether
+    # the framerate is drop-frame is taken from the time word.
+    rate: Optional[Framerate]
+
+    @property
+    def sections(self) -> Optional[TimecodeSections]:
+        """The decoded sections of the time word, or None if there is no timecode."""
+        if self.time_word is None:
+            return None
+
+        hours, minutes, seconds, frames, _ = _unpack_time_word(self.time_word)
+        return TimecodeSections(
+            negative=False,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            frames=frames,
+        )
+
+    def timecode(self, rate: Optional[FramerateSource] = None) -> Timecode:
+        """
+        Returns the timecode of the header.
+
+        :param rate: The framerate of the timecode. Defaults to the framerate of the
+            header. May be any value which can be passed to the constructor of
+            :class:`vtc.Framerate`.
+
+        :raises ValueError: If the header has no timecode, or no rate is passed and the
+            header has no framerate.
+        """
+        if self.time_word is None:
+            raise ValueError(f"{self.path} has no timecode")
+
+        rate = _header_rate(self, rate)
+        hours, minutes, seconds, frames, _ = _unpack_time_word(self.time_word)
+        return Timecode._from_frames(
+            _sections_to_frames(hours, minutes, seconds, frames, rate), rate
+        )
+
+
+def read_header(path: Union[str, "os.PathLike[str]"]) -> FrameHeader:
+    """
+    Reads the timecode and framerate from the header of a DPX or OpenEXR image. Only
+    the header bytes are read, never the image data.
+
+    For DPX, the timecode and user bits of the television information header are used.
+    The framerate is taken from the television header, falling back to the film
+    header. For OpenEXR, the ``timeCode`` and ``framesPerSecond`` attributes are used.
+
+    :param path: The path of the file to read.
+
+    :returns: The timecode information of the header.
+
+    :raises ValueError: If the file is not a DPX or OpenEXR image, or its header is
+        truncated.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as file:
+        magic = file.read(4)
+        if magic in _DPX_MAGIC:
+            return _read_dpx(file, path, _DPX_MAGIC[magic])
+        elif magic == _EXR_MAGIC:
+            return _read_exr(file, path)
+
+    raise ValueError(f"{path} is not a DPX or OpenEXR image")
+
+
+def read_headers(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    *,
+    max_workers: Optional[int] = None,
+) -> List[FrameHeader]:
+    """
+    Reads the headers of many DPX or OpenEXR images. Reading headers is bound by I/O
+    rather than CPU, so files are read on a pool of threads.
+
+    :param paths: The paths of the files to read.
+
+    :param max_workers: The number of threads to read files with. Defaults to the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+
+    :returns: The header of each file, in the same order as ``paths``.
+
+    :raises ValueError: If a file is not a DPX or OpenEXR image, or its header is
+        truncated.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_header, paths))
+
+
+def _header_rate(header: FrameHeader, rate: Optional[FramerateSource]) -> Framerate:
+    """
+    _header_rate returns rate as a Framerate if set, otherwise the rate of the header.
+    """
+    if rate is not None:
+        return Framerate(rate)
+    elif header.rate is None:
+        raise ValueError(f"{header.path} has no framerate, and none was given")
+    return header.rate
+
+
+def _read_dpx(file: BinaryIO, path: str, byte_order: str) -> FrameHeader:
+    """_read_dpx reads the television and film headers of a DPX file."""
+    file.seek(0)
+    header = file.read(_DPX_HEADER_SIZE)
+    if len(header) < _DPX_HEADER_SIZE:
+        raise ValueError(f"{path} has a truncated header")
+
+    time_word, user_bits = struct.unpack_from(
+        byte_order + "II", header, _DPX_TV_TIME_CODE_OFFSET
+    )
+    (tv_rate,) = struct.unpack_from(byte_order + "f", header, _DPX_TV_FRAME_RATE_OFFSET)
+    (film_rate,) = struct.unpack_from(
+        byte_order + "f", header, _DPX_FILM_FRAME_RATE_OFFSET
+    )
+
+    if time_word == _DPX_UNSET:
+        return FrameHeader(path=path, time_word=None, user_bits=None, rate=None)
+
+    playback: Optional[fractions.Fraction] = None
+    for value in (tv_rate, film_rate):
+        if math.isfinite(value) and value > 0:
+            playback = _float_playback(value)
+            break
+
+    return FrameHeader(
+        path=path,
+        time_word=time_word,
+        user_bits=None if user_bits == _DPX_UNSET else user_bits,
+        rate=_word_rate(playback, time_word, path),
+    )
+
+
+def _read_exr(file: BinaryIO, path: str) -> FrameHeader:
+    """
+    _read_exr reads the header attributes of an OpenEXR file until the end of the
+    header.
+    """
+    attributes = _read_exr_attributes(file, path)
+
+    time_word: Optional[int] = None
+    user_bits: Optional[int] = None
+    timecode = attributes.get((b"timeCode", b"timecode"))
+    if timecode is not None and len(timecode) == _EXR_TIMECODE_STRUCT.size:
+        time_word, user_bits = _EXR_TIMECODE_STRUCT.unpack(timecode)
+
+    playback: Optional[fractions.Fraction] = None
+    rational = attributes.get((b"framesPerSecond", b"rational"))
+    if rational is not None and len(rational) == _EXR_RATIONAL_STRUCT.size:
+        numerator, denominator = _EXR_RATIONAL_STRUCT.unpack(rational)
+        if numerator > 0 and denominator > 0:
+            playback = fractions.Fraction(numerator, denominator)
+
+    rate: Optional[Framerate] = None
+    if time_word is not None:
+        rate = _word_rate(playback, time_word, path)
+    elif playback is not None:
+        rate = Framerate(playback)
+
+    return FrameHeader(path=path, time_word=time_word, user_bits=user_bits, rate=rate)
+
+
+def _read_exr_attributes(file: BinaryIO, path: str) -> Dict[Tuple[bytes, bytes], bytes]:
+    """
+    _read_exr_attributes reads the (name, type) and value of every attribute of the
+    first part of an OpenEXR header.
+    """
+    # Skip the version field after the magic number.
+    data = file.read(_EXR_READ_SIZE)
+    position = 4
+    attributes: Dict[Tuple[bytes, bytes], bytes] = dict()
+
+    while True:
+        name_end = data.find(b"\x00", position)
+        type_end = data.find(b"\x00", name_end + 1)
+
+        # The header ends with an empty attribute name.
+        if name_end == position:
+            return attributes
+
+        value_start = type_end + 5
+        if name_end < 0 or type_end < 0 or value_start > len(data):
+            data = _read_more(file, data, path)
+            continue
+
+        (size,) = struct.unpack_from("<i", data, type_end + 1)
+        value_end = value_start + size
+        if value_end > len(data):
+            data = _read_more(file, data, path)
+            continue
+
+        type_start = name_end + 1
+        name = data[position:name_end]
+        attribute_type = data[type_start:type_end]
+        attributes[(name, attribute_type)] = data[value_start:value_end]
+        position = value_end
+
+
+def _read_more(file: BinaryIO, data: bytes, path: str) -> bytes:
+    """_read_more extends data with the next chunk of the file."""
+    more = file.read(_EXR_READ_SIZE)
+    if not more:
+        raise ValueError(f"{path} has a truncated header")
+    return data + more
+
+
+def _float_playback(value: float) -> fractions.Fraction:
+    """
+    _float_playback converts a float frame rate from a DPX header to a rational value,
+    detecting NTSC rates like 23.976 and 29.97.
+    """
+    whole = round(value)
+    ntsc = fractions.Fraction(whole * 1000, 1001)
+    if whole != value and abs(value - ntsc) < 0.005:
+        return ntsc
+    return fractions.Fraction(value).limit_denominator(1001)
+
+
+def _word_rate(
+    playback: Optional[fractions.Fraction], time_word: int, path: str
+) -> Optional[Framerate]:
+    """
+    _word_rate builds the framerate of a header from its playback rate and the
+    drop-frame flag of its time word.
+    """
+    if playback is None:
+        return None
+
+    if not _unpack_time_word(time_word)[4]:
+        return Framerate(playback)
+
+    # Drop-frame timecode is always NTSC, so whole-number rates like 30 are taken to
+    # mean 29.97.
+    ntsc_playback = playback
+    if playback.denominator == 1:
+        ntsc_playback = fractions.Fraction(playback.numerator * 1000, 1001)
+
+    try:
+        return Framerate(ntsc_playback, ntsc=True, dropframe=True)
+    except ValueError:
+        raise ValueError(f"{path} has a drop-frame timecode at {float(playback)} fps")
@@ -0,0 +1,163 @@
+import os
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .._framerate import Framerate, FramerateSource
+from .._range import Range
+from .._timecode import Timecode, TimecodeSource
+
+# Splits a file name around its frame number: the last run of digits, optionally
+# followed by a file extension.
+_FRAME_NUMBER_REGEX = re.compile(r"^(.*?)(\d+)(\.[^.]*)?$")
+
+
+class ImageSequence(NamedTuple):
+    """
+    ImageSequence is a numbered sequence of image files in a directory, as found by
+    :func:`scan_sequences`.
+    """
+
+    directory: str
+    # A printf-style pattern of the file names in the sequence, like
+    # ``shot_010.%07d.exr``.
+    pattern: str
+    # The number of files in the sequence.
+    frame_count: int
+    # Each contiguous run of frame numbers, in order.
+    ranges: List[Range]
+    # Each run of missing frame numbers between the first and last file, in order.
+    gaps: List[Range]
+
+    def path(self, frame_number: int) -> str:
+        """
+        Returns the path of the file for a frame number of the sequence.
+
+        :param frame_number: The frame number in the file name.
+        """
+        return os.path.join(self.directory, self.pattern % frame_number)
+
+
+# Files are grouped by directory, the text before the frame number, the number of
+# digits in the frame number and the text after it.
+_SequenceKey = Tuple[str, str, int, str]
+
+
+def scan_sequences(
+    directory: Union[str, "os.PathLike[str]"],
+    *,
+    rate: FramerateSource,
+    offset: TimecodeSource = 0,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = False,
+) -> List[ImageSequence]:
+    """
+    Finds every numbered image sequence in a directory and reports its contiguous runs
+    of frames as ranges.
+
+    Only file names are read, using :func:`os.scandir`, and frame numbers are kept as
+    ints until each run is known, so no :class:`vtc.Timecode` is made per file. The
+    frame number of a file is the last run of digits in its name before the extension.
+    Files are grouped by the number of digits in their frame number, so unpadded
+    numbers like ``shot.9.exr`` and ``shot.10.exr`` are reported as separate
+    sequences.
+
+    :param directory: The directory to scan.
+
+    :param rate: The framerate of the ranges. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param offset: The timecode of frame number 0. Frame number ``n`` is mapped to
+        ``offset`` plus ``n`` frames. May be any value which can be passed to the
+        constructor of :class:`vtc.Timecode`.
+
+    :param extensions: Only files with one of these extensions, like ``".exr"``, are
+        scanned. The check is case-insensitive. Defaults to all files.
+
+    :param recursive: Whether to also scan subdirectories.
+
+    :returns: A list of sequences, sorted by directory and then pattern. The out point
+        of each range is one frame past the last file in the run.
+
+    :raises OSError: If a directory cannot be read.
+    """
+    rate = Framerate(rate)
+    offset_frames = Timecode(offset, rate=rate).frames
+
+    suffixes: Optional[Tuple[str, ...]] = None
+    if extensions is not None:
+        suffixes = tuple(extension.lower() for extension in extensions)
+
+    groups: Dict[_SequenceKey, List[int]] = dict()
+    _group_files(os.fspath(directory), suffixes, recursive, groups)
+
+    return [
+        _build_sequence(key, frame_numbers, offset_frames, rate)
+        for key, frame_numbers in sorted(groups.items())
+    ]
+
+
+def _group_files(
+    directory: str,
+    suffixes: Optional[Tuple[str, ...]],
+    recursive: bool,
+    groups: Dict[_SequenceKey, List[int]],
+) -> None:
+    """_group_files adds the frame number of every numbered file to its group."""
+    subdirectories: List[str] = list()
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirectories.append(entry.path)
+                continue
+
+            name = entry.name
+            if suffixes is not None and not name.lower().endswith(suffixes):
+                continue
+
+            match = _FRAME_NUMBER_REGEX.match(name)
+            if match is None:
+                continue
+
+            head, digits, tail = match.groups()
+            key = (directory, head, len(digits), tail or "")
+            groups.setdefault(key, list()).append(int(digits))
+
+    if recursive:
+        for subdirectory in subdirectories:
+            _group_files(subdirectory, suffixes, recursive, groups)
+
+
+def _build_sequence(
+    key: _SequenceKey, frame_numbers: List[int], offset: int, rate: Framerate
+) -> ImageSequence:
+    """_build_sequence finds the runs and gaps of a group of frame numbers."""
+    directory, head, width, tail = key
+    frame_numbers.sort()
+
+    ranges: List[Range] = list()
+    gaps: List[Range] = list()
+
+    run_in = frame_numbers[0] + offset
+    run_out = run_in
+    for frame_number in frame_numbers:
+        frame = frame_number + offset
+        if frame != run_out:
+            ranges.append(Range._from_frames(run_in, run_out, rate))
+            gaps.append(Range._from_frames(run_out, frame, rate))
+            run_in = frame
+        run_out = frame + 1
+
+    ranges.append(Range._from_frames(run_in, run_out, rate))
+
+    # Escape percent signs in the file name so the pattern can be formatted.
+    head = head.replace("%", "%%")
+    tail = tail.replace("%", "%%")
+
+    return ImageSequence(
+        directory=directory,
+        pattern=f"{head}%0{width}d{tail}",
+        frame_count=len(frame_numbers),
+        ranges=ranges,
+        gaps=gaps,
+    )
@@ -0,0 +1,75 @@
+from typing import Any, Iterable, List, Sequence
+
+from .. import _compat
+from .._bcd import _sections_to_frames, _unpack_time_word
+from .._framerate import Framerate, FramerateSource
+from .._timecode_sections import TimecodeSections
+
+
+def decode_sections(words: Iterable[int]) -> List[TimecodeSections]:
+    """
+    Decodes many packed BCD time words, as stored in DPX and OpenEXR headers, into
+    timecode sections.
+
+    :param words: The 32-bit time words to decode, with frames in the lowest byte and
+        hours in the highest. May be a NumPy array.
+
+    :returns: The sections of each word. Decoded sections are never negative.
+    """
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(words, numpy.ndarray):
+        words = words.ravel().tolist()
+
+    sections: List[TimecodeSections] = list()
+    for word in words:
+        hours, minutes, seconds, frames, _ = _unpack_time_word(word)
+        sections.append(
+            TimecodeSections(
+                negative=False,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+                frames=frames,
+            )
+        )
+
+    return sections
+
+
+def frames_from_words(words: Iterable[int], *, rate: FramerateSource) -> Sequence[int]:
+    """
+    Decodes many packed BCD time words, as stored in DPX and OpenEXR headers, directly
+    into frame counts using integer arithmetic. When ``words`` is a NumPy array, all
+    words are decoded at once without creating a Python object per word.
+
+    :param words: The 32-bit time words to decode, with frames in the lowest byte and
+        hours in the highest. May be a NumPy array.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`. The drop-frame flag of the words is
+        ignored in favor of the framerate.
+
+    :returns: The frame count of each word. When ``words`` is a NumPy array, a NumPy
+        array is returned, otherwise a list.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase.
+    """
+    rate = Framerate(rate)
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(words, numpy.ndarray):
+        return _frames_from_array(words, rate)
+
+    frames: List[int] = list()
+    for word in words:
+        hours, minutes, seconds, frame, _ = _unpack_time_word(word)
+        frames.append(_sections_to_frames(hours, minutes, seconds, frame, rate))
+
+    return frames
+
+
+def _frames_from_array(words: Any, rate: Framerate) -> Any:
+    """_frames_from_array is the NumPy implementation of :func:`frames_from_words`."""
+    numpy = _compat.numpy
+    hours, minutes, seconds, frames, _ = _unpack_time_word(words.astype(numpy.int64))
+    return _sections_to_frames(hours, minutes, seconds, frames, rate)
@@ -0,0 +1,8 @@
+"""
+The ltc module decodes and generates linear timecode (LTC) as PCM audio.
+"""
+
+# "noqa" setting stops flake8 from flagging unused imports in __init__
+
+from ._decode import decode, decode_wav, LTCFrame  # noqa
+from ._encode import encode, encode_wav  # noqa
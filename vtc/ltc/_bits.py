@@ -0,0 +1,25 @@
+import fractions
+
+from .._framerate import Framerate
+from .._samples import SampleRateSource
+
+# Each LTC frame is the 64 bits of an SMPTE 12M word, first bit first, followed by a
+# 16-bit sync word.
+_DATA_BITS = 64
+_SYNC_BITS = (0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1)
+_FRAME_BITS = _DATA_BITS + len(_SYNC_BITS)
+
+
+def _samples_per_bit(
+    rate: Framerate, sample_rate: SampleRateSource
+) -> fractions.Fraction:
+    """
+    _samples_per_bit returns the number of audio samples in each bit of an LTC signal.
+
+    :raises ValueError: If ``sample_rate`` is not a positive value.
+    """
+    sample_rate = fractions.Fraction(sample_rate)
+    if sample_rate <= 0:
+        raise ValueError(f"sample rate must be positive, got {sample_rate}")
+
+    return sample_rate / (rate.playback * _FRAME_BITS)
@@ -0,0 +1,311 @@
+import mmap
+import os
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .. import _compat
+from .._framerate import FramerateSource
+from .._samples import SampleRateSource
+from .._timecode import Timecode
+from ..smpte12m import unpack_frames, unpack_user_bits
+from ..smpte12m._word import _word_rate
+from ._bits import _DATA_BITS, _SYNC_BITS, _samples_per_bit
+from ._wav import _WavFormat, _channel_samples, _read_format
+
+# Samples must swing past this fraction of the peak level, on the other side of zero,
+# to count as a level change, so low-level noise is not read as bits.
+_HYSTERESIS = 0.1
+
+# Intervals between level changes shorter than this many bit periods are half of a 1
+# bit, and intervals up to the long limit are a 0 bit. Longer intervals are not LTC.
+_SHORT_LIMIT = 0.75
+_LONG_LIMIT = 1.5
+
+# Bit value for intervals that are not part of a valid LTC signal.
+_INVALID_BIT = 2
+
+
+class LTCFrame(NamedTuple):
+    """LTCFrame is a frame of LTC decoded by :func:`decode`."""
+
+    timecode: Timecode
+    # The index of the audio sample the frame starts at.
+    sample: int
+    # The 32 user bits of the frame, with the first binary group in the lowest 4 bits.
+    user_bits: int
+
+
+def decode(
+    samples: Iterable[Union[int, float]],
+    *,
+    rate: FramerateSource,
+    sample_rate: SampleRateSource,
+) -> List[LTCFrame]:
+    """
+    Decodes the biphase-mark LTC signal in a channel of PCM audio. When ``samples`` is
+    a NumPy array, level changes are found and classified as bits for the whole signal
+    at once, without a Python loop per sample.
+
+    Frames that are cut off, or that contain dropouts, are skipped. The signal may be
+    played at up to around 30% off speed. Only forwards playback is decoded.
+
+    :param samples: The audio samples of the LTC channel. May be ints or floats, and a
+        NumPy array.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`. The drop-frame flag of the frames is
+        ignored in favor of the framerate.
+
+    :param sample_rate: The number of samples in a second.
+
+    :returns: The decoded frames, in order.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase of 30 frames
+        or less, or ``sample_rate`` is not positive.
+    """
+    rate = _word_rate(rate)
+    samples_per_bit = float(_samples_per_bit(rate, sample_rate))
+
+    numpy = _compat.numpy
+    words: Any
+    positions: Any
+    if numpy is not None and isinstance(samples, numpy.ndarray):
+        bits, starts = _read_bits_array(samples, samples_per_bit)
+        words, positions = _find_words_array(bits, starts)
+    else:
+        bits, starts = _read_bits(list(samples), samples_per_bit)
+        words, positions = _find_words(bits, starts)
+
+    # Frame counts and user bits of NumPy words come back as arrays.
+    frames: Any = unpack_frames(words, rate=rate)
+    user_bits: Any = unpack_user_bits(words)
+    if numpy is not None and isinstance(words, numpy.ndarray):
+        frames = frames.tolist()
+        user_bits = user_bits.tolist()
+        positions = positions.tolist()
+
+    return [
+        LTCFrame(
+            timecode=Timecode._from_frames(frame, rate),
+            sample=sample,
+            user_bits=frame_user_bits,
+        )
+        for frame, sample, frame_user_bits in zip(frames, positions, user_bits)
+    ]
+
+
+def decode_wav(
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    rate: FramerateSource,
+    channel: int = 0,
+) -> List[LTCFrame]:
+    """
+    Decodes the LTC signal in a channel of a WAVE file. The file is memory mapped
+    rather than read, and when NumPy is installed the channel is decoded in place as a
+    NumPy array. See :func:`decode`.
+
+    8, 16, 24 and 32-bit integer and 32 and 64-bit floating-point PCM files are
+    supported, including RF64 files.
+
+    :param path: The path of the file to decode.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param channel: The index of the channel with the LTC signal.
+
+    :returns: The decoded frames, in order.
+
+    :raises ValueError: If the file is not a PCM WAVE file, ``channel`` is not a
+        channel of the file, or ``rate`` does not have a whole-number timebase of 30
+        frames or less.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as file:
+        wav = _read_format(file, path)
+        if wav.data_size == 0:
+            return list()
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Views of the mapped data only live inside _decode_mapped, so the map can be
+        # closed once it returns. If it raises, its traceback still holds them, so the
+        # map is left to close with the traceback rather than replacing the error with
+        # a BufferError.
+        frames = _decode_mapped(mapped, wav, channel, rate)
+        mapped.close()
+
+    return frames
+
+
+def _decode_mapped(
+    mapped: mmap.mmap, wav: _WavFormat, channel: int, rate: FramerateSource
+) -> List[LTCFrame]:
+    """_decode_mapped decodes a channel of a memory mapped WAVE file."""
+    samples = _channel_samples(mapped, wav, channel)
+    return decode(samples, rate=rate, sample_rate=wav.sample_rate)
+
+
+def _read_bits_array(samples: Any, samples_per_bit: float) -> Tuple[Any, Any]:
+    """
+    _read_bits_array is the NumPy implementation of :func:`_read_bits`.
+    """
+    numpy = _compat.numpy
+    empty = numpy.zeros(0, dtype=numpy.int64)
+    if samples.size == 0:
+        return empty.astype(numpy.uint8), empty
+
+    peak = max(float(samples.max()), -float(samples.min()))
+    threshold = peak * _HYSTERESIS
+    above = samples > threshold
+    swings = numpy.flatnonzero(above | (samples < -threshold))
+    if swings.size == 0:
+        return empty.astype(numpy.uint8), empty
+
+    # Keep the samples where the level first swings past the threshold on the other
+    # side of zero. The start and end of the signal also bound its first and last
+    # bits.
+    levels = above[swings]
+    changes = numpy.concatenate(
+        ([swings[0]], swings[1:][levels[1:] != levels[:-1]], [samples.size])
+    )
+
+    starts = changes[:-1]
+    intervals = numpy.diff(changes)
+    short = intervals < samples_per_bit * _SHORT_LIMIT
+
+    # Pair up runs of short intervals, where the first of each pair starts a 1 bit.
+    index = numpy.arange(len(short))
+    run_starts = short & ~numpy.concatenate(([False], short[:-1]))
+    run_start_index = numpy.maximum.accumulate(numpy.where(run_starts, index, 0))
+    first_half = short & ((index - run_start_index) % 2 == 0)
+    next_short = numpy.concatenate((short[1:], [False]))
+
+    bits = short.astype(numpy.uint8)
+    bits[intervals >= samples_per_bit * _LONG_LIMIT] = _INVALID_BIT
+    bits[first_half & ~next_short] = _INVALID_BIT
+
+    keep = ~short | first_half
+    return bits[keep], starts[keep]
+
+
+def _read_bits(
+    samples: List[Union[int, float]], samples_per_bit: float
+) -> Tuple[List[int], List[int]]:
+    """
+    _read_bits reads the bits of a biphase-mark signal from the intervals between its
+    level changes, returning each bit and the index of the sample it starts at. Half-bit
+    intervals that are not paired, and overlong intervals, are read as an invalid bit.
+    """
+    changes = _level_changes(samples)
+    short_limit = samples_per_bit * _SHORT_LIMIT
+    long_limit = samples_per_bit * _LONG_LIMIT
+
+    bits: List[int] = list()
+    starts: List[int] = list()
+    # The start of the first half of a 1 bit, while waiting for the second half.
+    half_start = None
+
+    for start, end in zip(changes, changes[1:]):
+        interval = end - start
+        if interval < short_limit:
+            if half_start is None:
+                half_start = start
+            else:
+                bits.append(1)
+                starts.append(half_start)
+                half_start = None
+            continue
+
+        if half_start is not None:
+            bits.append(_INVALID_BIT)
+            starts.append(half_start)
+            half_start = None
+
+        bits.append(0 if interval < long_limit else _INVALID_BIT)
+        starts.append(start)
+
+    if half_start is not None:
+        bits.append(_INVALID_BIT)
+        starts.append(half_start)
+
+    return bits, starts
+
+
+def _level_changes(samples: List[Union[int, float]]) -> List[int]:
+    """
+    _level_changes returns the index of each sample where the signal swings past the
+    hysteresis threshold on the other side of zero. The first swing and the end of the
+    signal are included, as they bound the first and last bits.
+    """
+    if not samples:
+        return list()
+
+    threshold = max(max(samples), -min(samples)) * _HYSTERESIS
+
+    changes: List[int] = list()
+    level: Optional[bool] = None
+    for index, sample in enumerate(samples):
+        if sample > threshold:
+            new_level = True
+        elif sample < -threshold:
+            new_level = False
+        else:
+            continue
+
+        if new_level != level:
+            changes.append(index)
+        level = new_level
+
+    if changes:
+        changes.append(len(samples))
+    return changes
+
+
+def _find_words_array(bits: Any, starts: Any) -> Tuple[Any, Any]:
+    """_find_words_array is the NumPy implementation of :func:`_find_words`."""
+    numpy = _compat.numpy
+    count = len(bits) - len(_SYNC_BITS) + 1
+
+    match = numpy.ones(max(count, 0), dtype=bool)
+    for offset, sync_bit in enumerate(_SYNC_BITS):
+        end = offset + count
+        match &= bits[offset:end] == sync_bit
+
+    syncs = numpy.flatnonzero(match)
+    syncs = syncs[syncs >= _DATA_BITS]
+
+    # Skip frames with an invalid bit, using a running count of invalid bits.
+    invalid = numpy.concatenate(([0], numpy.cumsum(bits == _INVALID_BIT)))
+    frame_starts = syncs - _DATA_BITS
+    frame_ends = syncs + len(_SYNC_BITS)
+    frame_starts = frame_starts[invalid[frame_ends] == invalid[frame_starts]]
+
+    data = bits[frame_starts[:, None] + numpy.arange(_DATA_BITS)]
+    words = numpy.packbits(data, axis=1, bitorder="little").view("<u8").ravel()
+    return words, starts[frame_starts]
+
+
+def _find_words(bits: List[int], starts: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    _find_words finds each sync word in a bitstream, returning the SMPTE 12M word
+    before it and the index of the sample that word starts at. Frames with an invalid
+    bit are skipped.
+    """
+    sync_bits = list(_SYNC_BITS)
+    words: List[int] = list()
+    positions: List[int] = list()
+
+    for sync in range(_DATA_BITS, len(bits) - len(sync_bits) + 1):
+        sync_end = sync + len(sync_bits)
+        if bits[sync:sync_end] != sync_bits:
+            continue
+
+        frame_start = sync - _DATA_BITS
+        data = bits[frame_start:sync]
+        if _INVALID_BIT in data:
+            continue
+
+        words.append(sum(bit << index for index, bit in enumerate(data)))
+        positions.append(starts[frame_start])
+
+    return words, positions
@@ -0,0 +1,268 @@
+import array
+import fractions
+import os
+import sys
+from typing import Any, Iterator, List, Sequence, Union
+
+from .. import _compat
+from .._framerate import Framerate
+from .._range import Range
+from .._samples import SampleRateSource
+from ..smpte12m import pack_frames
+from ..smpte12m._word import _word_rate
+from ._bits import _DATA_BITS, _FRAME_BITS, _SYNC_BITS, _samples_per_bit
+from ._wav import _write_header
+
+# LTC frames are generated this many at a time, so memory use does not grow with the
+# length of the range.
+_CHUNK_FRAMES = 512
+
+# The largest sample value of 16-bit PCM.
+_FULL_SCALE = 32767
+
+
+def encode(
+    tc_range: Range,
+    *,
+    sample_rate: SampleRateSource,
+    level: float = 0.5,
+    user_bits: int = 0,
+) -> Sequence[int]:
+    """
+    Generates the biphase-mark LTC signal for every frame of a range as 16-bit PCM
+    samples. When NumPy is installed, the waveform of each chunk of frames is built as
+    arrays at once without a Python loop per sample.
+
+    The polarity correction bit of each frame is set, so every frame starts with the
+    same polarity. The first sample is the start of the first frame of the range, and
+    the frame at index ``i`` of the range starts at sample
+    ``ceil(i * sample_rate / playback)``.
+
+    :param tc_range: The range to generate LTC for. The framerate of the range, which
+        may be drop-frame, is the framerate of the LTC.
+
+    :param sample_rate: The number of samples in a second.
+
+    :param level: The peak level of the signal as a fraction of full scale.
+
+    :param user_bits: The 32 user bits of every frame, with the first binary group in
+        the lowest 4 bits.
+
+    :returns: The samples of the signal, as a NumPy ``int16`` array when NumPy is
+        installed, otherwise an ``array.array`` of type ``"h"``.
+
+    :raises ValueError: If the framerate of the range does not have a whole-number
+        timebase of 30 frames or less, ``sample_rate`` is not positive or ``level`` is
+        not between 0 and 1.
+    """
+    chunks = list(_iter_chunks(tc_range, sample_rate, level, user_bits))
+
+    numpy = _compat.numpy
+    if numpy is not None:
+        signal: Any = numpy.concatenate([numpy.zeros(0, dtype=numpy.int16)] + chunks)
+        return signal
+
+    samples = array.array("h")
+    for chunk in chunks:
+        samples.extend(chunk)
+    return samples
+
+
+def encode_wav(
+    path: Union[str, "os.PathLike[str]"],
+    tc_range: Range,
+    *,
+    sample_rate: int,
+    level: float = 0.5,
+    user_bits: int = 0,
+) -> None:
+    """
+    Writes the LTC signal for every frame of a range to a mono 16-bit PCM WAVE file.
+    The signal is generated and written a chunk of frames at a time, so memory use does
+    not grow with the length of the range. See :func:`encode`.
+
+    Files with more than 4 GiB of audio are written as RF64.
+
+    :param path: The path of the file to write. Existing files are overwritten.
+
+    :param tc_range: The range to generate LTC for.
+
+    :param sample_rate: The number of samples in a second.
+
+    :param level: The peak level of the signal as a fraction of full scale.
+
+    :param user_bits: The 32 user bits of every frame, with the first binary group in
+        the lowest 4 bits.
+
+    :raises ValueError: If the framerate of the range does not have a whole-number
+        timebase of 30 frames or less, ``sample_rate`` is not positive or ``level`` is
+        not between 0 and 1.
+    """
+    # Validate the arguments before creating the file.
+    chunks = _iter_chunks(tc_range, sample_rate, level, user_bits)
+    sample_count = _sample_offset(
+        len(tc_range), _samples_per_bit(tc_range.rate, sample_rate)
+    )
+
+    with open(path, "wb") as file:
+        _write_header(file, sample_rate, sample_count)
+        for chunk in chunks:
+            _write_chunk(file, chunk)
+
+
+def _iter_chunks(
+    tc_range: Range, sample_rate: SampleRateSource, level: float, user_bits: int
+) -> Iterator[Any]:
+    """
+    _iter_chunks validates the arguments of :func:`encode`, then returns an iterator
+    of the samples of each chunk of frames of the range.
+    """
+    rate = _word_rate(tc_range.rate)
+    samples_per_bit = _samples_per_bit(rate, sample_rate)
+    if not 0 <= level <= 1:
+        raise ValueError(f"level must be between 0 and 1, got {level}")
+
+    amplitude = round(level * _FULL_SCALE)
+    return _generate_chunks(tc_range, rate, samples_per_bit, amplitude, user_bits)
+
+
+def _generate_chunks(
+    tc_range: Range,
+    rate: Framerate,
+    samples_per_bit: fractions.Fraction,
+    amplitude: int,
+    user_bits: int,
+) -> Iterator[Any]:
+    """_generate_chunks yields the samples of each chunk of frames of the range."""
+    numpy = _compat.numpy
+    frame_count = len(tc_range)
+
+    for first in range(0, frame_count, _CHUNK_FRAMES):
+        end = min(first + _CHUNK_FRAMES, frame_count)
+        frame_in = tc_range.frame_in + first
+        frame_out = tc_range.frame_in + end
+
+        if numpy is not None:
+            frames = numpy.arange(frame_in, frame_out, dtype=numpy.int64)
+            words = pack_frames(frames, rate=rate, user_bits=user_bits)
+            half_levels = _half_levels_array(words, rate)
+        else:
+            words = pack_frames(
+                range(frame_in, frame_out), rate=rate, user_bits=user_bits
+            )
+            half_levels = _half_levels(words, rate)
+
+        start_sample = _sample_offset(first, samples_per_bit)
+        end_sample = _sample_offset(end, samples_per_bit)
+        yield _render(
+            half_levels,
+            first * _FRAME_BITS * 2,
+            start_sample,
+            end_sample,
+            samples_per_bit,
+            amplitude,
+        )
+
+
+def _sample_offset(frames: int, samples_per_bit: fractions.Fraction) -> int:
+    """
+    _sample_offset returns the index of the first sample at or after the start of the
+    frame at an offset into the signal.
+    """
+    bits = frames * _FRAME_BITS
+    return -((-bits * samples_per_bit.numerator) // samples_per_bit.denominator)
+
+
+def _polarity_bit(rate: Framerate) -> int:
+    """
+    _polarity_bit returns the index of the biphase mark polarity correction bit, which
+    moves to the end of the word for 25 fps.
+    """
+    return 59 if rate.timebase == 25 else 27
+
+
+def _half_levels_array(words: Any, rate: Framerate) -> Any:
+    """_half_levels_array is the NumPy implementation of :func:`_half_levels`."""
+    numpy = _compat.numpy
+    shifts = numpy.arange(_DATA_BITS, dtype=numpy.uint64)
+    data = ((words[:, None] >> shifts) & numpy.uint64(1)).astype(numpy.uint8)
+
+    # Set the polarity bit so the frame has an even number of zeros.
+    data[:, _polarity_bit(rate)] = data.sum(axis=1) % 2 == 0
+
+    sync = numpy.broadcast_to(
+        numpy.array(_SYNC_BITS, dtype=numpy.uint8), (len(words), len(_SYNC_BITS))
+    )
+    bits = numpy.concatenate((data, sync), axis=1)
+
+    # Every bit starts with a level change, and 1 bits change again halfway through.
+    changes = numpy.ones((len(words), _FRAME_BITS * 2), dtype=numpy.uint8)
+    changes[:, 1::2] = bits
+    return (numpy.cumsum(changes, axis=1) % 2).ravel()
+
+
+def _half_levels(words: Sequence[int], rate: Framerate) -> List[int]:
+    """
+    _half_levels returns the level, 0 or 1, of each half bit of the LTC frames of the
+    words. With the polarity bit set, every frame has an even number of level changes,
+    so every frame starts from the same level.
+    """
+    polarity_bit = _polarity_bit(rate)
+    levels: List[int] = list()
+
+    for word in words:
+        bits = [(word >> index) & 1 for index in range(_DATA_BITS)]
+        bits[polarity_bit] = int(sum(bits) % 2 == 0)
+        bits.extend(_SYNC_BITS)
+
+        level = 0
+        for bit in bits:
+            level ^= 1
+            levels.append(level)
+            level ^= bit
+            levels.append(level)
+
+    return levels
+
+
+def _render(
+    half_levels: Any,
+    first_half: int,
+    start_sample: int,
+    end_sample: int,
+    samples_per_bit: fractions.Fraction,
+    amplitude: int,
+) -> Any:
+    """
+    _render samples the half-bit levels of a chunk of frames, where first_half is the
+    index of the first half bit of the chunk in the signal.
+    """
+    # The half bit of each sample is found with integer arithmetic, so chunks line up
+    # exactly however long the signal is.
+    numerator = samples_per_bit.numerator
+    denominator = samples_per_bit.denominator * 2
+
+    numpy = _compat.numpy
+    if numpy is not None:
+        sample_index = numpy.arange(start_sample, end_sample, dtype=numpy.int64)
+        halves = sample_index * denominator // numerator - first_half
+        signs = half_levels[halves].astype(numpy.int16) * 2 - 1
+        return signs * numpy.int16(amplitude)
+
+    samples = array.array("h")
+    for index in range(start_sample, end_sample):
+        half = index * denominator // numerator - first_half
+        samples.append(amplitude if half_levels[half] else -amplitude)
+    return samples
+
+
+def _write_chunk(file: Any, chunk: Any) -> None:
+    """_write_chunk writes samples to a file as little-endian 16-bit PCM."""
+    numpy = _compat.numpy
+    if numpy is not None:
+        file.write(chunk.astype("<i2").tobytes())
+        return
+
+    if sys.byteorder == "big":  # pragma: no cover
+        chunk.byteswap()
+    chunk.tofile(file)
@@ -0,0 +1,189 @@
+import mmap
+import os
+import struct
+from typing import Any, BinaryIO, Iterator, NamedTuple, Optional
+
+from .. import _compat
+from .._riff import (
+    _CHUNK_HEADER_STRUCT,
+    _RF64_SIZE_PLACEHOLDER,
+    _iter_chunks,
+    _read_body,
+)
+
+# The fmt chunk field layout: format tag, channel count, sample rate, byte rate, block
+# align and bits per sample.
+_FMT_STRUCT = struct.Struct("<HHIIHH")
+
+# WAVE_FORMAT_EXTENSIBLE fmt chunks store the real format tag at the start of the
+# sub-format GUID.
+_FMT_EXTENSIBLE_TAG_OFFSET = 24
+_FMT_EXTENSIBLE_SIZE = _FMT_EXTENSIBLE_TAG_OFFSET + 2
+
+_FORMAT_PCM = 0x0001
+_FORMAT_FLOAT = 0x0003
+_FORMAT_EXTENSIBLE = 0xFFFE
+
+# The largest size of a RIFF chunk. Larger files are written as RF64.
+_MAX_RIFF_SIZE = 0xFFFFFFFF
+
+# The ds64 chunk layout written to RF64 files: riff size, data size, sample count and
+# an empty chunk size table.
+_DS64_WRITE_STRUCT = struct.Struct("<QQQI")
+
+# The struct format and NumPy dtype of each supported sample format, by whether it is
+# floating-point and its size in bytes. 24-bit samples have no native type.
+_SAMPLE_FORMATS = {
+    (False, 1): ("B", "u1"),
+    (False, 2): ("<h", "<i2"),
+    (False, 3): ("", ""),
+    (False, 4): ("<i", "<i4"),
+    (True, 4): ("<f", "<f4"),
+    (True, 8): ("<d", "<f8"),
+}
+
+
+class _WavFormat(NamedTuple):
+    """_WavFormat is the layout of the audio data of a WAVE file."""
+
+    channels: int
+    sample_rate: int
+    is_float: bool
+    # The size of one sample of one channel in bytes.
+    sample_size: int
+    # The byte offset and size of the audio data.
+    data_offset: int
+    data_size: int
+
+
+def _read_format(file: BinaryIO, path: str) -> _WavFormat:
+    """
+    _read_format walks the chunks of an open WAVE file until the fmt and data chunks
+    are found. The data size is clipped to the size of the file, so files that are
+    still being written can be read.
+    """
+    fmt: Optional[bytes] = None
+    data_size: Optional[int] = None
+
+    for chunk_id, size in _iter_chunks(file, path):
+        if chunk_id == b"fmt ":
+            fmt = _read_body(file, size, min(size, _FMT_EXTENSIBLE_SIZE), path)
+        elif chunk_id == b"data":
+            data_size = size
+            break
+
+    if data_size is None:
+        raise ValueError(f"{path} has no data chunk")
+    if fmt is None:
+        raise ValueError(f"{path} has no fmt chunk")
+
+    data_offset = file.tell()
+    file_size = file.seek(0, os.SEEK_END)
+    data_size = min(data_size, file_size - data_offset)
+    return _parse_format(fmt, data_offset, data_size, path)
+
+
+def _parse_format(
+    fmt: bytes, data_offset: int, data_size: int, path: str
+) -> _WavFormat:
+    """_parse_format parses the body of a fmt chunk."""
+    if len(fmt) < _FMT_STRUCT.size:
+        raise ValueError(f"{path} has a truncated chunk")
+
+    tag, channels, sample_rate, _, _, bits = _FMT_STRUCT.unpack_from(fmt)
+    if tag == _FORMAT_EXTENSIBLE and len(fmt) >= _FMT_EXTENSIBLE_SIZE:
+        (tag,) = struct.unpack_from("<H", fmt, _FMT_EXTENSIBLE_TAG_OFFSET)
+
+    is_float = tag == _FORMAT_FLOAT
+    sample_size = bits // 8
+    if tag not in (_FORMAT_PCM, _FORMAT_FLOAT) or bits % 8 != 0:
+        raise ValueError(f"{path} has unsupported audio format {tag:#06x}")
+    if (is_float, sample_size) not in _SAMPLE_FORMATS:
+        raise ValueError(f"{path} has unsupported {bits}-bit audio samples")
+
+    # Only read whole sample frames.
+    block_size = sample_size * channels
+    data_size -= data_size % block_size
+
+    return _WavFormat(
+        channels=channels,
+        sample_rate=sample_rate,
+        is_float=is_float,
+        sample_size=sample_size,
+        data_offset=data_offset,
+        data_size=data_size,
+    )
+
+
+def _channel_samples(mapped: mmap.mmap, wav: _WavFormat, channel: int) -> Any:
+    """
+    _channel_samples returns the samples of one channel of the audio data of a memory
+    mapped WAVE file. When NumPy is installed, a NumPy array viewing the mapped data
+    is returned, otherwise an iterator of ints or floats. 8-bit samples, which are
+    unsigned, are centered on 0.
+    """
+    if channel < 0 or channel >= wav.channels:
+        raise ValueError(
+            f"channel must be between 0 and {wav.channels - 1}, got {channel}"
+        )
+
+    numpy = _compat.numpy
+    if numpy is None:
+        return _iter_samples(mapped, wav, channel)
+
+    count = wav.data_size // wav.sample_size
+    offset = wav.data_offset
+    _, dtype = _SAMPLE_FORMATS[(wav.is_float, wav.sample_size)]
+
+    if wav.sample_size == 3:
+        raw = numpy.frombuffer(mapped, numpy.uint8, count * 3, offset)
+        raw = raw.reshape(-1, wav.channels, 3)[:, channel]
+        # Take the sign from the high byte.
+        high = raw[:, 2].view(numpy.int8).astype(numpy.int32)
+        return raw[:, 0] | (raw[:, 1].astype(numpy.int32) << 8) | (high << 16)
+
+    samples = numpy.frombuffer(mapped, dtype, count, offset)
+    samples = samples.reshape(-1, wav.channels)[:, channel]
+    if wav.sample_size == 1:
+        samples = samples.astype(numpy.int16) - 128
+    return samples
+
+
+def _iter_samples(mapped: mmap.mmap, wav: _WavFormat, channel: int) -> Iterator[Any]:
+    """_iter_samples is the pure-python implementation of :func:`_channel_samples`."""
+    size = wav.sample_size
+    block_size = size * wav.channels
+    start = wav.data_offset + channel * size
+    stop = wav.data_offset + wav.data_size
+    sample_format, _ = _SAMPLE_FORMATS[(wav.is_float, size)]
+
+    for position in range(start, stop, block_size):
+        if size == 3:
+            end = position + size
+            yield int.from_bytes(mapped[position:end], "little", signed=True)
+        else:
+            (sample,) = struct.unpack_from(sample_format, mapped, position)
+            yield sample - 128 if size == 1 else sample
+
+
+def _write_header(file: BinaryIO, sample_rate: int, sample_count: int) -> None:
+    """
+    _write_header writes the header of a mono 16-bit PCM WAVE file, up to the start of
+    the audio data. Files that are too large for RIFF are written as RF64.
+    """
+    data_size = sample_count * 2
+    fmt = _FMT_STRUCT.pack(_FORMAT_PCM, 1, sample_rate, sample_rate * 2, 2, 16)
+    chunks = _CHUNK_HEADER_STRUCT.pack(b"fmt ", len(fmt)) + fmt
+
+    riff_id = b"RIFF"
+    riff_size = 4 + len(chunks) + _CHUNK_HEADER_STRUCT.size + data_size
+
+    if riff_size > _MAX_RIFF_SIZE:
+        riff_id = b"RF64"
+        riff_size += _CHUNK_HEADER_STRUCT.size + _DS64_WRITE_STRUCT.size
+        ds64 = _DS64_WRITE_STRUCT.pack(riff_size, data_size, sample_count, 0)
+        chunks = _CHUNK_HEADER_STRUCT.pack(b"ds64", len(ds64)) + ds64 + chunks
+        riff_size = data_size = _RF64_SIZE_PLACEHOLDER
+
+    file.write(_CHUNK_HEADER_STRUCT.pack(riff_id, riff_size) + b"WAVE" + chunks)
+    file.write(_CHUNK_HEADER_STRUCT.pack(b"data", data_size))
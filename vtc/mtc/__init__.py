@@ -0,0 +1,14 @@
+"""
+The mtc module converts timecode to and from MIDI timecode (MTC) messages.
+"""
+
+# "noqa" setting stops flake8 from flagging unused imports in __init__
+
+from ._decoder import decode, MTCDecoder  # noqa
+from ._messages import (  # noqa
+    full_frame,
+    parse_full_frame,
+    parse_quarter_frames,
+    quarter_frame_stream,
+    quarter_frames,
+)
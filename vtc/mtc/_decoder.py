@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+from .._timecode import Timecode
+from ._messages import (
+    _FULL_FRAME_SIZE,
+    _QUARTER_FRAME,
+    _QUARTER_FRAME_PIECES,
+    _SYSEX_END,
+    _SYSEX_START,
+    _decode_nibbles,
+    _is_full_frame,
+    parse_full_frame,
+)
+
+# Bytes from this value up are real-time messages, which may be sent in the middle of
+# any other message.
+_REAL_TIME = 0xF8
+
+# Bytes from this value up are status bytes.
+_STATUS = 0x80
+
+
+class MTCDecoder:
+    """
+    MTCDecoder decodes the MTC in a raw MIDI byte stream, which may arrive in pieces of
+    any size. Quarter-frame sequences are reassembled from their nibbles and each
+    timecode is built from integer frame counts, so no timecode is parsed per message.
+
+    Quarter-frame sequences must be sent forwards, with pieces 0 to 7 in order. Other
+    MIDI messages, including real-time messages sent inside other messages, may be
+    interleaved with them. A sequence that skips a piece is dropped.
+
+    The timecode of a quarter-frame sequence is the frame its first piece was sent in.
+    By the time its last piece arrives, playback has moved on two frames.
+    """
+
+    def __init__(self) -> None:
+        self._nibbles = [0] * _QUARTER_FRAME_PIECES
+        # The next quarter-frame piece of the current sequence.
+        self._next_piece = 0
+        # Whether the next data byte is the data of a quarter-frame message.
+        self._awaiting_quarter_frame = False
+        # The bytes of the SysEx message being received, up to the size of a
+        # full-frame message, or None outside of SysEx messages.
+        self._sysex: Optional[bytearray] = None
+
+    def feed(self, data: bytes) -> List[Timecode]:
+        """
+        Decodes the next bytes of the stream. Messages may be split across calls.
+
+        :param data: The next bytes of the stream.
+
+        :returns: The timecode of each quarter-frame sequence and full-frame message
+            completed by ``data``, in order.
+        """
+        timecodes: List[Timecode] = list()
+
+        for byte in data:
+            if byte >= _REAL_TIME:
+                continue
+
+            if byte < _STATUS:
+                timecode = self._feed_data(byte)
+            else:
+                timecode = self._feed_status(byte)
+
+            if timecode is not None:
+                timecodes.append(timecode)
+
+        return timecodes
+
+    def reset(self) -> None:
+        """
+        Discards any partly received messages, such as after a gap in the stream.
+        """
+        self._next_piece = 0
+        self._awaiting_quarter_frame = False
+        self._sysex = None
+
+    def _feed_status(self, byte: int) -> Optional[Timecode]:
+        """_feed_status handles a status byte, which ends the previous message."""
+        sysex = self._sysex
+        self._sysex = bytearray([byte]) if byte == _SYSEX_START else None
+        self._awaiting_quarter_frame = byte == _QUARTER_FRAME
+
+        if byte != _SYSEX_END or sysex is None:
+            return None
+
+        message = bytes(sysex) + bytes([byte])
+        if not _is_full_frame(message):
+            return None
+
+        # Full-frame messages are sent when jumping to a new position, so any sequence
+        # in progress is stale.
+        self._next_piece = 0
+        return parse_full_frame(message)
+
+    def _feed_data(self, byte: int) -> Optional[Timecode]:
+        """_feed_data handles a data byte."""
+        if self._awaiting_quarter_frame:
+            self._awaiting_quarter_frame = False
+            return self._feed_quarter_frame(byte)
+
+        # Longer SysEx messages are not full-frame messages, so only keep enough bytes
+        # to tell them apart.
+        sysex = self._sysex
+        if sysex is not None and len(sysex) < _FULL_FRAME_SIZE:
+            sysex.append(byte)
+
+        return None
+
+    def _feed_quarter_frame(self, data: int) -> Optional[Timecode]:
+        """
+        _feed_quarter_frame adds the data of a quarter-frame message to the current
+        sequence, returning its timecode once the last piece arrives.
+        """
+        piece = data >> 4
+        if piece != self._next_piece:
+            # Start over, which may be with this piece.
+            self._next_piece = 0
+            if piece != 0:
+                return None
+
+        self._nibbles[piece] = data & 0xF
+        if piece < _QUARTER_FRAME_PIECES - 1:
+            self._next_piece = piece + 1
+            return None
+
+        self._next_piece = 0
+        return _decode_nibbles(self._nibbles)
+
+
+def decode(data: bytes) -> List[Timecode]:
+    """
+    Decodes the MTC in a raw MIDI byte stream, such as a captured MIDI log. See
+    :class:`MTCDecoder`.
+
+    :param data: The bytes of the stream.
+
+    :returns: The timecode of each quarter-frame sequence and full-frame message in
+        the stream, in order.
+    """
+    return MTCDecoder().feed(data)
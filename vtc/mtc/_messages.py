@@ -0,0 +1,236 @@
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from .._bcd import _frames_to_sections, _sections_to_frames
+from .._framerate import Framerate, RATE
+from .._range import Range
+from .._timecode import Timecode
+from ..smpte12m._word import _frames_per_day
+
+# The framerate of each MTC rate code.
+_RATES = (RATE.F24, Framerate(25), RATE.F29_97_DF, RATE.F30)
+
+_SYSEX_START = 0xF0
+_SYSEX_END = 0xF7
+_QUARTER_FRAME = 0xF1
+
+# Full-frame messages are a universal real-time SysEx with this prefix after the device
+# id, followed by hours and rate code, minutes, seconds and frames.
+_FULL_FRAME_PREFIX = bytes([0x01, 0x01])
+_FULL_FRAME_SIZE = 10
+
+# Full-frame messages are sent to all devices by default.
+_ALL_DEVICES = 0x7F
+
+_QUARTER_FRAME_PIECES = 8
+
+
+def full_frame(timecode: Timecode, *, device_id: int = _ALL_DEVICES) -> bytes:
+    """
+    Encodes a timecode as an MTC full-frame SysEx message.
+
+    :param timecode: The timecode to encode. Timecodes are wrapped to 24 hours.
+
+    :param device_id: The SysEx device id to send the message to. Defaults to all
+        devices.
+
+    :returns: The 10 bytes of the message.
+
+    :raises ValueError: If the framerate of timecode does not have an MTC rate code.
+    """
+    code, hours, minutes, seconds, frames = _encode_fields(timecode)
+    return bytes(
+        [
+            _SYSEX_START,
+            0x7F,
+            device_id,
+            *_FULL_FRAME_PREFIX,
+            (code << 5) | hours,
+            minutes,
+            seconds,
+            frames,
+            _SYSEX_END,
+        ]
+    )
+
+
+def parse_full_frame(message: bytes) -> Timecode:
+    """
+    Decodes an MTC full-frame SysEx message. The framerate of the timecode is taken
+    from the rate code of the message: ``RATE.F24``, 25 fps, ``RATE.F29_97_DF`` or
+    ``RATE.F30``.
+
+    :param message: The 10 bytes of the message, from the SysEx start byte to the end
+        byte. Any device id is accepted.
+
+    :raises ValueError: If the message is not an MTC full-frame message.
+    """
+    if not _is_full_frame(message):
+        raise ValueError(f"{bytes(message).hex(' ')} is not an MTC full-frame message")
+
+    hours_and_code, minutes, seconds, frames = message[5:9]
+    return _decode_fields(
+        (hours_and_code >> 5) & 0x3, hours_and_code & 0x1F, minutes, seconds, frames
+    )
+
+
+def quarter_frames(timecode: Timecode) -> List[bytes]:
+    """
+    Encodes a timecode as the sequence of eight MTC quarter-frame messages that carry
+    it. The sequence starts on the frame of the timecode and takes two frames to send.
+
+    :param timecode: The timecode to encode. Timecodes are wrapped to 24 hours.
+
+    :returns: The 2 bytes of each message, in the order they are sent.
+
+    :raises ValueError: If the framerate of timecode does not have an MTC rate code.
+    """
+    fields = _encode_fields(timecode)
+    return [
+        bytes([_QUARTER_FRAME, _quarter_frame_data(piece, fields)])
+        for piece in range(_QUARTER_FRAME_PIECES)
+    ]
+
+
+def parse_quarter_frames(messages: Iterable[bytes]) -> Timecode:
+    """
+    Decodes a sequence of eight MTC quarter-frame messages. The framerate of the
+    timecode is taken from the rate code of the last message. See
+    :func:`parse_full_frame`.
+
+    :param messages: The 2 bytes of each message, in the order they were sent.
+
+    :raises ValueError: If the messages are not quarter-frame messages for pieces 0 to
+        7, in order.
+    """
+    nibbles: List[int] = list()
+    for message in messages:
+        if (
+            len(message) != 2
+            or message[0] != _QUARTER_FRAME
+            or message[1] >> 4 != len(nibbles)
+        ):
+            raise ValueError(
+                f"{bytes(message).hex(' ')} is not an MTC quarter-frame message for"
+                f" piece {len(nibbles)}"
+            )
+        nibbles.append(message[1] & 0xF)
+
+    if len(nibbles) != _QUARTER_FRAME_PIECES:
+        raise ValueError(
+            f"expected {_QUARTER_FRAME_PIECES} MTC quarter-frame messages,"
+            f" got {len(nibbles)}"
+        )
+
+    return _decode_nibbles(nibbles)
+
+
+def quarter_frame_stream(tc_range: Range) -> Iterator[bytes]:
+    """
+    Generates the MTC quarter-frame messages sent while playing a range, four per
+    frame. Message ``i`` is sent ``i`` quarter frames after the in point of the range.
+    A new sequence of eight messages starts on every other frame from the in point,
+    carrying the timecode of that frame. The sections of each sequence are worked out
+    with integer arithmetic, without creating a :class:`vtc.Timecode` per sequence.
+
+    :param tc_range: The range to play.
+
+    :returns: An iterator of the 2 bytes of each message.
+
+    :raises ValueError: If the framerate of the range does not have an MTC rate code.
+    """
+    rate = tc_range.rate
+    code = _rate_code(rate)
+    frames_per_day = _frames_per_day(rate)
+
+    return _iter_quarter_frames(tc_range, code, frames_per_day)
+
+
+def _iter_quarter_frames(
+    tc_range: Range, code: int, frames_per_day: int
+) -> Iterator[bytes]:
+    """_iter_quarter_frames yields the messages of :func:`quarter_frame_stream`."""
+    rate = tc_range.rate
+    message_count = len(tc_range) * 4
+
+    for first in range(0, message_count, _QUARTER_FRAME_PIECES):
+        frame = (tc_range.frame_in + first // 4) % frames_per_day
+        fields = (code, *_frames_to_sections(frame, rate))
+        for piece in range(min(_QUARTER_FRAME_PIECES, message_count - first)):
+            yield bytes([_QUARTER_FRAME, _quarter_frame_data(piece, fields)])
+
+
+def _quarter_frame_data(piece: int, fields: Tuple[int, int, int, int, int]) -> int:
+    """
+    _quarter_frame_data returns the data byte of a quarter-frame message, where fields
+    are the rate code, hours, minutes, seconds and frames.
+    """
+    code, hours, minutes, seconds, frames = fields
+    # Pieces alternate between the low and high nibbles of frames, seconds, minutes and
+    # hours. The rate code is sent above the high bit of the hours.
+    values = (frames, seconds, minutes, hours | (code << 5))
+    value = values[piece // 2]
+    nibble = value >> 4 if piece % 2 else value & 0xF
+    return (piece << 4) | nibble
+
+
+def _rate_code(rate: Framerate) -> int:
+    """
+    _rate_code returns the MTC rate code of a framerate. MTC has no code for NTSC rates
+    other than 29.97 drop-frame, so 23.98 and 29.97 non-drop are sent as 24 and 30.
+    """
+    timebase = rate.timebase
+    if timebase == 24:
+        return 0
+    if timebase == 25:
+        return 1
+    if timebase == 30:
+        return 2 if rate.dropframe else 3
+
+    raise ValueError(f"MTC only supports 24, 25 and 30 fps timebases, got {timebase}")
+
+
+def _encode_fields(timecode: Timecode) -> Tuple[int, int, int, int, int]:
+    """
+    _encode_fields returns the rate code, hours, minutes, seconds and frames of a
+    timecode, wrapped to 24 hours.
+    """
+    rate = timecode.rate
+    code = _rate_code(rate)
+    frame = timecode.frames % _frames_per_day(rate)
+    hours, minutes, seconds, frames = _frames_to_sections(frame, rate)
+    return code, hours, minutes, seconds, frames
+
+
+def _decode_fields(
+    code: int, hours: int, minutes: int, seconds: int, frames: int
+) -> Timecode:
+    """_decode_fields builds the timecode of decoded MTC fields."""
+    rate = _RATES[code]
+    frame = _sections_to_frames(hours, minutes, seconds, frames, rate)
+    return Timecode._from_frames(frame, rate)
+
+
+def _decode_nibbles(nibbles: Sequence[int]) -> Timecode:
+    """
+    _decode_nibbles builds the timecode of the data nibbles of the eight pieces of a
+    quarter-frame sequence. Bits of the high nibbles that are not part of the fields
+    are ignored.
+    """
+    return _decode_fields(
+        (nibbles[7] >> 1) & 0x3,
+        nibbles[6] | (nibbles[7] & 0x1) << 4,
+        nibbles[4] | (nibbles[5] & 0x3) << 4,
+        nibbles[2] | (nibbles[3] & 0x3) << 4,
+        nibbles[0] | (nibbles[1] & 0x1) << 4,
+    )
+
+
+def _is_full_frame(message: bytes) -> bool:
+    """_is_full_frame returns whether message is an MTC full-frame message."""
+    return (
+        len(message) == _FULL_FRAME_SIZE
+        and message[0] == _SYSEX_START
+        and message[1] == 0x7F
+        and message[3:5] == _FULL_FRAME_PREFIX
+        and message[-1] == _SYSEX_END
+    )
@@ -0,0 +1,6 @@
+"""
+The mxf module reads start timecodes from the header partition of MXF files without
+reading their essence.
+"""
+
+from ._read import TimecodeComponent, read, start_timecode  # noqa
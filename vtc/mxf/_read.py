@@ -0,0 +1,359 @@
+import fractions
+import os
+import struct
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .._framerate import Framerate
+from .._timecode import Timecode
+
+# All SMPTE universal label keys start with this prefix.
+_KEY_PREFIX = bytes.fromhex("060e2b34")
+
+# Header partition pack keys start with this prefix, followed by the partition status
+# and a reserved byte.
+_HEADER_PARTITION_PREFIX = bytes.fromhex("060e2b34020501010d0102010102")
+
+# KLV fill keys start with one of these prefixes, which differ only in the version
+# byte. Writers use fill to pad items up to the KLV alignment grid (KAG).
+_FILL_KEY_PREFIXES = (
+    bytes.fromhex("060e2b34010101010301021001"),
+    bytes.fromhex("060e2b34010101020301021001"),
+)
+
+# The header partition pack may be preceded by a run-in of at most 64 KiB.
+_MAX_RUN_IN = 65536
+
+# The partition pack fields before the header byte count: major version, minor version,
+# KAG size, this partition, previous partition and footer partition.
+_PARTITION_PACK_STRUCT = struct.Struct(">HHIQQQ")
+
+# Byte 5 of a set key marks it as a local set with 2-byte tags and 2-byte lengths.
+_LOCAL_SET_MARKER = 0x53
+
+# The last 8 bytes of the keys of the metadata sets we need.
+_MATERIAL_PACKAGE = bytes.fromhex("0d01010101013600")
+_SOURCE_PACKAGE = bytes.fromhex("0d01010101013700")
+_SEQUENCE = bytes.fromhex("0d01010101010f00")
+_TIMECODE_COMPONENT = bytes.fromhex("0d01010101011400")
+
+# The local tags of the metadata set properties we need.
+_TAG_INSTANCE_UID = 0x3C0A
+_TAG_PACKAGE_UID = 0x4401
+_TAG_PACKAGE_TRACKS = 0x4403
+_TAG_PACKAGE_DESCRIPTOR = 0x4701
+_TAG_TRACK_EDIT_RATE = 0x4B01
+_TAG_TRACK_SEQUENCE = 0x4803
+_TAG_SEQUENCE_COMPONENTS = 0x1001
+_TAG_START_TIMECODE = 0x1501
+_TAG_ROUNDED_TIMECODE_BASE = 0x1502
+_TAG_DROP_FRAME = 0x1503
+
+_LOCAL_TAG_STRUCT = struct.Struct(">HH")
+_BATCH_HEADER_STRUCT = struct.Struct(">II")
+_RATIONAL_STRUCT = struct.Struct(">ii")
+
+
+class _Set(NamedTuple):
+    # The last 8 bytes of the set key.
+    kind: bytes
+    # The raw value of each local tag of the set.
+    tags: Dict[int, bytes]
+
+
+class TimecodeComponent(NamedTuple):
+    """
+    TimecodeComponent holds the Timecode Component of a material or file package, as
+    read by :func:`read`.
+    """
+
+    # Either 'material' or 'file'.
+    package: str
+    # The UMID of the package.
+    package_uid: bytes
+    # The whole number of frames in a second of timecode, like 24 or 30.
+    rounded_timecode_base: int
+    dropframe: bool
+    # The frame count of the first frame of the package.
+    start_frame: int
+    # The edit rate of the timecode track, if set.
+    edit_rate: Optional[fractions.Fraction]
+
+    @property
+    def rate(self) -> Framerate:
+        """
+        The framerate of the timecode. The edit rate of the timecode track is used when
+        it rounds to the timecode base, so NTSC rates are detected.
+        """
+        base = self.rounded_timecode_base
+        if self.edit_rate is not None and round(self.edit_rate) == base:
+            return Framerate(self.edit_rate, dropframe=self.dropframe)
+
+        if self.dropframe:
+            return Framerate(fractions.Fraction(base * 1000, 1001), dropframe=True)
+
+        return Framerate(base)
+
+    @property
+    def timecode(self) -> Timecode:
+        """The start timecode of the package."""
+        return Timecode(self.start_frame, rate=self.rate)
+
+
+def read(path: Union[str, "os.PathLike[str]"]) -> List[TimecodeComponent]:
+    """
+    Reads the Timecode Components of the material and file packages of an MXF file.
+
+    Only the run-in, header partition pack and the header metadata that follows it are
+    read. Essence is never read, so reading is fast regardless of file size.
+
+    :param path: The path of the file to read.
+
+    :returns: The timecode components of the file, material packages first.
+
+    :raises ValueError: If the file has no header partition or invalid header metadata.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as file:
+        metadata, offset = _read_header_metadata(file, path)
+
+    sets = _parse_sets(metadata, offset, path)
+    by_uid = {
+        local_set.tags[_TAG_INSTANCE_UID]: local_set
+        for local_set in sets
+        if _TAG_INSTANCE_UID in local_set.tags
+    }
+
+    components: List[TimecodeComponent] = list()
+    for kind, package_name in [
+        (_MATERIAL_PACKAGE, "material"),
+        (_SOURCE_PACKAGE, "file"),
+    ]:
+        for package in sets:
+            if package.kind != kind:
+                continue
+            # Source packages without an essence descriptor are tape or other physical
+            # sources rather than files.
+            if kind == _SOURCE_PACKAGE and _TAG_PACKAGE_DESCRIPTOR not in package.tags:
+                continue
+            components.extend(_package_components(package, package_name, by_uid))
+
+    return components
+
+
+def start_timecode(path: Union[str, "os.PathLike[str]"]) -> Timecode:
+    """
+    Reads the start timecode of an MXF file from the first Timecode Component of its
+    material package, falling back to its file package.
+
+    :param path: The path of the file to read.
+
+    :returns: The start timecode of the file.
+
+    :raises ValueError: If the file has no header partition, invalid header metadata or
+        no timecode component.
+    """
+    components = read(path)
+    if not components:
+        raise ValueError(f"{os.fspath(path)} has no timecode component")
+    return components[0].timecode
+
+
+def _read_header_metadata(file: BinaryIO, path: str) -> Tuple[bytes, int]:
+    """
+    _read_header_metadata finds the header partition pack within the run-in, then reads
+    the header metadata that follows it and any KLV fill. Returns the metadata and its
+    file offset.
+    """
+    run_in = file.read(_MAX_RUN_IN + len(_HEADER_PARTITION_PREFIX))
+    start = run_in.find(_HEADER_PARTITION_PREFIX)
+    if start < 0:
+        raise ValueError(f"{path} has no MXF header partition")
+
+    length_start = start + 16
+    file.seek(length_start)
+    length, length_size = _read_ber_length(file.read(9), 0, path, start)
+
+    file.seek(length_start + length_size)
+    pack = file.read(length)
+    if len(pack) < _PARTITION_PACK_STRUCT.size + 8:
+        raise ValueError(f"{path} has a truncated partition pack")
+
+    (header_byte_count,) = struct.unpack_from(">Q", pack, _PARTITION_PACK_STRUCT.size)
+
+    offset = _skip_fill(file, length_start + length_size + length, path)
+    if offset + header_byte_count > os.fstat(file.fileno()).st_size:
+        raise ValueError(f"{path} has a truncated header partition")
+
+    file.seek(offset)
+    return file.read(header_byte_count), offset
+
+
+def _skip_fill(file: BinaryIO, offset: int, path: str) -> int:
+    """
+    _skip_fill skips the KLV fill KAG aligned writers put between the partition pack
+    and the primer pack, returning the file offset of the header metadata. The header
+    byte count starts at the primer pack, after the fill.
+    """
+    file.seek(offset)
+    head = file.read(25)
+    if not _is_fill(head):
+        return offset
+
+    length, length_size = _read_ber_length(head, 16, path, offset)
+    return offset + 16 + length_size + length
+
+
+def _is_fill(key: bytes) -> bool:
+    """_is_fill returns whether a key is a KLV fill key."""
+    return key[: len(_FILL_KEY_PREFIXES[0])] in _FILL_KEY_PREFIXES
+
+
+def _parse_sets(metadata: bytes, offset: int, path: str) -> List[_Set]:
+    """
+    _parse_sets parses every local set in the header metadata, which starts at offset
+    in the file.
+    """
+    sets: List[_Set] = list()
+    for key, value in _iter_klv(metadata, offset, path):
+        if _is_fill(key):
+            continue
+        if key[:4] == _KEY_PREFIX and key[5] == _LOCAL_SET_MARKER:
+            sets.append(_Set(kind=key[8:], tags=_parse_local_tags(value)))
+    return sets
+
+
+def _iter_klv(data: bytes, offset: int, path: str) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    _iter_klv yields the key and value of each KLV triplet in data, which starts at
+    offset in the file.
+    """
+    position = 0
+    while position + 17 <= len(data):
+        value_start = position + 16
+        key = data[position:value_start]
+        length, length_size = _read_ber_length(
+            data, value_start, path, offset + position
+        )
+
+        value_start += length_size
+        value_end = value_start + length
+        if value_end > len(data):
+            raise ValueError(f"{path} has an invalid KLV at byte {offset + position}")
+
+        yield key, data[value_start:value_end]
+        position = value_end
+
+
+def _read_ber_length(
+    data: bytes, position: int, path: str, klv_position: int
+) -> Tuple[int, int]:
+    """
+    _read_ber_length decodes the BER encoded length at position in data, returning the
+    length and the number of bytes it was encoded with.
+    """
+    if position >= len(data):
+        raise ValueError(f"{path} has an invalid KLV at byte {klv_position}")
+
+    first = data[position]
+    if first < 0x80:
+        return first, 1
+
+    size = first & 0x7F
+    start = position + 1
+    end = start + size
+    if end > len(data):
+        raise ValueError(f"{path} has an invalid KLV at byte {klv_position}")
+
+    return int.from_bytes(data[start:end], "big"), size + 1
+
+
+def _parse_local_tags(value: bytes) -> Dict[int, bytes]:
+    """_parse_local_tags parses the 2-byte tag, 2-byte length items of a local set."""
+    tags: Dict[int, bytes] = dict()
+    position = 0
+    while position + _LOCAL_TAG_STRUCT.size <= len(value):
+        tag, length = _LOCAL_TAG_STRUCT.unpack_from(value, position)
+        start = position + _LOCAL_TAG_STRUCT.size
+        position = start + length
+        tags[tag] = value[start:position]
+    return tags
+
+
+def _parse_batch(value: bytes) -> List[bytes]:
+    """_parse_batch parses a batch or array of fixed size items."""
+    if len(value) < _BATCH_HEADER_STRUCT.size:
+        return list()
+
+    count, item_size = _BATCH_HEADER_STRUCT.unpack_from(value)
+    if not item_size:
+        return list()
+
+    starts = range(
+        _BATCH_HEADER_STRUCT.size,
+        _BATCH_HEADER_STRUCT.size + count * item_size,
+        item_size,
+    )
+    items: List[bytes] = list()
+    for start in starts:
+        end = start + item_size
+        items.append(value[start:end])
+    return items
+
+
+def _package_components(
+    package: _Set, package_name: str, by_uid: Dict[bytes, _Set]
+) -> Iterator[TimecodeComponent]:
+    """
+    _package_components yields the timecode components of each track of a package.
+    """
+    for track_uid in _parse_batch(package.tags.get(_TAG_PACKAGE_TRACKS, b"")):
+        track = by_uid.get(track_uid)
+        if track is None:
+            continue
+
+        edit_rate: Optional[fractions.Fraction] = None
+        raw_rate = track.tags.get(_TAG_TRACK_EDIT_RATE, b"")
+        if len(raw_rate) == _RATIONAL_STRUCT.size:
+            numerator, denominator = _RATIONAL_STRUCT.unpack(raw_rate)
+            if numerator > 0 and denominator > 0:
+                edit_rate = fractions.Fraction(numerator, denominator)
+
+        for component in _track_timecode_sets(track, by_uid):
+            yield TimecodeComponent(
+                package=package_name,
+                package_uid=package.tags.get(_TAG_PACKAGE_UID, b""),
+                rounded_timecode_base=int.from_bytes(
+                    component.tags[_TAG_ROUNDED_TIMECODE_BASE], "big"
+                ),
+                dropframe=any(component.tags.get(_TAG_DROP_FRAME, b"")),
+                start_frame=int.from_bytes(
+                    component.tags[_TAG_START_TIMECODE], "big", signed=True
+                ),
+                edit_rate=edit_rate,
+            )
+
+
+def _track_timecode_sets(track: _Set, by_uid: Dict[bytes, _Set]) -> Iterator[_Set]:
+    """
+    _track_timecode_sets yields the timecode components referenced by a track, either
+    directly or through a sequence.
+    """
+    segment = by_uid.get(track.tags.get(_TAG_TRACK_SEQUENCE, b""))
+    if segment is None:
+        return
+
+    components = [segment]
+    if segment.kind == _SEQUENCE:
+        components = [
+            by_uid[uid]
+            for uid in _parse_batch(segment.tags.get(_TAG_SEQUENCE_COMPONENTS, b""))
+            if uid in by_uid
+        ]
+
+    for component in components:
+        if (
+            component.kind == _TIMECODE_COMPONENT
+            and _TAG_ROUNDED_TIMECODE_BASE in component.tags
+            and _TAG_START_TIMECODE in component.tags
+        ):
+            yield component
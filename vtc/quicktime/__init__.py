@@ -0,0 +1,6 @@
+"""
+The quicktime module reads start timecodes from the timecode track of QuickTime and MP4
+files without reading their media data.
+"""
+
+from ._read import TimecodeTrack, read, start_timecode  # noqa
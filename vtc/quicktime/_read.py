@@ -0,0 +1,238 @@
+import os
+import struct
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .._framerate import Framerate
+from .._timecode import Timecode
+
+_ATOM_HEADER_STRUCT = struct.Struct(">I4s")
+_ATOM_LARGE_SIZE_STRUCT = struct.Struct(">Q")
+
+# The atoms to descend through from a trak atom to its sample table.
+_SAMPLE_TABLE_PATH = (b"mdia", b"minf", b"stbl")
+
+# The fields of a tmcd sample description after its size and type: reserved bytes,
+# data reference index, reserved, flags, timescale, frame duration and number of
+# frames.
+_TMCD_STRUCT = struct.Struct(">6sHIIIIB")
+
+# tmcd flag bits.
+_TMCD_DROP_FRAME = 0x0001
+_TMCD_NEGATIVE_TIMES_OK = 0x0004
+
+# Full atoms like stsd and stco start with a version, flags and entry count.
+_TABLE_HEADER_STRUCT = struct.Struct(">II")
+
+# _Atom is the type, body start and body end of an atom.
+_Atom = Tuple[bytes, int, int]
+
+
+class TimecodeTrack(NamedTuple):
+    """
+    TimecodeTrack holds the tmcd sample description and first timecode sample of a
+    QuickTime or MP4 timecode track, as read by :func:`read`.
+    """
+
+    path: str
+    # The number of time units in a second.
+    timescale: int
+    # The number of time units in a frame.
+    frame_duration: int
+    # The whole number of frames in a second of timecode, like 24 or 30.
+    number_of_frames: int
+    dropframe: bool
+    # The frame count of the first timecode sample.
+    frame: int
+
+    @property
+    def rate(self) -> Framerate:
+        """The framerate of the timecode track."""
+        playback = (self.timescale, self.frame_duration)
+        # QuickTime files may give NTSC rates as values like 2997/100, so any rate that
+        # does not match its whole number of frames is treated as NTSC.
+        ntsc: Optional[bool] = None
+        if self.timescale != self.frame_duration * self.number_of_frames:
+            ntsc = True
+
+        return Framerate(playback, ntsc=ntsc, dropframe=self.dropframe)
+
+    @property
+    def timecode(self) -> Timecode:
+        """The start timecode of the timecode track."""
+        return Timecode(self.frame, rate=self.rate)
+
+
+def read(path: Union[str, "os.PathLike[str]"]) -> TimecodeTrack:
+    """
+    Reads the first timecode track of a QuickTime or MP4 file.
+
+    Atoms are walked with seeks, reading only atom headers, the sample description and
+    chunk offset tables of each track, and the 4 bytes of the first timecode sample.
+    Media data is never read, so reading is fast regardless of file size.
+
+    :param path: The path of the file to read.
+
+    :returns: The timecode track of the file.
+
+    :raises ValueError: If the file has an invalid atom, or has no timecode track.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        for moov in _iter_atoms(file, 0, size, path, b"moov"):
+            for trak in _iter_atoms(file, moov[1], moov[2], path, b"trak"):
+                track = _read_track(file, trak, path)
+                if track is not None:
+                    return track
+
+    raise ValueError(f"{path} has no tmcd timecode track")
+
+
+def start_timecode(path: Union[str, "os.PathLike[str]"]) -> Timecode:
+    """
+    Reads the start timecode of a QuickTime or MP4 file from its first timecode track.
+    Shorthand for ``vtc.quicktime.read(path).timecode``.
+
+    :param path: The path of the file to read.
+
+    :returns: The start timecode of the file, at the framerate of its timecode track.
+
+    :raises ValueError: If the file has an invalid atom, or has no timecode track.
+    """
+    return read(path).timecode
+
+
+def _read_track(file: BinaryIO, trak: _Atom, path: str) -> Optional[TimecodeTrack]:
+    """
+    _read_track reads a trak atom, returning None if it is not a timecode track.
+    """
+    stbl = _find_path(file, trak, _SAMPLE_TABLE_PATH, path)
+    if stbl is None:
+        return None
+
+    description: Optional[bytes] = None
+    first_offset: Optional[int] = None
+
+    for atom_type, start, end in _iter_atoms(file, stbl[1], stbl[2], path):
+        if atom_type == b"stsd":
+            description = _read_first_entry(file, start, end, path)
+        elif atom_type in (b"stco", b"co64"):
+            first_offset = _read_first_offset(file, atom_type, start, end)
+
+    if description is None or first_offset is None:
+        return None
+
+    _, _, _, flags, timescale, frame_duration, number_of_frames = _TMCD_STRUCT.unpack(
+        description
+    )
+
+    file.seek(first_offset)
+    sample = _read_exact(file, 4, path)
+    signed = bool(flags & _TMCD_NEGATIVE_TIMES_OK)
+
+    return TimecodeTrack(
+        path=path,
+        timescale=timescale,
+        frame_duration=frame_duration,
+        number_of_frames=number_of_frames,
+        dropframe=bool(flags & _TMCD_DROP_FRAME),
+        frame=int.from_bytes(sample, "big", signed=signed),
+    )
+
+
+def _read_first_entry(
+    file: BinaryIO, start: int, end: int, path: str
+) -> Optional[bytes]:
+    """
+    _read_first_entry returns the fields of the first entry of a stsd atom if it is a
+    tmcd sample description, otherwise None.
+    """
+    file.seek(start + _TABLE_HEADER_STRUCT.size)
+    if end - file.tell() < _ATOM_HEADER_STRUCT.size + _TMCD_STRUCT.size:
+        return None
+
+    _, entry_type = _ATOM_HEADER_STRUCT.unpack(
+        _read_exact(file, _ATOM_HEADER_STRUCT.size, path)
+    )
+    if entry_type != b"tmcd":
+        return None
+
+    return _read_exact(file, _TMCD_STRUCT.size, path)
+
+
+def _read_first_offset(
+    file: BinaryIO, atom_type: bytes, start: int, end: int
+) -> Optional[int]:
+    """_read_first_offset returns the first chunk offset of a stco or co64 atom."""
+    offset_size = 8 if atom_type == b"co64" else 4
+    if end - start < _TABLE_HEADER_STRUCT.size + offset_size:
+        return None
+
+    file.seek(start)
+    _, count = _TABLE_HEADER_STRUCT.unpack(file.read(_TABLE_HEADER_STRUCT.size))
+    if not count:
+        return None
+
+    return int.from_bytes(file.read(offset_size), "big")
+
+
+def _find_path(
+    file: BinaryIO, atom: _Atom, atom_path: Sequence[bytes], path: str
+) -> Optional[_Atom]:
+    """
+    _find_path returns the first atom found by descending through the atom types of
+    atom_path, or None if one of them is missing.
+    """
+    for atom_type in atom_path:
+        found = next(_iter_atoms(file, atom[1], atom[2], path, atom_type), None)
+        if found is None:
+            return None
+        atom = found
+
+    return atom
+
+
+def _iter_atoms(
+    file: BinaryIO,
+    start: int,
+    end: int,
+    path: str,
+    atom_type: Optional[bytes] = None,
+) -> Iterator[_Atom]:
+    """
+    _iter_atoms yields the atoms between start and end, optionally filtered to a single
+    atom type. Only atom headers are read.
+    """
+    position = start
+    while end - position >= _ATOM_HEADER_STRUCT.size:
+        file.seek(position)
+        size, found_type = _ATOM_HEADER_STRUCT.unpack(
+            _read_exact(file, _ATOM_HEADER_STRUCT.size, path)
+        )
+        body_start = position + _ATOM_HEADER_STRUCT.size
+
+        # A size of 1 means the real size follows as 64 bits, and 0 means the atom runs
+        # to the end of its parent.
+        if size == 1:
+            (size,) = _ATOM_LARGE_SIZE_STRUCT.unpack(
+                _read_exact(file, _ATOM_LARGE_SIZE_STRUCT.size, path)
+            )
+            body_start += _ATOM_LARGE_SIZE_STRUCT.size
+        elif size == 0:
+            size = end - position
+
+        if size < body_start - position or position + size > end:
+            raise ValueError(f"{path} has an invalid atom at byte {position}")
+
+        if atom_type is None or found_type == atom_type:
+            yield found_type, body_start, position + size
+
+        position += size
+
+
+def _read_exact(file: BinaryIO, size: int, path: str) -> bytes:
+    """_read_exact reads size bytes from file, raising if the file ends first."""
+    data = file.read(size)
+    if len(data) < size:
+        raise ValueError(f"{path} ends unexpectedly at byte {file.tell()}")
+    return data
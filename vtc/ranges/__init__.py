@@ -0,0 +1,13 @@
+"""
+The ranges module contains bulk operations over many :class:`vtc.Range` values at once.
+"""
+
+# "noqa" setting stops flake8 from flagging unused imports in __init__
+
+from ._chunks import chunks  # noqa
+from ._frames import from_frames  # noqa
+from ._join import join, JoinMatch  # noqa
+from ._fuzzy import fuzzy_match, FuzzyMatch  # noqa
+from ._continuity import continuity, ContinuityReport, Junction  # noqa
+from ._tracks import allocate_tracks  # noqa
+from ._clusters import clusters, Cluster  # noqa
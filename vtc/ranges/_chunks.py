@@ -0,0 +1,41 @@
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .._range import Range, _validate_chunk_args
+
+
+def chunks(
+    ranges: Iterable[Range],
+    *,
+    size: Optional[int] = None,
+    count: Optional[int] = None,
+    align: Optional[int] = None,
+) -> Iterator[Tuple[Range, Range]]:
+    """
+    Lazily splits every range in ``ranges`` into chunks. This is the bulk version of
+    :func:`vtc.Range.chunks`, and takes the same arguments.
+
+    :param ranges: The ranges to split. May be any iterable, including a lazy one.
+
+    :returns: An iterator of ``(source, chunk)`` tuples, where ``source`` is the range
+        from ``ranges`` the ``chunk`` was cut from. Chunks are returned in the same
+        order as their source ranges.
+
+    :raises ValueError: If both or neither of ``size`` and ``count`` are set, or if any
+        argument is less than 1.
+    """
+    # Validate up-front so bad arguments are not reported lazily on first iteration.
+    _validate_chunk_args(size=size, count=count, align=align)
+    return _iter_chunks(ranges, size=size, count=count, align=align)
+
+
+def _iter_chunks(
+    ranges: Iterable[Range],
+    *,
+    size: Optional[int],
+    count: Optional[int],
+    align: Optional[int],
+) -> Iterator[Tuple[Range, Range]]:
+    """_iter_chunks is the lazy body of chunks."""
+    for source in ranges:
+        for chunk in source.chunks(size=size, count=count, align=align):
+            yield source, chunk
@@ -0,0 +1,104 @@
+from typing import Iterable, List, NamedTuple, Optional
+
+from .._range import Range
+from ._rates import _shared_rate
+
+
+class Cluster(NamedTuple):
+    """
+    Cluster is a group of connected ranges found by :func:`clusters`.
+    """
+
+    # The indexes of the members in the input, ordered by in point.
+    indexes: List[int]
+    # The member ranges, in the same order as indexes.
+    ranges: List[Range]
+    # The range from the earliest in point to the latest out point of the members.
+    range: Range
+
+
+def clusters(
+    ranges: Iterable[Range],
+    *,
+    max_gap: Optional[int] = None,
+) -> List[Cluster]:
+    """
+    Groups ranges into clusters of connected ranges, such as multicam sync groups or
+    shot pulls that can be consolidated into a single pull with handles.
+
+    Two ranges are connected if they overlap, and a cluster contains every range that
+    can be reached through a chain of connections. Ranges are sorted once and grouped
+    in a single sweep.
+
+    :param ranges: The ranges to cluster. Ranges do not need to be in order.
+
+    :param max_gap: When set, ranges are also connected if there are no more than this
+        many frames between them. ``0`` connects ranges that butt up against each
+        other.
+
+    :returns: The clusters, ordered by in point.
+
+    :raises ValueError: If ``max_gap`` is negative, or if the ranges do not all have
+        the same framerate.
+    """
+    if max_gap is not None and max_gap < 0:
+        raise ValueError(f"max_gap cannot be negative, got {max_gap}")
+
+    ranges = list(ranges)
+    rate = _shared_rate(ranges)
+    order = sorted(
+        range(len(ranges)),
+        key=lambda i: (ranges[i].frame_in, ranges[i].frame_out),
+    )
+
+    found: List[Cluster] = list()
+    if rate is None:
+        return found
+
+    indexes: List[int] = list()
+    cluster_in = 0
+    reach = 0
+
+    for index in order:
+        tc_range = ranges[index]
+        frame_in = tc_range.frame_in
+
+        if indexes and _connected(frame_in, reach, max_gap):
+            indexes.append(index)
+            reach = max(reach, tc_range.frame_out)
+            continue
+
+        if indexes:
+            found.append(_cluster(ranges, indexes, cluster_in, reach))
+
+        indexes = [index]
+        cluster_in = frame_in
+        reach = tc_range.frame_out
+
+    found.append(_cluster(ranges, indexes, cluster_in, reach))
+    return found
+
+
+def _connected(frame_in: int, reach: int, max_gap: Optional[int]) -> bool:
+    """
+    _connected returns whether a range starting at frame_in connects to a cluster whose
+    furthest out point is reach.
+    """
+    if max_gap is None:
+        return frame_in < reach
+    return frame_in <= reach + max_gap
+
+
+def _cluster(
+    ranges: List[Range],
+    indexes: List[int],
+    frame_in: int,
+    frame_out: int,
+) -> Cluster:
+    """_cluster builds a Cluster from the indexes of its members."""
+    members = [ranges[i] for i in indexes]
+    return Cluster(
+        indexes=indexes,
+        ranges=members,
+        range=Range._from_frames(frame_in, frame_out, members[0].rate),
+    )
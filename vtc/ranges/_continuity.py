@@ -0,0 +1,124 @@
+import heapq
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from .._range import Range
+from ._rates import _shared_rate
+
+
+class Junction(NamedTuple):
+    """
+    Junction describes how two ranges meet, as reported by :func:`continuity`.
+    """
+
+    # The index of the earlier range in the input.
+    before_index: int
+    # The index of the later range in the input.
+    after_index: int
+    before: Range
+    after: Range
+    # The range of the gap or overlap between the two ranges. Zero-length at the cut
+    # point for butt joins.
+    range: Range
+    # The length of range in frames.
+    frames: int
+
+
+class ContinuityReport(NamedTuple):
+    """
+    ContinuityReport holds every junction found by :func:`continuity`. Each list is
+    ordered by the in point of its junction ranges.
+    """
+
+    # Spans between the first in point and last out point not covered by any range. The
+    # before range is the range that reached furthest before the gap.
+    gaps: List[Junction]
+    # Every pair of ranges that overlap each other.
+    overlaps: List[Junction]
+    # Every pair of ranges where the out point of one is the in point of the other.
+    butt_joins: List[Junction]
+
+
+def continuity(ranges: Iterable[Range]) -> ContinuityReport:
+    """
+    Reports all gaps, overlaps and butt joins between ranges, such as the record ranges
+    of the events on a track. Ranges are sorted once and checked in a single sweep.
+
+    :param ranges: The ranges to check. Ranges do not need to be in order.
+
+    :returns: A :class:`ContinuityReport` for the ranges.
+
+    :raises ValueError: If the ranges do not all have the same framerate.
+    """
+    ranges = list(ranges)
+    rate = _shared_rate(ranges)
+    order = sorted(
+        range(len(ranges)),
+        key=lambda i: (ranges[i].frame_in, ranges[i].frame_out, i),
+    )
+
+    report = ContinuityReport(gaps=list(), overlaps=list(), butt_joins=list())
+    if rate is None:
+        return report
+
+    # Ranges indexed by their out points, for finding butt joins.
+    by_frame_out: Dict[int, List[int]] = dict()
+    # Heap of the ranges that are still open, ordered by out point.
+    open_ranges: List[Tuple[int, int]] = list()
+    # The index of the range with the furthest out point seen so far.
+    reach_index = order[0]
+
+    for index in order:
+        tc_range = ranges[index]
+        frame_in = tc_range.frame_in
+        frame_out = tc_range.frame_out
+
+        reach = ranges[reach_index].frame_out
+        if frame_in > reach:
+            report.gaps.append(_junction(ranges, reach_index, index, reach, frame_in))
+
+        for before_index in by_frame_out.get(frame_in, ()):
+            report.butt_joins.append(
+                _junction(ranges, before_index, index, frame_in, frame_in)
+            )
+
+        while open_ranges and open_ranges[0][0] <= frame_in:
+            heapq.heappop(open_ranges)
+
+        # Sort the overlaps of this range for a stable report, since heap order is
+        # arbitrary.
+        overlapping = sorted(
+            before_index
+            for before_out, before_index in open_ranges
+            if ranges[before_index].frame_in < frame_out
+        )
+        for before_index in overlapping:
+            overlap_out = min(frame_out, ranges[before_index].frame_out)
+            report.overlaps.append(
+                _junction(ranges, before_index, index, frame_in, overlap_out)
+            )
+
+        heapq.heappush(open_ranges, (frame_out, index))
+        by_frame_out.setdefault(frame_out, list()).append(index)
+        if frame_out > reach:
+            reach_index = index
+
+    return report
+
+
+def _junction(
+    ranges: List[Range],
+    before_index: int,
+    after_index: int,
+    frame_in: int,
+    frame_out: int,
+) -> Junction:
+    """_junction builds a Junction between two ranges."""
+    before = ranges[before_index]
+    return Junction(
+        before_index=before_index,
+        after_index=after_index,
+        before=before,
+        after=ranges[after_index],
+        range=Range._from_frames(frame_in, frame_out, before.rate),
+        frames=frame_out - frame_in,
+    )
@@ -0,0 +1,31 @@
+from typing import Iterable, List, Tuple
+
+from .._framerate import Framerate, FramerateSource
+from .._range import Range
+
+
+def from_frames(
+    frame_pairs: Iterable[Tuple[int, int]],
+    *,
+    rate: FramerateSource,
+) -> List[Range]:
+    """
+    Creates many ranges at once from ``(in, out)`` frame count pairs. This is the bulk
+    version of :func:`vtc.Range.from_frames`. The framerate is parsed once and shared by
+    every returned range.
+
+    :param frame_pairs: The in and out frame count of each range. Pairs where the out
+        point comes before the in point are flipped.
+
+    :param rate: The framerate of the ranges. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :returns: A list of ranges in the same order as ``frame_pairs``.
+    """
+    rate = Framerate(rate)
+    return [
+        Range._from_frames(frame_in, frame_out, rate)
+        if frame_in <= frame_out
+        else Range._from_frames(frame_out, frame_in, rate)
+        for frame_in, frame_out in frame_pairs
+    ]
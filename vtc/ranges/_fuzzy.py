@@ -0,0 +1,451 @@
+import bisect
+import heapq
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .._range import Range
+from ._rates import _shared_rate
+
+# The in and out frames of a range.
+_Points = Tuple[int, int]
+
+# A (distance, left points index, right points index) candidate pair.
+_Candidate = Tuple[int, int, int]
+
+# The source and sink nodes of the flow network built by _Matching, which are followed
+# by the nodes of the left and right points.
+_SOURCE = 0
+_SINK = 1
+
+
+class FuzzyMatch(NamedTuple):
+    """
+    FuzzyMatch is a single pair of ranges matched by :func:`fuzzy_match`.
+    """
+
+    # The index of the left range in the left input.
+    left_index: int
+    # The index of the right range in the right input.
+    right_index: int
+    left: Range
+    right: Range
+    # The number of frames the right in point is after the left in point. Negative if
+    # it comes before.
+    in_offset: int
+    # The number of frames the right out point is after the left out point. Negative if
+    # it comes before.
+    out_offset: int
+
+
+def fuzzy_match(
+    left: Iterable[Range],
+    right: Iterable[Range],
+    *,
+    tolerance: int = 0,
+    in_tolerance: Optional[int] = None,
+    out_tolerance: Optional[int] = None,
+    duration_tolerance: Optional[int] = None,
+) -> List[FuzzyMatch]:
+    """
+    Pairs up left and right ranges that are the same within a number of frames, such as
+    an old and a new VFX pull of a shot that has been trimmed by editorial.
+
+    Each range is matched at most once. The matching with the most pairs is chosen, and
+    of those, the one whose in and out points are closest in total. A closer pair is
+    given up when that lets both of its ranges be matched to others.
+
+    Ranges with the same in and out points are matched together, so repeated shots
+    cost no more than one. Candidates are found by binary searching the right ranges
+    sorted by in point rather than comparing every pair. Each group of ranges linked by
+    candidates is then matched on its own as a minimum cost flow.
+
+    :param left: The left ranges.
+
+    :param right: The right ranges.
+
+    :param tolerance: The default number of frames the in point, out point and duration
+        of a matched pair may differ by.
+
+    :param in_tolerance: Overrides ``tolerance`` for the in point.
+
+    :param out_tolerance: Overrides ``tolerance`` for the out point.
+
+    :param duration_tolerance: Overrides ``tolerance`` for the duration.
+
+    :returns: A list of :class:`FuzzyMatch` values ordered by left index. Ranges that
+        are not present were not matched.
+
+    :raises ValueError: If a tolerance is negative, or if the ranges do not all have
+        the same framerate.
+    """
+    in_tolerance = tolerance if in_tolerance is None else in_tolerance
+    out_tolerance = tolerance if out_tolerance is None else out_tolerance
+    if duration_tolerance is None:
+        duration_tolerance = tolerance
+
+    for name, value in (
+        ("tolerance", tolerance),
+        ("in_tolerance", in_tolerance),
+        ("out_tolerance", out_tolerance),
+        ("duration_tolerance", duration_tolerance),
+    ):
+        if value < 0:
+            raise ValueError(f"{name} cannot be negative, got {value}")
+
+    left = list(left)
+    right = list(right)
+    _shared_rate(left, right)
+
+    left_points, left_members = _unique_points(left)
+    right_points, right_members = _unique_points(right)
+
+    candidates = _candidates(
+        left_points,
+        right_points,
+        in_tolerance=in_tolerance,
+        out_tolerance=out_tolerance,
+        duration_tolerance=duration_tolerance,
+    )
+    candidates.sort()
+
+    matches: List[FuzzyMatch] = list()
+    for group in _groups(candidates, len(left_points), len(right_points)):
+        for left_index, right_index in _match_group(group, left_members, right_members):
+            left_range = left[left_index]
+            right_range = right[right_index]
+            matches.append(
+                FuzzyMatch(
+                    left_index=left_index,
+                    right_index=right_index,
+                    left=left_range,
+                    right=right_range,
+                    in_offset=right_range.frame_in - left_range.frame_in,
+                    out_offset=right_range.frame_out - left_range.frame_out,
+                )
+            )
+
+    matches.sort(key=lambda match: match.left_index)
+    return matches
+
+
+def _unique_points(ranges: List[Range]) -> Tuple[List[_Points], List[List[int]]]:
+    """
+    _unique_points returns the distinct in and out points of ranges, and the indexes of
+    the ranges with each.
+    """
+    members: Dict[_Points, List[int]] = dict()
+    for index, item in enumerate(ranges):
+        members.setdefault((item.frame_in, item.frame_out), list()).append(index)
+    return list(members), list(members.values())
+
+
+def _candidates(
+    left: List[_Points],
+    right: List[_Points],
+    *,
+    in_tolerance: int,
+    out_tolerance: int,
+    duration_tolerance: int,
+) -> List[_Candidate]:
+    """
+    _candidates returns a (distance, left index, right index) tuple for every pair of
+    points within tolerance.
+    """
+    right_order = sorted(range(len(right)), key=lambda i: right[i])
+    right_ins = [right[i][0] for i in right_order]
+
+    candidates: List[_Candidate] = list()
+
+    for left_index, (left_in, left_out) in enumerate(left):
+        left_duration = left_out - left_in
+
+        start = bisect.bisect_left(right_ins, left_in - in_tolerance)
+        stop = bisect.bisect_right(right_ins, left_in + in_tolerance)
+
+        for right_index in right_order[start:stop]:
+            right_in, right_out = right[right_index]
+
+            out_distance = abs(right_out - left_out)
+            if out_distance > out_tolerance:
+                continue
+
+            if abs((right_out - right_in) - left_duration) > duration_tolerance:
+                continue
+
+            distance = abs(right_in - left_in) + out_distance
+            candidates.append((distance, left_index, right_index))
+
+    return candidates
+
+
+def _groups(
+    candidates: List[_Candidate], left_count: int, right_count: int
+) -> List[List[_Candidate]]:
+    """
+    _groups splits candidates into groups that share no points, using a union-find
+    over the left and right points.
+    """
+    parents = list(range(left_count + right_count))
+
+    def find(node: int) -> int:
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    for _, left_index, right_index in candidates:
+        parents[find(left_index)] = find(left_count + right_index)
+
+    groups: Dict[int, List[_Candidate]] = dict()
+    for candidate in candidates:
+        groups.setdefault(find(candidate[1]), list()).append(candidate)
+    return list(groups.values())
+
+
+def _match_group(
+    group: List[_Candidate],
+    left_members: List[List[int]],
+    right_members: List[List[int]],
+) -> List[Tuple[int, int]]:
+    """
+    _match_group returns the (left index, right index) pairs of the best matching of a
+    group of candidates, handing out the ranges that share each point in order.
+    """
+    if len(group) == 1:
+        _, left_points, right_points = group[0]
+        count = min(len(left_members[left_points]), len(right_members[right_points]))
+        flows = [(left_points, right_points, count)]
+    else:
+        flows = _Matching(group, left_members, right_members).solve()
+
+    left_used: Dict[int, int] = dict()
+    right_used: Dict[int, int] = dict()
+    pairs: List[Tuple[int, int]] = list()
+
+    for left_points, right_points, count in flows:
+        left_start = left_used.get(left_points, 0)
+        right_start = right_used.get(right_points, 0)
+        left_end = left_used[left_points] = left_start + count
+        right_end = right_used[right_points] = right_start + count
+
+        pairs.extend(
+            zip(
+                left_members[left_points][left_start:left_end],
+                right_members[right_points][right_start:right_end],
+            )
+        )
+
+    return pairs
+
+
+class _Matching:
+    """
+    _Matching finds the best matching of a group of candidates as a minimum cost
+    maximum flow from the source, through the left and right points, to the sink. Each
+    point has a capacity of the number of ranges that share it.
+
+    It uses the primal-dual method. Dijkstra's algorithm, with node potentials keeping
+    the costs of residual edges non-negative, finds the cost of the cheapest augmenting
+    paths. Then, as in Dinic's algorithm, blocking flows are pushed along every
+    augmenting path of that cost, rather than searching the network again for each
+    pair. The cost of the cheapest path only takes a few values, so there are few
+    searches even for large groups.
+    """
+
+    def __init__(
+        self,
+        group: List[_Candidate],
+        left_members: List[List[int]],
+        right_members: List[List[int]],
+    ) -> None:
+        # The target, residual capacity and cost of each edge. Edges are added in
+        # pairs, so the reverse of edge e is e ^ 1.
+        self.targets: List[int] = list()
+        self.capacities: List[int] = list()
+        self.costs: List[int] = list()
+        # The edges out of each node.
+        self.adjacency: List[List[int]] = [list(), list()]
+        # The (left points, right points, edge) of each candidate.
+        self.pairs: List[Tuple[int, int, int]] = list()
+
+        left_nodes: Dict[int, int] = dict()
+        right_nodes: Dict[int, int] = dict()
+
+        for distance, left_points, right_points in group:
+            left_count = len(left_members[left_points])
+            right_count = len(right_members[right_points])
+
+            if left_points not in left_nodes:
+                left_nodes[left_points] = self._add_node()
+                self._add_edge(_SOURCE, left_nodes[left_points], left_count, 0)
+            if right_points not in right_nodes:
+                right_nodes[right_points] = self._add_node()
+                self._add_edge(right_nodes[right_points], _SINK, right_count, 0)
+
+            edge = self._add_edge(
+                left_nodes[left_points],
+                right_nodes[right_points],
+                min(left_count, right_count),
+                distance,
+            )
+            self.pairs.append((left_points, right_points, edge))
+
+        self.potentials = [0] * len(self.adjacency)
+
+    def solve(self) -> List[Tuple[int, int, int]]:
+        """
+        solve returns the (left points, right points, count) of each candidate used by
+        the best matching.
+        """
+        while self._update_potentials():
+            levels = self._levels()
+            while levels[_SINK] >= 0:
+                self._blocking_flow(levels)
+                levels = self._levels()
+
+        # The flow along an edge is the residual capacity of its reverse.
+        return [
+            (left_points, right_points, self.capacities[edge ^ 1])
+            for left_points, right_points, edge in self.pairs
+            if self.capacities[edge ^ 1]
+        ]
+
+    def _add_node(self) -> int:
+        """_add_node adds a node, returning its index."""
+        self.adjacency.append(list())
+        return len(self.adjacency) - 1
+
+    def _add_edge(self, source: int, target: int, capacity: int, cost: int) -> int:
+        """_add_edge adds an edge and its reverse, returning the index of the edge."""
+        edge = len(self.targets)
+        self.targets.extend((target, source))
+        self.capacities.extend((capacity, 0))
+        self.costs.extend((cost, -cost))
+        self.adjacency[source].append(edge)
+        self.adjacency[target].append(edge + 1)
+        return edge
+
+    def _admissible(self, edge: int, node: int) -> bool:
+        """
+        _admissible returns whether an edge out of node has residual capacity and lies
+        on a cheapest augmenting path, which is when its reduced cost is 0.
+        """
+        if not self.capacities[edge]:
+            return False
+        target = self.targets[edge]
+        return self.costs[edge] + self.potentials[node] == self.potentials[target]
+
+    def _update_potentials(self) -> bool:
+        """
+        _update_potentials runs Dijkstra's algorithm from the source until it reaches
+        the sink, and adds the distance of each node to its potential. Nodes it did not
+        reach are at least as far as the sink, so their distance is capped there, which
+        keeps every reduced cost non-negative. Returns False if the sink cannot be
+        reached.
+        """
+        potentials = self.potentials
+        distances: List[Optional[int]] = [None] * len(potentials)
+        heap = [(0, _SOURCE)]
+
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distances[node] is not None:
+                continue
+            distances[node] = distance
+            if node == _SINK:
+                break
+
+            for edge in self.adjacency[node]:
+                target = self.targets[edge]
+                if self.capacities[edge] and distances[target] is None:
+                    reduced = self.costs[edge] + potentials[node] - potentials[target]
+                    heapq.heappush(heap, (distance + reduced, target))
+
+        sink_distance = distances[_SINK]
+        if sink_distance is None:
+            return False
+
+        for node, reached in enumerate(distances):
+            potentials[node] += sink_distance if reached is None else reached
+        return True
+
+    def _levels(self) -> List[int]:
+        """
+        _levels returns the number of admissible edges on the shortest path from the
+        source to each node, or -1 for nodes with no admissible path.
+        """
+        levels = [-1] * len(self.adjacency)
+        levels[_SOURCE] = 0
+        queue = [_SOURCE]
+
+        position = 0
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            for edge in self.adjacency[node]:
+                target = self.targets[edge]
+                if levels[target] < 0 and self._admissible(edge, node):
+                    levels[target] = levels[node] + 1
+                    queue.append(target)
+
+        return levels
+
+    def _blocking_flow(self, levels: List[int]) -> None:
+        """
+        _blocking_flow pushes flow along admissible paths that go up a level at each
+        edge until none is left.
+        """
+        # The next edge to try out of each node. Edges that lead nowhere are never
+        # tried again.
+        next_edges = [0] * len(levels)
+
+        while True:
+            path = self._find_path(levels, next_edges)
+            if not path:
+                return
+
+            flow = min(self.capacities[edge] for edge in path)
+            for edge in path:
+                self.capacities[edge] -= flow
+                self.capacities[edge ^ 1] += flow
+
+    def _find_path(self, levels: List[int], next_edges: List[int]) -> List[int]:
+        """
+        _find_path returns the edges of an admissible path from the source to the sink,
+        or an empty list if there is none.
+        """
+        path: List[int] = list()
+        node = _SOURCE
+
+        while node != _SINK:
+            edge = self._next_edge(node, levels, next_edges)
+            if edge is not None:
+                path.append(edge)
+                node = self.targets[edge]
+                continue
+
+            if not path:
+                return path
+
+            # Back up out of the dead end, and skip the edge into it from now on.
+            node = self.targets[path.pop() ^ 1]
+            next_edges[node] += 1
+
+        return path
+
+    def _next_edge(
+        self, node: int, levels: List[int], next_edges: List[int]
+    ) -> Optional[int]:
+        """
+        _next_edge returns the next admissible edge out of node that goes up a level, or
+        None if there is none.
+        """
+        edges = self.adjacency[node]
+        while next_edges[node] < len(edges):
+            edge = edges[next_edges[node]]
+            if levels[self.targets[edge]] == levels[node] + 1 and self._admissible(
+                edge, node
+            ):
+                return edge
+            next_edges[node] += 1
+
+        return None
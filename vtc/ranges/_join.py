@@ -0,0 +1,212 @@
+import heapq
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .._range import Range
+from ._rates import _shared_rate
+
+
+class JoinMatch(NamedTuple):
+    """
+    JoinMatch is a single pair of ranges matched by :func:`join`.
+    """
+
+    # The index of the left range in the left input.
+    left_index: int
+    # The index of the right range in the right input.
+    right_index: int
+    left: Range
+    right: Range
+    # The overlap of the left and right ranges.
+    intersection: Range
+
+
+# The join methods supported by join.
+_JOIN_HOW = ("overlap", "contains", "within")
+
+# _Indexed is a range paired with its index in the caller's input.
+_Indexed = Tuple[int, Range]
+
+
+def join(
+    left: Iterable[Range],
+    right: Iterable[Range],
+    *,
+    how: str = "overlap",
+    left_keys: Optional[Iterable[Hashable]] = None,
+    right_keys: Optional[Iterable[Hashable]] = None,
+) -> Iterator[JoinMatch]:
+    """
+    Finds every pair of a left and right range that overlap each other.
+
+    Both sides are sorted once and scanned with a sweep line, so the cost is
+    ``O((n + m) log(n + m) + k)`` for ``k`` matches rather than comparing every pair.
+    A pair is matched when ``left in right`` would be ``True``.
+
+    :param left: The left ranges.
+
+    :param right: The right ranges.
+
+    :param how: Which overlapping pairs to return:
+
+        - ``"overlap"``: every overlapping pair.
+
+        - ``"contains"``: only pairs where the right range lies entirely within the
+          left range.
+
+        - ``"within"``: only pairs where the left range lies entirely within the
+          right range.
+
+    :param left_keys: When set, a key such as a reel or clip name for each left range.
+        Ranges are only matched against ranges with an equal key. Must be set along
+        with ``right_keys``.
+
+    :param right_keys: The key for each right range.
+
+    :returns: An iterator of :class:`JoinMatch` values, ordered by key (in the order
+        each key first appears in ``left``), then by the in point of the later-starting
+        range of each pair.
+
+    :raises ValueError: If ``how`` is not supported, if only one of ``left_keys`` and
+        ``right_keys`` is set, if a keys iterable is not the same length as its
+        ranges, or if the ranges do not all have the same framerate.
+    """
+    if how not in _JOIN_HOW:
+        raise ValueError(f"how must be one of {_JOIN_HOW}, got {repr(how)}")
+    if (left_keys is None) != (right_keys is None):
+        raise ValueError("left_keys and right_keys must be set together")
+
+    left = list(left)
+    right = list(right)
+    _shared_rate(left, right)
+
+    left_groups = _group(left, left_keys)
+    right_groups = _group(right, right_keys)
+
+    return _iter_join(left_groups, right_groups, how)
+
+
+def _iter_join(
+    left_groups: Dict[Hashable, List[_Indexed]],
+    right_groups: Dict[Hashable, List[_Indexed]],
+    how: str,
+) -> Iterator[JoinMatch]:
+    """_iter_join lazily sweeps each group shared by both sides."""
+    for key, left_group in left_groups.items():
+        right_group = right_groups.get(key)
+        if right_group is None:
+            continue
+        yield from _sweep(left_group, right_group, how)
+
+
+def _group(
+    ranges: Sequence[Range],
+    keys: Optional[Iterable[Hashable]],
+) -> Dict[Hashable, List[_Indexed]]:
+    """
+    _group splits the ranges into groups by key, keeping each range's index. All ranges
+    are placed in a single group if keys is None.
+    """
+    if keys is None:
+        return {None: list(enumerate(ranges))}
+
+    keys = list(keys)
+    if len(keys) != len(ranges):
+        raise ValueError(
+            f"got {len(keys)} keys for {len(ranges)} ranges, must have one key per "
+            f"range"
+        )
+
+    groups: Dict[Hashable, List[_Indexed]] = dict()
+    for index, (key, tc_range) in enumerate(zip(keys, ranges)):
+        groups.setdefault(key, list()).append((index, tc_range))
+
+    return groups
+
+
+def _sweep(
+    left: List[_Indexed],
+    right: List[_Indexed],
+    how: str,
+) -> Iterator[JoinMatch]:
+    """
+    _sweep finds the overlapping left and right pairs of a single group.
+
+    Ranges from both sides are visited in order of their in point. Each side keeps a
+    heap of the ranges that are still open, ordered by out point. When a range is
+    visited, the ranges on the other side that have closed by its in point are dropped,
+    and every range left open on the other side overlaps it.
+    """
+    # Tag each range with its side so both sides can be walked in a single sort. The
+    # index is included to make the ordering total without comparing ranges.
+    events = [(r.frame_in, 0, i, r) for i, r in left]
+    events.extend((r.frame_in, 1, i, r) for i, r in right)
+    events.sort(key=lambda event: (event[0], event[1], event[2]))
+
+    open_left: List[Tuple[int, int, Range]] = list()
+    open_right: List[Tuple[int, int, Range]] = list()
+
+    for frame_in, side, index, tc_range in events:
+        frame_out = tc_range.frame_out
+
+        if side == 0:
+            opened, others = open_left, open_right
+        else:
+            opened, others = open_right, open_left
+
+        while others and others[0][0] <= frame_in:
+            heapq.heappop(others)
+
+        for other_out, other_index, other in others:
+            # Every open range on the other side starts at or before this one and ends
+            # after it starts. It only overlaps if it also starts before this range
+            # ends, which fails for zero-length ranges that share an in point.
+            if other.frame_in >= frame_out:
+                continue
+
+            if side == 0:
+                match = _match(index, other_index, tc_range, other, how)
+            else:
+                match = _match(other_index, index, other, tc_range, how)
+
+            if match is not None:
+                yield match
+
+        heapq.heappush(opened, (frame_out, index, tc_range))
+
+
+def _match(
+    left_index: int,
+    right_index: int,
+    left: Range,
+    right: Range,
+    how: str,
+) -> Optional[JoinMatch]:
+    """
+    _match builds the JoinMatch for an overlapping pair, or returns None if the pair
+    does not satisfy how.
+    """
+    frame_in = max(left.frame_in, right.frame_in)
+    frame_out = min(left.frame_out, right.frame_out)
+
+    if how == "contains" and (frame_in, frame_out) != (right.frame_in, right.frame_out):
+        return None
+    if how == "within" and (frame_in, frame_out) != (left.frame_in, left.frame_out):
+        return None
+
+    return JoinMatch(
+        left_index=left_index,
+        right_index=right_index,
+        left=left,
+        right=right,
+        intersection=Range._from_frames(frame_in, frame_out, left.rate),
+    )
@@ -0,0 +1,26 @@
+from typing import Iterable, Optional
+
+from .._framerate import Framerate
+from .._range import Range
+
+
+def _shared_rate(*range_groups: Iterable[Range]) -> Optional[Framerate]:
+    """
+    _shared_rate returns the framerate shared by every range in range_groups, or None
+    if there are no ranges.
+
+    Bulk range operations compare bare frame counts, which is only valid when every
+    range is on the same frame timeline.
+
+    :raises ValueError: If the ranges do not all have the same framerate.
+    """
+    rate: Optional[Framerate] = None
+
+    for ranges in range_groups:
+        for tc_range in ranges:
+            if rate is None:
+                rate = tc_range.rate
+            elif tc_range.rate is not rate and tc_range.rate != rate:
+                raise ValueError("all ranges must have matching framerate")
+
+    return rate
@@ -0,0 +1,55 @@
+import heapq
+from typing import Iterable, List, Tuple
+
+from .._range import Range
+from ._rates import _shared_rate
+
+
+def allocate_tracks(ranges: Iterable[Range]) -> List[int]:
+    """
+    Assigns each range to the lowest track where it does not overlap any other range
+    on that track, such as when laying out overlapping clips for review.
+
+    Ranges are placed in order of their in points, each taking the lowest track that is
+    free at that point. This uses the fewest tracks possible, and runs in
+    ``O(n log n)`` by tracking busy and free tracks in heaps.
+
+    :param ranges: The ranges to allocate. Ranges do not need to be in order.
+
+    :returns: The zero-based track index for each range, in the same order as
+        ``ranges``.
+
+    :raises ValueError: If the ranges do not all have the same framerate.
+    """
+    ranges = list(ranges)
+    _shared_rate(ranges)
+
+    order = sorted(
+        range(len(ranges)),
+        key=lambda i: (ranges[i].frame_in, ranges[i].frame_out),
+    )
+
+    tracks = [0] * len(ranges)
+    # Heap of (out point, track) for tracks that hold a range which has not ended yet.
+    busy: List[Tuple[int, int]] = list()
+    # Heap of tracks that have been used before but are free again.
+    free: List[int] = list()
+    track_count = 0
+
+    for index in order:
+        tc_range = ranges[index]
+        frame_in = tc_range.frame_in
+
+        while busy and busy[0][0] <= frame_in:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+
+        if free:
+            track = heapq.heappop(free)
+        else:
+            track = track_count
+            track_count += 1
+
+        tracks[index] = track
+        heapq.heappush(busy, (tc_range.frame_out, track))
+
+    return tracks
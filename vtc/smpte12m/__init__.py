@@ -0,0 +1,16 @@
+"""
+The smpte12m module packs and unpacks the 64-bit binary timecode words defined by SMPTE
+12M, as carried by LTC, VITC and ancillary timecode.
+"""
+
+# "noqa" setting stops flake8 from flagging unused imports in __init__
+
+from ._word import (  # noqa
+    pack,
+    unpack,
+    pack_frames,
+    unpack_frames,
+    unpack_user_bits,
+    TimecodeWord,
+    WordsSource,
+)
@@ -0,0 +1,317 @@
+import struct
+from typing import Any, Iterable, NamedTuple, Sequence, Tuple, Union
+
+from .. import _compat
+from .._bcd import _frames_to_sections, _sections_to_frames
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode
+from .._timecode_sections import TimecodeSections
+
+WordsSource = Union[bytes, bytearray, memoryview, Iterable[int]]
+"""
+WordsSource is the types of values many SMPTE 12M words can be read from: a buffer of
+packed little-endian 64-bit words, an iterable of ints, or a NumPy integer array.
+"""
+
+# Bit positions of the SMPTE 12M word fields. Bit 0 is the first bit transmitted, and
+# the lowest bit of the word.
+_FRAME_UNITS_BIT = 0
+_FRAME_TENS_BIT = 8
+_DROP_FRAME_BIT = 10
+_COLOR_FRAME_BIT = 11
+_SECONDS_UNITS_BIT = 16
+_SECONDS_TENS_BIT = 24
+_MINUTES_UNITS_BIT = 32
+_MINUTES_TENS_BIT = 40
+_HOURS_UNITS_BIT = 48
+_HOURS_TENS_BIT = 56
+
+# The eight 4-bit user bit groups start 4 bits into each byte of the word.
+_USER_BITS_FIRST_BIT = 4
+
+_WORD_SIZE = 8
+
+
+class TimecodeWord(NamedTuple):
+    """TimecodeWord holds the fields of an SMPTE 12M word, as read by :func:`unpack`."""
+
+    sections: TimecodeSections
+    dropframe: bool
+    color_frame: bool
+    # The 32 user bits, with the first binary group in the lowest 4 bits.
+    user_bits: int
+
+    def timecode(self, rate: FramerateSource) -> Timecode:
+        """
+        Returns the timecode of the word.
+
+        :param rate: The framerate of the timecode. May be any value which can be
+            passed to the constructor of :class:`vtc.Framerate`. The drop-frame flag of
+            the word is ignored in favor of the framerate.
+
+        :raises ValueError: If rate does not have a whole-number timebase of 30 frames
+            or less.
+        """
+        rate = _word_rate(rate)
+        sections = self.sections
+        frames = _sections_to_frames(
+            sections.hours, sections.minutes, sections.seconds, sections.frames, rate
+        )
+        return Timecode._from_frames(frames, rate)
+
+
+def pack(timecode: Timecode, *, user_bits: int = 0, color_frame: bool = False) -> int:
+    """
+    Packs a timecode into a 64-bit SMPTE 12M word, as carried by LTC, VITC and
+    ancillary timecode. The drop-frame flag is set from the framerate of the timecode.
+
+    :param timecode: The timecode to pack. Timecodes are wrapped to 24 hours, as SMPTE
+        12M timecode rolls over at midnight.
+
+    :param user_bits: The 32 user bits, with the first binary group in the lowest 4
+        bits.
+
+    :param color_frame: Whether to set the color frame flag.
+
+    :returns: The packed word, with bit 0 of the word as the lowest bit.
+
+    :raises ValueError: If the framerate of timecode does not have a whole-number
+        timebase of 30 frames or less.
+    """
+    return pack_frames(
+        [timecode.frames],
+        rate=timecode.rate,
+        user_bits=user_bits,
+        color_frame=color_frame,
+    )[0]
+
+
+def unpack(word: int) -> TimecodeWord:
+    """
+    Unpacks the fields of a 64-bit SMPTE 12M word.
+
+    :param word: The word to unpack, with bit 0 of the word as the lowest bit.
+    """
+    hours, minutes, seconds, frames = _unpack_sections(word)
+    return TimecodeWord(
+        sections=TimecodeSections(
+            negative=False,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            frames=frames,
+        ),
+        dropframe=bool((word >> _DROP_FRAME_BIT) & 0x1),
+        color_frame=bool((word >> _COLOR_FRAME_BIT) & 0x1),
+        user_bits=_unpack_user_bits(word),
+    )
+
+
+def pack_frames(
+    frames: Iterable[int],
+    *,
+    rate: FramerateSource,
+    user_bits: int = 0,
+    color_frame: bool = False,
+) -> Sequence[int]:
+    """
+    Packs many frame counts into 64-bit SMPTE 12M words at once using integer
+    arithmetic. When ``frames`` is a NumPy array, all words are packed at once without
+    creating a Python object per word.
+
+    :param frames: The frame counts to pack. Frame counts are wrapped to 24 hours, as
+        SMPTE 12M timecode rolls over at midnight. May be a NumPy array.
+
+    :param rate: The framerate of the frame counts. May be any value which can be
+        passed to the constructor of :class:`vtc.Framerate`. The drop-frame flag is set
+        from the framerate.
+
+    :param user_bits: The 32 user bits of every word, with the first binary group in
+        the lowest 4 bits.
+
+    :param color_frame: Whether to set the color frame flag of every word.
+
+    :returns: The packed words. When ``frames`` is a NumPy array, a NumPy ``uint64``
+        array is returned, otherwise a list.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase of 30 frames
+        or less.
+    """
+    rate = _word_rate(rate)
+    flags = (rate.dropframe << _DROP_FRAME_BIT) | (color_frame << _COLOR_FRAME_BIT)
+    flags |= _pack_user_bits(user_bits)
+
+    frames_per_day = _frames_per_day(rate)
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(frames, numpy.ndarray):
+        days_frames = numpy.mod(frames.astype(numpy.int64), frames_per_day)
+        sections = _frames_to_sections(days_frames, rate)
+        packed = _pack_sections(*sections).astype(numpy.uint64)
+        return numpy.bitwise_or(packed, numpy.uint64(flags))
+
+    return [
+        _pack_sections(*_frames_to_sections(frame % frames_per_day, rate)) | flags
+        for frame in frames
+    ]
+
+
+def unpack_frames(words: WordsSource, *, rate: FramerateSource) -> Sequence[int]:
+    """
+    Unpacks many 64-bit SMPTE 12M words into frame counts at once using integer
+    arithmetic. Buffers are read in place without copying when NumPy is installed, and
+    all words are unpacked at once without creating a Python object per word.
+
+    :param words: The words to unpack. May be a ``bytes``, ``bytearray`` or
+        ``memoryview`` of packed little-endian words, an iterable of ints or a NumPy
+        integer array.
+
+    :param rate: The framerate of the timecodes. May be any value which can be passed
+        to the constructor of :class:`vtc.Framerate`. The drop-frame flag of the words
+        is ignored in favor of the framerate.
+
+    :returns: The frame count of each word. When ``words`` is a NumPy array, or a
+        buffer and NumPy is installed, a NumPy ``int64`` array is returned, otherwise a
+        list.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase of 30 frames
+        or less, or a buffer is not a whole number of words long.
+    """
+    rate = _word_rate(rate)
+    words = _read_words(words)
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(words, numpy.ndarray):
+        return _sections_to_frames(*_unpack_sections(_signed_words(words)), rate)
+
+    return [_sections_to_frames(*_unpack_sections(word), rate) for word in words]
+
+
+def unpack_user_bits(words: WordsSource) -> Sequence[int]:
+    """
+    Unpacks the user bits of many 64-bit SMPTE 12M words at once. Buffers are read in
+    place without copying when NumPy is installed.
+
+    :param words: The words to unpack. May be a ``bytes``, ``bytearray`` or
+        ``memoryview`` of packed little-endian words, an iterable of ints or a NumPy
+        integer array.
+
+    :returns: The 32 user bits of each word, with the first binary group in the lowest
+        4 bits. When ``words`` is a NumPy array, or a buffer and NumPy is installed, a
+        NumPy ``int64`` array is returned, otherwise a list.
+
+    :raises ValueError: If a buffer is not a whole number of words long.
+    """
+    words = _read_words(words)
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(words, numpy.ndarray):
+        return _unpack_user_bits(_signed_words(words))
+
+    return [_unpack_user_bits(word) for word in words]
+
+
+def _word_rate(rate: FramerateSource) -> Framerate:
+    """
+    _word_rate parses rate, checking that it can be carried by SMPTE 12M words, which
+    have two bits for the tens of frames.
+    """
+    rate = Framerate(rate)
+    timebase = rate.timebase
+    if timebase.denominator != 1 or timebase > 30:
+        raise ValueError(
+            "SMPTE 12M words require a whole-number timebase of 30 frames or less, got"
+            f" {timebase}"
+        )
+    return rate
+
+
+def _frames_per_day(rate: Framerate) -> int:
+    """_frames_per_day returns the number of frames in 24 hours of timecode."""
+    frames: int = _sections_to_frames(24, 0, 0, 0, rate)
+    return frames
+
+
+def _read_words(words: WordsSource) -> Iterable[int]:
+    """
+    _read_words reads buffers of packed little-endian words as a NumPy array viewing
+    the buffer when NumPy is installed, or as an iterator of ints when it is not.
+    """
+    if not isinstance(words, (bytes, bytearray, memoryview)):
+        return words
+
+    size = memoryview(words).nbytes
+    if size % _WORD_SIZE != 0:
+        raise ValueError(
+            f"word buffer length must be a multiple of {_WORD_SIZE}, got {size}"
+        )
+
+    numpy = _compat.numpy
+    if numpy is not None:
+        return numpy.frombuffer(words, dtype="<u8")
+
+    return (word for (word,) in struct.iter_unpack("<Q", words))
+
+
+def _signed_words(words: Any) -> Any:
+    """
+    _signed_words returns a NumPy array of words as signed 64-bit ints, as NumPy cannot
+    mix unsigned 64-bit ints with Python ints. Native unsigned words are viewed in place
+    rather than copied.
+    """
+    numpy = _compat.numpy
+    dtype = words.dtype
+    if dtype.kind == "u" and dtype.itemsize == 8 and dtype.isnative:
+        return words.view(numpy.int64)
+    return words.astype(numpy.int64, copy=False)
+
+
+def _pack_sections(hours: Any, minutes: Any, seconds: Any, frames: Any) -> Any:
+    """
+    _pack_sections packs timecode sections into the BCD digits of SMPTE 12M words.
+    Works on both ints and NumPy integer arrays of sections.
+    """
+    return (
+        (frames % 10) << _FRAME_UNITS_BIT
+        | (frames // 10) << _FRAME_TENS_BIT
+        | (seconds % 10) << _SECONDS_UNITS_BIT
+        | (seconds // 10) << _SECONDS_TENS_BIT
+        | (minutes % 10) << _MINUTES_UNITS_BIT
+        | (minutes // 10) << _MINUTES_TENS_BIT
+        | (hours % 10) << _HOURS_UNITS_BIT
+        | (hours // 10) << _HOURS_TENS_BIT
+    )
+
+
+def _unpack_sections(word: Any) -> Tuple[Any, Any, Any, Any]:
+    """
+    _unpack_sections unpacks the hours, minutes, seconds and frames of SMPTE 12M words.
+    Works on both ints and NumPy integer arrays of words.
+    """
+    return (
+        ((word >> _HOURS_UNITS_BIT) & 0xF) + ((word >> _HOURS_TENS_BIT) & 0x3) * 10,
+        ((word >> _MINUTES_UNITS_BIT) & 0xF) + ((word >> _MINUTES_TENS_BIT) & 0x7) * 10,
+        ((word >> _SECONDS_UNITS_BIT) & 0xF) + ((word >> _SECONDS_TENS_BIT) & 0x7) * 10,
+        ((word >> _FRAME_UNITS_BIT) & 0xF) + ((word >> _FRAME_TENS_BIT) & 0x3) * 10,
+    )
+
+
+def _pack_user_bits(user_bits: int) -> int:
+    """_pack_user_bits spreads 32 user bits into the binary groups of a word."""
+    word = 0
+    for group in range(8):
+        nibble = (user_bits >> (group * 4)) & 0xF
+        word |= nibble << (_USER_BITS_FIRST_BIT + group * 8)
+    return word
+
+
+def _unpack_user_bits(word: Any) -> Any:
+    """
+    _unpack_user_bits gathers the binary groups of SMPTE 12M words into 32 user bits.
+    Works on both ints and NumPy integer arrays of words.
+    """
+    user_bits = 0
+    for group in range(8):
+        nibble = (word >> (_USER_BITS_FIRST_BIT + group * 8)) & 0xF
+        user_bits = user_bits | (nibble << (group * 4))
+    return user_bits
@@ -0,0 +1,9 @@
+"""
+The vitc module decodes vertical interval timecode (VITC) from the VBI lines of
+uncompressed video.
+"""
+
+# "noqa" setting stops flake8 from flagging unused imports in __init__
+
+from ._decode import decode  # noqa
+from ._video import decode_uyvy, decode_v210  # noqa
@@ -0,0 +1,202 @@
+import fractions
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .. import _compat
+from .._framerate import Framerate, FramerateSource
+from .._timecode import Timecode
+from ..smpte12m import unpack_frames
+from ..smpte12m._word import _word_rate
+
+# VITC codewords are nine groups of a 1, 0 sync pair followed by 8 bits. The first
+# eight groups carry the 64 bits of the SMPTE 12M word, and the last carries the CRC.
+_GROUP_BITS = 10
+_CODEWORD_BITS = 90
+_WORD_GROUPS = 8
+_CRC_BITS = 8
+
+_SYNC_ONES = tuple(range(0, _CODEWORD_BITS, _GROUP_BITS))
+_SYNC_ZEROS = tuple(index + 1 for index in _SYNC_ONES)
+_DATA_BITS = tuple(
+    group * _GROUP_BITS + 2 + bit for group in range(_WORD_GROUPS) for bit in range(8)
+)
+
+# VITC bits last 1/115 of a line of 525-line video, and 1/116 of a line of 625-line
+# video. Sampled at the Rec. 601 13.5 MHz rate, lines are 858 and 864 samples long, of
+# which the 720 samples of the active line are stored.
+_ACTIVE_WIDTH = 720
+_SAMPLES_PER_BIT_525 = fractions.Fraction(858, 115)
+_SAMPLES_PER_BIT_625 = fractions.Fraction(864, 116)
+
+# Frames are decoded this many at a time, so memory use does not grow with the number
+# of frames.
+_CHUNK_FRAMES = 4096
+
+
+def decode(lines: Any, *, rate: FramerateSource) -> List[Optional[Timecode]]:
+    """
+    Decodes the VITC in the luma of the VBI lines of video frames. When ``lines`` is a
+    NumPy array, a chunk of frames is thresholded, sampled and CRC checked at once
+    without a Python loop per line.
+
+    Each line is thresholded halfway between its darkest and brightest samples, and the
+    codeword is read from the first rising edge. Lines are assumed to span the Rec. 601
+    active line, 720 samples wide for both 525 and 625-line video, and bit lengths are
+    scaled for other widths. Lines whose sync bits or CRC do not check out are skipped.
+
+    :param lines: The luma samples of the lines that may carry VITC, indexed by frame,
+        line and sample. May be a NumPy array of shape ``(frames, lines, width)`` of any
+        bit depth, or nested sequences of ints.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`. Framerates with a 25 frame timebase
+        are read as 625-line video, and others as 525-line video.
+
+    :returns: The timecode of the first valid line of each frame, or None for frames
+        with no valid line.
+
+    :raises ValueError: If ``rate`` does not have a whole-number timebase of 30 frames
+        or less.
+    """
+    rate = _word_rate(rate)
+
+    numpy = _compat.numpy
+    if numpy is not None and isinstance(lines, numpy.ndarray):
+        timecodes: List[Optional[Timecode]] = list()
+        for first in range(0, len(lines), _CHUNK_FRAMES):
+            end = first + _CHUNK_FRAMES
+            timecodes.extend(_decode_frames_array(lines[first:end], rate))
+        return timecodes
+
+    return [_decode_frame(frame_lines, rate) for frame_lines in lines]
+
+
+def _samples_per_bit(rate: Framerate, width: int) -> float:
+    """_samples_per_bit returns the length of a VITC bit in lines of a given width."""
+    if rate.timebase == 25:
+        samples_per_bit = _SAMPLES_PER_BIT_625
+    else:
+        samples_per_bit = _SAMPLES_PER_BIT_525
+    return float(samples_per_bit * width / _ACTIVE_WIDTH)
+
+
+def _decode_frames_array(frames: Any, rate: Framerate) -> List[Optional[Timecode]]:
+    """
+    _decode_frames_array is the NumPy implementation of decoding each frame with
+    :func:`_decode_frame`.
+    """
+    numpy = _compat.numpy
+    frame_count, line_count, width = frames.shape
+    if line_count == 0 or width == 0:
+        return [None] * frame_count
+
+    words, valid = _read_words_array(
+        frames.reshape(frame_count * line_count, width),
+        _samples_per_bit(rate, width),
+    )
+
+    # Take the first valid line of each frame.
+    valid = valid.reshape(frame_count, line_count)
+    first_valid = valid.argmax(axis=1)
+    words = words.reshape(frame_count, line_count)[
+        numpy.arange(frame_count), first_valid
+    ]
+    has_timecode = valid.any(axis=1).tolist()
+
+    frame_counts: Any = unpack_frames(words, rate=rate)
+    return [
+        Timecode._from_frames(frame, rate) if found else None
+        for frame, found in zip(frame_counts.tolist(), has_timecode)
+    ]
+
+
+def _read_words_array(lines: Any, samples_per_bit: float) -> Tuple[Any, Any]:
+    """
+    _read_words_array is the NumPy implementation of :func:`_read_word`, returning the
+    word of each line of a 2D array of lines and whether it is valid.
+    """
+    numpy = _compat.numpy
+    line_count, width = lines.shape
+    rows = numpy.arange(line_count)
+
+    # Compare doubled samples to the sum of the extremes, to threshold halfway between
+    # them with integer arithmetic.
+    levels = lines.astype(numpy.int32)
+    midpoints = levels.min(axis=1) + levels.max(axis=1)
+    high = levels * 2 > midpoints[:, None]
+
+    start = high.argmax(axis=1)
+    offsets = ((numpy.arange(_CODEWORD_BITS) + 0.5) * samples_per_bit).astype(
+        numpy.int64
+    )
+    positions = start[:, None] + offsets
+    valid = high[rows, start] & (positions[:, -1] < width)
+
+    positions = numpy.minimum(positions, width - 1)
+    bits = high[rows[:, None], positions].astype(numpy.uint8)
+
+    valid &= (bits[:, _SYNC_ONES] == 1).all(axis=1)
+    valid &= (bits[:, _SYNC_ZEROS] == 0).all(axis=1)
+
+    # With the x^8 + 1 CRC polynomial, every eighth bit of a codeword XORs to 0.
+    padded = numpy.zeros((line_count, _CODEWORD_BITS + 6), dtype=numpy.uint8)
+    padded[:, :_CODEWORD_BITS] = bits
+    parity = padded.reshape(line_count, -1, _CRC_BITS).sum(axis=1) % 2
+    valid &= ~parity.any(axis=1)
+
+    data = numpy.ascontiguousarray(bits[:, _DATA_BITS])
+    words = numpy.packbits(data, axis=1, bitorder="little").view("<u8").ravel()
+    return words, valid
+
+
+def _decode_frame(
+    frame_lines: Sequence[Sequence[int]], rate: Framerate
+) -> Optional[Timecode]:
+    """
+    _decode_frame returns the timecode of the first line of a frame with a valid VITC
+    codeword.
+    """
+    for line in frame_lines:
+        word = _read_word(line, _samples_per_bit(rate, len(line)))
+        if word is not None:
+            (frame,) = unpack_frames([word], rate=rate)
+            return Timecode._from_frames(frame, rate)
+
+    return None
+
+
+def _read_word(line: Sequence[int], samples_per_bit: float) -> Optional[int]:
+    """
+    _read_word reads the VITC codeword of a line, returning its SMPTE 12M word, or None
+    if the line does not have a valid codeword.
+    """
+    if not line:
+        return None
+
+    midpoint = min(line) + max(line)
+    high = [sample * 2 > midpoint for sample in line]
+    if True not in high:
+        return None
+
+    start = high.index(True)
+    positions = [
+        start + int((index + 0.5) * samples_per_bit) for index in range(_CODEWORD_BITS)
+    ]
+    if positions[-1] >= len(line):
+        return None
+
+    bits = [int(high[position]) for position in positions]
+    if not _check_codeword(bits):
+        return None
+
+    return sum(bits[position] << index for index, position in enumerate(_DATA_BITS))
+
+
+def _check_codeword(bits: List[int]) -> bool:
+    """_check_codeword returns whether the sync bits and CRC of a codeword are valid."""
+    if any(bits[index] != 1 for index in _SYNC_ONES):
+        return False
+    if any(bits[index] != 0 for index in _SYNC_ZEROS):
+        return False
+
+    # With the x^8 + 1 CRC polynomial, every eighth bit of a codeword XORs to 0.
+    return not any(sum(bits[offset::_CRC_BITS]) % 2 for offset in range(_CRC_BITS))
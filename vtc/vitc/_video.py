@@ -0,0 +1,186 @@
+import mmap
+import os
+import struct
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from .. import _compat
+from .._framerate import FramerateSource
+from .._timecode import Timecode
+from ..smpte12m._word import _word_rate
+from ._decode import _CHUNK_FRAMES, decode
+
+# v210 packs three 10-bit components into each 32-bit word, and six pixels into each
+# block of four words. Lines are padded to a multiple of 48 pixels.
+_V210_BLOCK_PIXELS = 6
+_V210_BLOCK_WORDS = 4
+_V210_LINE_ALIGN_PIXELS = 48
+_V210_LINE_ALIGN_BYTES = 128
+
+# The word and bit offset of the luma of each pixel of a v210 block.
+_V210_LUMA = ((0, 10), (1, 0), (1, 20), (2, 10), (3, 0), (3, 20))
+
+_V210_COMPONENT_MASK = 0x3FF
+
+# Slices the luma of the given lines of a chunk of frames from mapped video as a NumPy
+# array.
+_ArrayReader = Callable[[Any, int, int, List[int]], Any]
+
+# Reads the luma of the line at a byte offset into mapped video.
+_LineReader = Callable[[Any, int], List[int]]
+
+
+def decode_uyvy(
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    rate: FramerateSource,
+    width: int,
+    height: int,
+    lines: Sequence[int],
+) -> List[Optional[Timecode]]:
+    """
+    Decodes the VITC in a raw file of 8-bit 4:2:2 UYVY video frames. The file is memory
+    mapped rather than read, and when NumPy is installed the luma of the VITC lines is
+    sliced from the mapped data a chunk of frames at a time. See :func:`decode`.
+
+    :param path: The path of the file to decode.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param width: The width of the frames in pixels.
+
+    :param height: The height of the frames in lines, including any VBI lines.
+
+    :param lines: The index of each line of the frame that may carry VITC, counting
+        from 0 at the top of the frame. Lines are tried in order.
+
+    :returns: The timecode of the first valid line of each whole frame in the file, or
+        None for frames with no valid line.
+
+    :raises ValueError: If a line is outside of the frame, or ``rate`` does not have a
+        whole-number timebase of 30 frames or less.
+    """
+    line_size = width * 2
+
+    def read_array(mapped: Any, first: int, end: int, rows: List[int]) -> Any:
+        numpy = _compat.numpy
+        frames = numpy.frombuffer(mapped, numpy.uint8, end * height * line_size)
+        frames = frames.reshape(end, height, line_size)[first:, rows]
+        return frames[..., 1::2]
+
+    def read_line(mapped: Any, offset: int) -> List[int]:
+        start = offset + 1
+        end = offset + line_size
+        return list(mapped[start:end:2])
+
+    return _decode_video(path, rate, height, line_size, lines, read_array, read_line)
+
+
+def decode_v210(
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    rate: FramerateSource,
+    width: int,
+    height: int,
+    lines: Sequence[int],
+) -> List[Optional[Timecode]]:
+    """
+    Decodes the VITC in a raw file of 10-bit 4:2:2 v210 video frames. The file is
+    memory mapped rather than read, and when NumPy is installed the luma of the VITC
+    lines is unpacked from the mapped data a chunk of frames at a time. See
+    :func:`decode`.
+
+    :param path: The path of the file to decode.
+
+    :param rate: The framerate of the timecode. May be any value which can be passed to
+        the constructor of :class:`vtc.Framerate`.
+
+    :param width: The width of the frames in pixels. Lines are padded to a multiple of
+        48 pixels.
+
+    :param height: The height of the frames in lines, including any VBI lines.
+
+    :param lines: The index of each line of the frame that may carry VITC, counting
+        from 0 at the top of the frame. Lines are tried in order.
+
+    :returns: The timecode of the first valid line of each whole frame in the file, or
+        None for frames with no valid line.
+
+    :raises ValueError: If a line is outside of the frame, or ``rate`` does not have a
+        whole-number timebase of 30 frames or less.
+    """
+    line_size = -(-width // _V210_LINE_ALIGN_PIXELS) * _V210_LINE_ALIGN_BYTES
+    blocks = -(-width // _V210_BLOCK_PIXELS)
+    block_words = blocks * _V210_BLOCK_WORDS
+
+    def read_array(mapped: Any, first: int, end: int, rows: List[int]) -> Any:
+        numpy = _compat.numpy
+        frames = numpy.frombuffer(mapped, "<u4", end * height * line_size // 4)
+        frames = frames.reshape(end, height, line_size // 4)[first:, rows]
+        words = frames[..., :block_words].reshape(
+            frames.shape[:2] + (blocks, _V210_BLOCK_WORDS)
+        )
+        luma = numpy.stack(
+            [words[..., word] >> shift for word, shift in _V210_LUMA], axis=-1
+        )
+        luma = luma.reshape(frames.shape[:2] + (-1,))[..., :width]
+        return luma & _V210_COMPONENT_MASK
+
+    def read_line(mapped: Any, offset: int) -> List[int]:
+        words = struct.unpack_from(f"<{block_words}I", mapped, offset)
+        luma = [
+            (words[block + word] >> shift) & _V210_COMPONENT_MASK
+            for block in range(0, block_words, _V210_BLOCK_WORDS)
+            for word, shift in _V210_LUMA
+        ]
+        return luma[:width]
+
+    return _decode_video(path, rate, height, line_size, lines, read_array, read_line)
+
+
+def _decode_video(
+    path: Union[str, "os.PathLike[str]"],
+    rate: FramerateSource,
+    height: int,
+    line_size: int,
+    lines: Sequence[int],
+    read_array: _ArrayReader,
+    read_line: _LineReader,
+) -> List[Optional[Timecode]]:
+    """
+    _decode_video memory maps a raw video file and decodes the VITC of each whole
+    frame.
+    """
+    rate = _word_rate(rate)
+    rows = list(lines)
+    for row in rows:
+        if row < 0 or row >= height:
+            raise ValueError(f"line must be between 0 and {height - 1}, got {row}")
+
+    path = os.fspath(path)
+    frame_size = height * line_size
+    with open(path, "rb") as file:
+        frame_count = os.fstat(file.fileno()).st_size // frame_size
+        if frame_count == 0:
+            return list()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _compat.numpy is None:
+                frames = (
+                    [
+                        read_line(mapped, frame * frame_size + row * line_size)
+                        for row in rows
+                    ]
+                    for frame in range(frame_count)
+                )
+                return decode(frames, rate=rate)
+
+            timecodes: List[Optional[Timecode]] = list()
+            for first in range(0, frame_count, _CHUNK_FRAMES):
+                end = min(first + _CHUNK_FRAMES, frame_count)
+                luma = read_array(mapped, first, end, rows)
+                timecodes.extend(decode(luma, rate=rate))
+                # Release the view of the mapped data so the map can be closed.
+                del luma
+
+    return timecodes
@@ -0,0 +1,139 @@
+import os
+import pathlib
+import struct
+import tempfile
+import unittest
+import vtc
+
+from typing import Optional
+
+
+def _chunk(chunk_id: bytes, body: bytes, size: Optional[int] = None) -> bytes:
+    if size is None:
+        size = len(body)
+    padding = b"\x00" if len(body) % 2 else b""
+    return struct.pack("<4sI", chunk_id, size) + body + padding
+
+
+def _fmt(sample_rate: int) -> bytes:
+    body = struct.pack("<HHIIHH", 1, 2, sample_rate, sample_rate * 6, 6, 24)
+    return _chunk(b"fmt ", body)
+
+
+def _bext(time_reference: int) -> bytes:
+    body = b"description".ljust(256, b"\x00")
+    body += b"vtc".ljust(32, b"\x00") + bytes(32)
+    body += b"2021-01-01" + b"12:00:00"
+    body += struct.pack("<Q", time_reference)
+    body += bytes(602 - len(body))
+    return _chunk(b"bext", body)
+
+
+def _wave(*chunks: bytes, riff_id: bytes = b"RIFF") -> bytes:
+    body = b"WAVE" + b"".join(chunks)
+    return struct.pack("<4sI", riff_id, len(body)) + body
+
+
+class TestBWF(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, data: bytes) -> pathlib.Path:
+        path = self.dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def test_read(self) -> None:
+        # 01:00:00:00 @ 23.98 is 3603.6 seconds.
+        path = self.write(
+            "a.wav",
+            _wave(
+                _fmt(48000),
+                _chunk(b"junk", b"odd"),
+                _chunk(b"data", bytes(1200)),
+                _bext(172972800),
+            ),
+        )
+
+        info = vtc.bwf.read(path)
+        self.assertEqual(str(path), info.path, "path")
+        self.assertEqual(48000, info.sample_rate, "sample rate")
+        self.assertEqual(172972800, info.time_reference, "time reference")
+
+        tc = vtc.bwf.start_timecode(path, rate=vtc.RATE.F23_98)
+        self.assertEqual(vtc.Timecode("01:00:00:00", rate=vtc.RATE.F23_98), tc)
+        self.assertEqual("01:00:00:00", tc.timecode)
+
+        tc = info.timecode(vtc.RATE.F24)
+        self.assertEqual("01:00:03:14", tc.timecode, "real time at 24")
+
+    def test_read_bext_first(self) -> None:
+        path = self.write("a.wav", _wave(_bext(96000 * 10), _fmt(96000)))
+        tc = vtc.bwf.start_timecode(path, rate=vtc.Framerate(25))
+        self.assertEqual("00:00:10:00", tc.timecode)
+
+    def test_read_rf64(self) -> None:
+        """
+        test_read_rf64 tests that the data size of RF64 files is taken from the ds64
+        chunk when skipping the data chunk.
+        """
+        ds64 = _chunk(b"ds64", struct.pack("<QQQI", 0, 1000, 0, 0))
+        data = _chunk(b"data", bytes(1000), size=0xFFFFFFFF)
+        path = self.write(
+            "a.wav", _wave(ds64, _fmt(48000), data, _bext(48000), riff_id=b"RF64")
+        )
+        self.assertEqual(48000, vtc.bwf.read(path).time_reference)
+
+    def test_read_errors(self) -> None:
+        cases = [
+            ("not_wave.wav", b"RIFF\x00\x00\x00\x00AVI ", "is not a RIFF WAVE file"),
+            ("short.wav", b"RIFF", "is not a RIFF WAVE file"),
+            ("no_fmt.wav", _wave(_bext(0)), "has no fmt chunk"),
+            ("no_bext.wav", _wave(_fmt(48000)), "has no bext chunk"),
+            (
+                "truncated.wav",
+                _wave(_fmt(48000), _chunk(b"bext", bytes(100))),
+                "has a truncated chunk",
+            ),
+        ]
+
+        for name, data, message in cases:
+            with self.subTest(name):
+                path = self.write(name, data)
+                with self.assertRaises(ValueError) as error:
+                    vtc.bwf.read(path)
+                self.assertEqual(f"{path} {message}", str(error.exception))
+
+    def test_scan(self) -> None:
+        self.write("b.wav", _wave(_fmt(48000), _bext(48000)))
+        self.write("a.BWF", _wave(_fmt(48000), _bext(0)))
+        self.write("plain.wav", _wave(_fmt(48000)))
+        self.write("notes.txt", b"not audio")
+        self.write(os.path.join("day2", "c.wav"), _wave(_fmt(48000), _bext(96000)))
+
+        result = list(vtc.bwf.scan(self.dir, rate=24, max_workers=2))
+        self.assertEqual(
+            [
+                (str(self.dir / "a.BWF"), vtc.Timecode(0, rate=24)),
+                (str(self.dir / "b.wav"), vtc.Timecode(24, rate=24)),
+            ],
+            result,
+            "top level files",
+        )
+
+        result = list(vtc.bwf.scan(self.dir, rate=24, recursive=True))
+        self.assertEqual(
+            [
+                str(self.dir / "a.BWF"),
+                str(self.dir / "b.wav"),
+                str(self.dir / "day2" / "c.wav"),
+            ],
+            [path for path, _ in result],
+            "recursive files",
+        )
+        self.assertEqual(48, result[2][1].frames, "nested timecode")
@@ -0,0 +1,519 @@
+import datetime
+import fractions
+import math
+import unittest
+import unittest.mock
+import vtc
+
+from typing import Any, List, NamedTuple
+
+from vtc._compat import numpy
+
+
+class ConvertCase(NamedTuple):
+    rate: vtc.Framerate
+    frames: List[int]
+
+
+class TestFlicksConvert(unittest.TestCase):
+
+    cases = [
+        ConvertCase(rate=vtc.RATE.F24, frames=[0, 1, 23, 24, 86400, -86400]),
+        ConvertCase(rate=vtc.RATE.F23_98, frames=[0, 1, 24, 863136, -17]),
+        ConvertCase(rate=vtc.RATE.F29_97_DF, frames=[0, 17982, 107892, -3]),
+        ConvertCase(rate=vtc.RATE.F59_94_NDF, frames=[0, 1, 215784, -1]),
+        ConvertCase(rate=vtc.Framerate(25), frames=[0, 1, 90000]),
+        ConvertCase(rate=vtc.Framerate(120), frames=[0, 7, 432000]),
+    ]
+
+    def test_frames_to_flicks(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.rate)):
+                expected = [vtc.Timecode(f, rate=case.rate).flicks for f in case.frames]
+                result = vtc.convert.frames_to_flicks(case.frames, rate=case.rate)
+                self.assertEqual(expected, result, "flicks expected")
+
+    def test_flicks_to_frames(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.rate)):
+                flicks = vtc.convert.frames_to_flicks(case.frames, rate=case.rate)
+                result = vtc.convert.flicks_to_frames(flicks, rate=case.rate)
+                self.assertEqual(case.frames, result, "round trip")
+
+    def test_flicks_to_frames_rounding(self) -> None:
+        """
+        test_flicks_to_frames_rounding tests that off-frame flicks values round to the
+        nearest frame with the same results as the Timecode constructor.
+        """
+        per_frame = 29400000
+        values = [
+            per_frame // 2 - 1,
+            per_frame // 2,
+            per_frame + per_frame // 2,
+            per_frame + per_frame // 2 + 1,
+            -per_frame // 2 - 1,
+            5 * per_frame - 3,
+        ]
+
+        expected = [
+            vtc.Timecode(vtc.Flicks(value), rate=vtc.RATE.F24).frames
+            for value in values
+        ]
+        result = vtc.convert.flicks_to_frames(values, rate=vtc.RATE.F24)
+
+        self.assertEqual([0, 0, 2, 2, -1, 5], expected, "constructor frames")
+        self.assertEqual(expected, result, "batch frames")
+
+    def test_frames_to_flicks_unusual_rate(self) -> None:
+        result = vtc.convert.frames_to_flicks([1, 2, -1], rate=11)
+        expected = [vtc.Timecode(f, rate=11).flicks for f in [1, 2, -1]]
+        self.assertEqual(expected, result, "rounded to nearest flick")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.rate)):
+                frames = numpy.array(case.frames, dtype=numpy.int64)
+                flicks = vtc.convert.frames_to_flicks(frames, rate=case.rate)
+                self.assertIsInstance(flicks, numpy.ndarray, "flicks type")
+                self.assertEqual(
+                    vtc.convert.frames_to_flicks(case.frames, rate=case.rate),
+                    flicks.tolist(),  # type: ignore
+                    "flicks expected",
+                )
+
+                result = vtc.convert.flicks_to_frames(flicks, rate=case.rate)
+                self.assertIsInstance(result, numpy.ndarray, "frames type")
+                self.assertEqual(case.frames, result.tolist(), "round trip")  # type: ignore
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_rounding(self) -> None:
+        values: Any = numpy.arange(-100000000, 100000000, 777777).reshape(-1, 2)
+        result: Any = vtc.convert.flicks_to_frames(values, rate=vtc.RATE.F23_98)
+        expected = vtc.convert.flicks_to_frames(
+            values.ravel().tolist(), rate=vtc.RATE.F23_98
+        )
+
+        self.assertEqual(values.shape, result.shape, "shape kept")
+        self.assertEqual(expected, result.ravel().tolist(), "frames expected")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_overflow(self) -> None:
+        """
+        test_numpy_overflow tests that values which would overflow int64 arithmetic
+        fall back to python ints.
+        """
+        frames = [2**61, 2**70]
+        result: Any = vtc.convert.frames_to_flicks(
+            numpy.array(frames, dtype=object), rate=vtc.RATE.F24
+        )
+        self.assertEqual(object, result.dtype, "object array")
+        self.assertEqual(
+            vtc.convert.frames_to_flicks(frames, rate=vtc.RATE.F24),
+            result.tolist(),
+            "flicks expected",
+        )
+
+        result = vtc.convert.frames_to_flicks(
+            numpy.array([2**30, -(2**30)]), rate=vtc.RATE.F24
+        )
+        self.assertEqual(numpy.int64, result.dtype, "int64 array")
+        self.assertEqual([2**30 * 29400000, -(2**30) * 29400000], result.tolist())
+
+        result = vtc.convert.frames_to_flicks(numpy.array([], dtype=int), rate=24)
+        self.assertEqual([], result.tolist(), "empty")
+
+    def test_pure_python(self) -> None:
+        with unittest.mock.patch.object(vtc._compat, "numpy", None):
+            result = vtc.convert.frames_to_flicks([1], rate=vtc.RATE.F24)
+        self.assertEqual([29400000], result)
+
+
+class TestPTSConvert(unittest.TestCase):
+
+    rate = vtc.RATE.F23_98
+
+    def test_pts_to_frames(self) -> None:
+        values = [1000, 1000 + 3754, 1000 + 7508, 1000 + 90090, 1000 - 3754]
+        result = vtc.convert.pts_to_frames(values, rate=self.rate)
+        self.assertEqual([0, 1, 2, 24, -1], result, "frames relative to first")
+
+        result = vtc.convert.pts_to_frames(values, rate=self.rate, start_pts=0)
+        self.assertEqual([0, 1, 2, 24, -1], result, "frames rounded")
+
+        result = vtc.convert.pts_to_frames(
+            values, rate=self.rate, start="01:00:00:00", start_pts=1000 + 90090
+        )
+        self.assertEqual([86376, 86377, 86378, 86400, 86375], result, "start offset")
+
+    def test_pts_to_frames_matches_timecode(self) -> None:
+        values = list(range(0, 900000, 1234))
+        expected = [vtc.Timecode(vtc.PTS(v), rate=self.rate).frames for v in values]
+        result = vtc.convert.pts_to_frames(values, rate=self.rate, start_pts=0)
+        self.assertEqual(expected, result)
+
+    def test_wrap(self) -> None:
+        wrap = 2**33
+        values = [wrap - 3754, wrap - 1, 3753, 7507, 3753, wrap - 3754]
+        result = vtc.convert.pts_to_frames(values, rate=self.rate)
+        self.assertEqual([0, 1, 2, 3, 2, 0], result, "unwrapped")
+
+        result = vtc.convert.pts_to_frames(values, rate=self.rate, wrap=False)
+        self.assertEqual(0, result[0], "first frame")
+        self.assertLess(result[2], 0, "not unwrapped")
+
+    def test_frames_to_pts(self) -> None:
+        frames = list(range(-48, 48))
+        pts = vtc.convert.frames_to_pts(frames, rate=self.rate, wrap=False)
+        self.assertEqual([vtc.Timecode(f, rate=self.rate).pts for f in frames], pts)
+
+        pts = vtc.convert.frames_to_pts(frames, rate=self.rate)
+        self.assertEqual(2**33 - 180180, pts[0], "wrapped")
+        self.assertEqual(0, pts[48], "zero")
+
+        result = vtc.convert.pts_to_frames(pts, rate=self.rate, start_pts=0)
+        self.assertEqual(frames, result, "round trip")
+
+    def test_frames_to_pts_start(self) -> None:
+        pts = vtc.convert.frames_to_pts(
+            [86400, 86424],
+            rate=vtc.RATE.F24,
+            start="01:00:00:00",
+            start_pts=2**33 - 45000,
+        )
+        self.assertEqual([2**33 - 45000, 45000], pts)
+
+    def test_pts_to_timecodes(self) -> None:
+        result = vtc.convert.pts_to_timecodes(
+            [900000, 900000 + 3754], rate=self.rate, start="01:00:00:00"
+        )
+        self.assertEqual(
+            [
+                vtc.Timecode("01:00:00:00", rate=self.rate),
+                vtc.Timecode("01:00:00:01", rate=self.rate),
+            ],
+            result,
+        )
+        self.assertEqual([], vtc.convert.pts_to_timecodes([], rate=self.rate))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        wrap = 2**33
+        values = [wrap - 3754, wrap - 1, 3753, 7507, 3753, wrap - 3754]
+
+        for dtype in [numpy.int64, numpy.uint64, object]:
+            with self.subTest(str(dtype)):
+                array = numpy.array(values, dtype=dtype)
+                result: Any = vtc.convert.pts_to_frames(
+                    array, rate=self.rate, start="00:00:01:00"
+                )
+                self.assertIsInstance(result, numpy.ndarray, "array returned")
+                self.assertEqual([24, 25, 26, 27, 26, 24], result.tolist())
+
+        empty: Any = vtc.convert.pts_to_frames(numpy.array([]), rate=self.rate)
+        self.assertEqual([], empty.tolist(), "empty")
+
+        empty = vtc.convert.pts_to_frames(numpy.array([], dtype=int), rate=24)
+        self.assertEqual([], empty.tolist(), "empty int")
+
+        timecodes = vtc.convert.pts_to_timecodes(numpy.array(values), rate=self.rate)
+        self.assertEqual(3, timecodes[3].frames, "timecodes from array")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_frames_to_pts(self) -> None:
+        frames = list(range(-48, 48))
+        for wrap in [True, False]:
+            with self.subTest(f"wrap: {wrap}"):
+                result: Any = vtc.convert.frames_to_pts(
+                    numpy.array(frames), rate=self.rate, start_pts=500, wrap=wrap
+                )
+                expected = vtc.convert.frames_to_pts(
+                    frames, rate=self.rate, start_pts=500, wrap=wrap
+                )
+                self.assertEqual(expected, result.tolist())
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_large(self) -> None:
+        rng = numpy.random.default_rng(1)
+        deltas = rng.integers(1500, 6000, size=200000)
+        values = numpy.cumsum(deltas) % 2**33
+
+        result: Any = vtc.convert.pts_to_frames(values, rate=self.rate, start_pts=0)
+        expected = vtc.convert.pts_to_frames(
+            values.tolist(), rate=self.rate, start_pts=0
+        )
+        self.assertEqual(expected, result.tolist())
+
+
+class SamplesCase(NamedTuple):
+    rate: vtc.Framerate
+    sample_rate: vtc.SampleRateSource
+
+
+class TestSamplesConvert(unittest.TestCase):
+
+    cases = [
+        SamplesCase(rate=vtc.RATE.F24, sample_rate=48000),
+        SamplesCase(rate=vtc.RATE.F23_98, sample_rate=48000),
+        SamplesCase(rate=vtc.RATE.F23_98, sample_rate=96000),
+        SamplesCase(rate=vtc.RATE.F23_98, sample_rate=47952),
+        SamplesCase(rate=vtc.RATE.F24, sample_rate=48048),
+        SamplesCase(
+            rate=vtc.RATE.F29_97_DF, sample_rate=fractions.Fraction(48000000, 1001)
+        ),
+        SamplesCase(rate=vtc.Framerate(25), sample_rate=44100),
+    ]
+
+    def test_samples_to_frames(self) -> None:
+        values = list(range(-100000, 100000, 997))
+        for case in self.cases:
+            with self.subTest(f"{case.rate} @ {case.sample_rate}"):
+                expected = [
+                    vtc.Timecode(
+                        vtc.Samples(v, case.sample_rate), rate=case.rate
+                    ).frames
+                    for v in values
+                ]
+                result = vtc.convert.samples_to_frames(
+                    values, rate=case.rate, sample_rate=case.sample_rate
+                )
+                self.assertEqual(expected, result)
+
+    def test_frames_to_samples(self) -> None:
+        frames = list(range(-500, 500, 7))
+        for case in self.cases:
+            with self.subTest(f"{case.rate} @ {case.sample_rate}"):
+                expected = [
+                    vtc.Timecode(f, rate=case.rate).samples(case.sample_rate)
+                    for f in frames
+                ]
+                samples = vtc.convert.frames_to_samples(
+                    frames, rate=case.rate, sample_rate=case.sample_rate
+                )
+                self.assertEqual(expected, samples, "samples expected")
+
+                result = vtc.convert.samples_to_frames(
+                    samples, rate=case.rate, sample_rate=case.sample_rate
+                )
+                self.assertEqual(frames, result, "round trip")
+
+    def test_rounding(self) -> None:
+        # Frame 1 at 24 fps starts on sample 2000, and frame -1 on sample -2000.
+        values = [0, 1, 999, 1000, 1001, 1999, 2000, 3000, -1, -1000, -1999]
+        cases = [
+            ("nearest", [0, 0, 0, 0, 1, 1, 1, 2, 0, 0, -1]),
+            ("floor", [0, 0, 0, 0, 0, 0, 1, 1, -1, -1, -1]),
+            ("ceil", [0, 1, 1, 1, 1, 1, 1, 2, 0, 0, 0]),
+        ]
+
+        for rounding, expected in cases:
+            with self.subTest(rounding):
+                result = vtc.convert.samples_to_frames(
+                    values, rate=vtc.RATE.F24, sample_rate=48000, rounding=rounding
+                )
+                self.assertEqual(expected, result, "list result")
+
+                if numpy is None:
+                    continue
+
+                result = vtc.convert.samples_to_frames(
+                    numpy.array(values),
+                    rate=vtc.RATE.F24,
+                    sample_rate=48000,
+                    rounding=rounding,
+                )
+                self.assertEqual(expected, result.tolist(), "array result")  # type: ignore
+
+    def test_frames_to_samples_rounding(self) -> None:
+        # Frame 1 at 23.98 with 48 kHz starts 2002 samples in, but at 48.048 kHz it
+        # starts 2004.002 samples in.
+        cases = [("nearest", 2004), ("floor", 2004), ("ceil", 2005)]
+        for rounding, expected in cases:
+            with self.subTest(rounding):
+                result = vtc.convert.frames_to_samples(
+                    [1], rate=vtc.RATE.F23_98, sample_rate=48048, rounding=rounding
+                )
+                self.assertEqual([expected], result)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.convert.samples_to_frames([1], rate=24, sample_rate=0)
+        self.assertEqual("sample rate must be positive, got 0", str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            vtc.convert.samples_to_frames(
+                [1], rate=24, sample_rate=48000, rounding="round"
+            )
+        self.assertEqual(
+            "rounding must be 'nearest', 'floor' or 'ceil', got 'round'",
+            str(error.exception),
+        )
+
+
+def _time_of_day_timecode(nanoseconds: int, rate: vtc.Framerate) -> str:
+    """
+    _time_of_day_timecode works out the time-of-day timecode of nanoseconds since
+    midnight with fractions.
+    """
+    seconds = fractions.Fraction(nanoseconds % 86400000000000, 1000000000)
+    frames = math.floor(seconds * rate.playback)
+    frames = min(frames, vtc.Timecode("24:00:00:00", rate=rate).frames - 1)
+    return vtc.Timecode(frames, rate=rate).timecode
+
+
+class TestTimeOfDayConvert(unittest.TestCase):
+
+    rates = [
+        vtc.RATE.F24,
+        vtc.RATE.F23_98,
+        vtc.Framerate(25),
+        vtc.RATE.F29_97_DF,
+        vtc.RATE.F29_97_NDF,
+        vtc.RATE.F59_94_DF,
+    ]
+
+    # Nanoseconds since the Unix epoch of 2026-10-19 12:34:56.789123456 UTC.
+    epoch_ns = 1792413296789123456
+
+    def test_datetime_to_timecode(self) -> None:
+        times = [
+            datetime.time(0, 0, 0),
+            datetime.time(1, 0, 0),
+            datetime.time(10, 0, 0, 500000),
+            datetime.time(12, 0, 0),
+            datetime.time(23, 59, 59, 999999),
+        ]
+
+        for rate in self.rates:
+            for time in times:
+                with self.subTest(f"{rate} {time}"):
+                    value = datetime.datetime.combine(datetime.date(2026, 10, 19), time)
+                    nanoseconds = (
+                        (time.hour * 60 + time.minute) * 60 + time.second
+                    ) * 1000000000 + time.microsecond * 1000
+
+                    timecode = vtc.convert.datetime_to_timecode(value, rate=rate)
+                    self.assertEqual(rate, timecode.rate)
+                    self.assertEqual(
+                        _time_of_day_timecode(nanoseconds, rate), timecode.timecode
+                    )
+
+    def test_datetime_to_timecode_examples(self) -> None:
+        cases = [
+            (datetime.time(10, 0, 0, 500000), vtc.RATE.F24, "10:00:00:12"),
+            (datetime.time(1, 0, 0), vtc.RATE.F29_97_DF, "01:00:00;00"),
+            (datetime.time(12, 0, 0), vtc.RATE.F29_97_DF, "12:00:00;01"),
+            # Drop-frame timecode holds its last frame until the daily jam.
+            (datetime.time(23, 59, 59, 999999), vtc.RATE.F29_97_DF, "23:59:59;29"),
+        ]
+
+        for time, rate, expected in cases:
+            with self.subTest(f"{rate} {time}"):
+                value = datetime.datetime.combine(datetime.date(2026, 10, 19), time)
+                timecode = vtc.convert.datetime_to_timecode(value, rate=rate)
+                self.assertEqual(expected, timecode.timecode)
+
+    def test_datetime_to_timecode_aware(self) -> None:
+        zone = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+        value = datetime.datetime(2026, 10, 19, 18, 4, 56, 789123, tzinfo=zone)
+
+        timecode = vtc.convert.datetime_to_timecode(value, rate=vtc.RATE.F24)
+        self.assertEqual("18:04:56:18", timecode.timecode)
+
+        # The same instant from epoch nanoseconds at the same UTC offset.
+        epoch_timecode = vtc.convert.epoch_ns_to_timecode(
+            self.epoch_ns - 456, rate=vtc.RATE.F24, utc_offset=19800
+        )
+        self.assertEqual(timecode, epoch_timecode)
+
+    def test_epoch_ns_to_timecode(self) -> None:
+        for rate in self.rates:
+            with self.subTest(str(rate)):
+                timecode = vtc.convert.epoch_ns_to_timecode(self.epoch_ns, rate=rate)
+                self.assertEqual(
+                    _time_of_day_timecode(self.epoch_ns, rate), timecode.timecode
+                )
+
+    def test_drop_frame_holds_before_midnight(self) -> None:
+        """
+        test_drop_frame_holds_before_midnight tests that drop-frame timecode holds its
+        last frame until the daily jam rather than running backwards.
+        """
+        rate = vtc.RATE.F29_97_DF
+        midnight = 20 * 86400000000000
+        values = [midnight - offset for offset in (300000000, 100000000, 1000000, 1)]
+        values.append(midnight)
+        expected = ["23:59:59;23", "23:59:59;29", "23:59:59;29", "23:59:59;29"]
+        expected.append("00:00:00;00")
+
+        timecode = vtc.convert.epoch_ns_to_timecode(86399999999999, rate=rate)
+        self.assertEqual("23:59:59;29", timecode.timecode)
+
+        timecodes = vtc.convert.epoch_ns_to_timecodes(values, rate=rate)
+        self.assertEqual(expected, [tc.timecode for tc in timecodes])
+
+        if numpy is not None:
+            array = numpy.array(values, dtype=numpy.int64)
+            timecodes = vtc.convert.epoch_ns_to_timecodes(array, rate=rate)
+            self.assertEqual(expected, [tc.timecode for tc in timecodes])
+
+    def test_utc_offset_and_leap_seconds(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        tai_ns = self.epoch_ns + 37 * 1000000000
+
+        cases = [
+            (dict(), self.epoch_ns),
+            (dict(utc_offset=-5 * 3600), self.epoch_ns - 5 * 3600 * 1000000000),
+            (dict(utc_offset=14 * 3600), self.epoch_ns + 14 * 3600 * 1000000000),
+        ]
+
+        for kwargs, local_ns in cases:
+            with self.subTest(str(kwargs)):
+                timecode = vtc.convert.epoch_ns_to_timecode(
+                    tai_ns, rate=rate, leap_seconds=37, **kwargs
+                )
+                self.assertEqual(
+                    _time_of_day_timecode(local_ns, rate), timecode.timecode
+                )
+
+    def test_batch(self) -> None:
+        values = [
+            self.epoch_ns + offset
+            for offset in range(-86400000000000, 86400000000000, 997000000003)
+        ]
+        values.append(-1)
+
+        for rate in self.rates:
+            with self.subTest(str(rate)):
+                expected = [_time_of_day_timecode(value, rate) for value in values]
+
+                timecodes = vtc.convert.epoch_ns_to_timecodes(values, rate=rate)
+                self.assertEqual(expected, [tc.timecode for tc in timecodes])
+
+                frames = vtc.convert.epoch_ns_to_frames(values, rate=rate)
+                self.assertEqual([tc.frames for tc in timecodes], frames)
+
+                if numpy is None:
+                    continue
+
+                array = numpy.array(values, dtype=numpy.int64)
+                frames_array: Any = vtc.convert.epoch_ns_to_frames(array, rate=rate)
+                self.assertIsInstance(frames_array, numpy.ndarray)
+                self.assertEqual(frames, frames_array.tolist())
+
+                timecodes = vtc.convert.epoch_ns_to_timecodes(array, rate=rate)
+                self.assertEqual(expected, [tc.timecode for tc in timecodes])
+
+    def test_pure_python(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        with unittest.mock.patch.object(vtc._compat, "numpy", None):
+            frames = vtc.convert.epoch_ns_to_frames([self.epoch_ns], rate=rate)
+
+        self.assertEqual(
+            [vtc.convert.epoch_ns_to_timecode(self.epoch_ns, rate=rate).frames],
+            frames,
+        )
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            vtc.convert.epoch_ns_to_frames([0], rate=fractions.Fraction(47, 2))
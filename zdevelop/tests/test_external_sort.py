@@ -0,0 +1,98 @@
+import pathlib
+import random
+import tempfile
+import unittest
+import unittest.mock
+import vtc
+import vtc._external_sort
+
+from typing import List, Tuple
+
+
+class TestExternalSort(unittest.TestCase):
+    @staticmethod
+    def make_records(count: int, seed: int) -> List[Tuple[vtc.Timecode, bytes]]:
+        rng = random.Random(seed)
+        records = list()
+        for i in range(count):
+            frames = rng.randint(-1000, 1000)
+            payload = f"record {i}".encode() * rng.randint(0, 3)
+            records.append((vtc.Timecode(frames, rate=vtc.RATE.F29_97_DF), payload))
+        return records
+
+    def test_external_sort(self) -> None:
+        records = self.make_records(2000, 35)
+        expected = sorted(records, key=lambda record: record[0].frames)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = list(
+                vtc.external_sort(iter(records), memory_limit=1000, temp_dir=temp_dir)
+            )
+            self.assertEqual([], list(pathlib.Path(temp_dir).iterdir()), "runs removed")
+
+        self.assertEqual(
+            [(tc.frames, payload) for tc, payload in expected],
+            [(tc.frames, payload) for tc, payload in result],
+        )
+        for tc, _ in result:
+            self.assertEqual(vtc.RATE.F29_97_DF, tc.rate, "rate")
+
+    def test_external_sort_in_memory(self) -> None:
+        records = self.make_records(100, 36)
+        expected = sorted(records, key=lambda record: record[0].frames)
+
+        result = list(vtc.external_sort(records))
+        self.assertEqual(
+            [(tc.frames, payload) for tc, payload in expected],
+            [(tc.frames, payload) for tc, payload in result],
+        )
+
+    def test_external_sort_large_payload(self) -> None:
+        records = [
+            (vtc.Timecode(2, rate=vtc.RATE.F24), b"b" * 10000),
+            (vtc.Timecode(1, rate=vtc.RATE.F24), b"a" * 10000),
+            (vtc.Timecode(0, rate=vtc.RATE.F24), b""),
+        ]
+
+        result = list(vtc.external_sort(records, memory_limit=1))
+        self.assertEqual(
+            [(0, b""), (1, b"a" * 10000), (2, b"b" * 10000)],
+            [(tc.frames, payload) for tc, payload in result],
+        )
+
+    def test_external_sort_counts_record_overhead(self) -> None:
+        records = [(vtc.Timecode(i, rate=vtc.RATE.F24), b"") for i in range(100)]
+        memory_limit = vtc._external_sort._RECORD_OVERHEAD * 10
+
+        with unittest.mock.patch.object(
+            vtc._external_sort,
+            "_spill_run",
+            wraps=vtc._external_sort._spill_run,
+        ) as spill_run:
+            result = list(vtc.external_sort(records, memory_limit=memory_limit))
+
+        self.assertEqual(10, spill_run.call_count, "runs spilled")
+        self.assertEqual(list(range(100)), [tc.frames for tc, _ in result])
+
+    def test_external_sort_empty(self) -> None:
+        self.assertEqual([], list(vtc.external_sort([])))
+
+    def test_external_sort_mixed_rates(self) -> None:
+        records = [
+            (vtc.Timecode(0, rate=vtc.RATE.F24), b""),
+            (vtc.Timecode(0, rate=vtc.RATE.F23_98), b""),
+        ]
+
+        with self.assertRaises(ValueError) as error:
+            list(vtc.external_sort(records))
+
+        self.assertEqual(
+            "all record timecodes must have matching framerate",
+            str(error.exception),
+        )
+
+    def test_external_sort_bad_memory_limit(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.external_sort([], memory_limit=0)
+
+        self.assertEqual("memory_limit must be at least 1, got 0", str(error.exception))
@@ -0,0 +1,39 @@
+import math
+import unittest
+import vtc
+
+
+class TestFlicks(unittest.TestCase):
+    """
+    TestFlicks tests that using the magic methods of Flicks class returns our new class
+    and not a generic int. The implementation is shared with PremiereTicks, so only a
+    sample of methods is tested here.
+    """
+
+    A = vtc.Flicks(1)
+    B = vtc.Flicks(5)
+
+    def test_add(self) -> None:
+        result = self.A + self.B
+        self.assertEqual(6, result, "result expected")
+        self.assertIsInstance(result, vtc.Flicks, "type correct")
+
+    def test_rsub(self) -> None:
+        result = 1 - self.B
+        self.assertEqual(-4, result, "result expected")
+        self.assertIsInstance(result, vtc.Flicks, "type correct")
+
+    def test_divmod(self) -> None:
+        result = divmod(self.B, 2)
+        self.assertEqual((2, 1), result, "result expected")
+        self.assertIsInstance(result[0], vtc.Flicks, "type correct")
+        self.assertIsInstance(result[1], vtc.Flicks, "type correct")
+
+    def test_floor(self) -> None:
+        result = math.floor(self.B)
+        self.assertEqual(5, result, "result expected")
+        self.assertIsInstance(result, vtc.Flicks, "type correct")
+
+    def test_not_premiere_ticks(self) -> None:
+        self.assertNotIsInstance(self.A, vtc.PremiereTicks, "distinct types")
+        self.assertNotIsInstance(vtc.PremiereTicks(1) + self.A, vtc.Flicks)
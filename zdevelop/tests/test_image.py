@@ -0,0 +1,422 @@
+import fractions
+import itertools
+import pathlib
+import struct
+import tempfile
+import unittest
+import unittest.mock
+import vtc
+
+from typing import Any, List, Optional
+
+from vtc._compat import numpy
+
+
+def _word(hours: int, minutes: int, seconds: int, frames: int, df: bool = False) -> int:
+    def bcd(value: int) -> int:
+        return (value // 10) << 4 | value % 10
+
+    word = bcd(hours) << 24 | bcd(minutes) << 16 | bcd(seconds) << 8 | bcd(frames)
+    return word | (0x40 if df else 0)
+
+
+def _dpx(
+    time_word: int,
+    tv_rate: float = float("nan"),
+    film_rate: float = float("nan"),
+    user_bits: int = 0xFFFFFFFF,
+    byte_order: str = ">",
+) -> bytes:
+    header = bytearray(2048)
+    header[:4] = b"SDPX" if byte_order == ">" else b"XPDS"
+    struct.pack_into(byte_order + "f", header, 1724, film_rate)
+    struct.pack_into(byte_order + "II", header, 1920, time_word, user_bits)
+    # The vertical sample rate sits just before the frame rate in the television
+    # header, and must not be read as it.
+    struct.pack_into(byte_order + "f", header, 1936, 59.94)
+    struct.pack_into(byte_order + "f", header, 1940, tv_rate)
+    return bytes(header) + bytes(10000)
+
+
+def _exr_attribute(name: bytes, attribute_type: bytes, value: bytes) -> bytes:
+    return (
+        name
+        + b"\x00"
+        + attribute_type
+        + b"\x00"
+        + struct.pack("<i", len(value))
+        + value
+    )
+
+
+def _exr(
+    time_word: Optional[int] = None,
+    rate: Optional[fractions.Fraction] = None,
+    padding: int = 0,
+) -> bytes:
+    data = b"\x76\x2f\x31\x01" + struct.pack("<I", 2)
+    data += _exr_attribute(b"comments", b"string", b"x" * padding)
+    if time_word is not None:
+        value = struct.pack("<II", time_word, 0x12345678)
+        data += _exr_attribute(b"timeCode", b"timecode", value)
+    if rate is not None:
+        value = struct.pack("<iI", rate.numerator, rate.denominator)
+        data += _exr_attribute(b"framesPerSecond", b"rational", value)
+    return data + b"\x00" + bytes(10000)
+
+
+class TestImageHeaders(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, data: bytes) -> pathlib.Path:
+        path = self.dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_read_dpx(self) -> None:
+        cases = [
+            (_dpx(_word(1, 2, 3, 4), tv_rate=24.0), vtc.RATE.F24, "01:02:03:04"),
+            (
+                _dpx(_word(1, 2, 3, 4), film_rate=23.976, byte_order="<"),
+                vtc.RATE.F23_98,
+                "01:02:03:04",
+            ),
+            (
+                _dpx(_word(10, 0, 0, 0, df=True), tv_rate=29.97),
+                vtc.RATE.F29_97_DF,
+                "10:00:00;00",
+            ),
+            (
+                _dpx(_word(23, 59, 59, 29, df=True), tv_rate=30.0),
+                vtc.RATE.F29_97_DF,
+                "23:59:59;29",
+            ),
+            (_dpx(_word(0, 0, 1, 12), tv_rate=25.0), vtc.Framerate(25), "00:00:01:12"),
+        ]
+
+        for data, rate, timecode in cases:
+            with self.subTest(timecode):
+                header = vtc.image.read_header(self.write("frame.dpx", data))
+                self.assertEqual(rate, header.rate, "rate")
+                assert header.rate is not None
+                self.assertEqual(rate.dropframe, header.rate.dropframe, "dropframe")
+
+                tc = header.timecode()
+                self.assertEqual(timecode, tc.timecode, "timecode")
+                self.assertEqual(
+                    vtc.Timecode(timecode, rate=rate).frames, tc.frames, "frames"
+                )
+
+    def test_read_dpx_fields(self) -> None:
+        path = self.write("a.dpx", _dpx(_word(1, 0, 0, 0), user_bits=0xABCD))
+        header = vtc.image.read_header(path)
+        self.assertEqual(
+            vtc.image.FrameHeader(
+                path=str(path), time_word=0x01000000, user_bits=0xABCD, rate=None
+            ),
+            header,
+        )
+        self.assertEqual(
+            vtc.TimecodeSections(
+                negative=False, hours=1, minutes=0, seconds=0, frames=0
+            ),
+            header.sections,
+        )
+
+        with self.assertRaises(ValueError) as error:
+            header.timecode()
+        self.assertEqual(
+            f"{path} has no framerate, and none was given", str(error.exception)
+        )
+        self.assertEqual("01:00:00:00", header.timecode(24).timecode)
+
+        header = vtc.image.read_header(self.write("b.dpx", _dpx(0xFFFFFFFF, 24.0)))
+        self.assertEqual(None, header.time_word, "no timecode")
+        self.assertEqual(None, header.sections, "no sections")
+        with self.assertRaises(ValueError) as error:
+            header.timecode(24)
+        self.assertEqual(f"{header.path} has no timecode", str(error.exception))
+
+    def test_read_exr(self) -> None:
+        cases = [
+            (_word(1, 0, 0, 0), fractions.Fraction(24000, 1001), vtc.RATE.F23_98),
+            (
+                _word(1, 0, 0, 2, True),
+                fractions.Fraction(30000, 1001),
+                vtc.RATE.F29_97_DF,
+            ),
+            (_word(1, 0, 0, 0), fractions.Fraction(25), vtc.Framerate(25)),
+        ]
+
+        # Pad the header past the first read to test reading in chunks, both with the
+        # read ending inside an attribute value and inside an attribute name.
+        paddings = [5000, 4069]
+
+        for (word, playback, rate), padding in itertools.product(cases, paddings):
+            with self.subTest(str(rate), padding=padding):
+                path = self.write("a.exr", _exr(word, playback, padding=padding))
+                header = vtc.image.read_header(path)
+                self.assertEqual(word, header.time_word, "time word")
+                self.assertEqual(0x12345678, header.user_bits, "user bits")
+                self.assertEqual(rate, header.rate, "rate")
+                self.assertEqual(
+                    vtc.Timecode(f"01:00:00:0{word & 0xF}", rate=rate),
+                    header.timecode(),
+                    "timecode",
+                )
+
+        header = vtc.image.read_header(
+            self.write("a.exr", _exr(None, fractions.Fraction(48)))
+        )
+        self.assertEqual(None, header.time_word, "no timecode")
+        self.assertEqual(vtc.RATE.F48, header.rate, "rate without timecode")
+
+        header = vtc.image.read_header(self.write("a.exr", _exr(_word(1, 0, 0, 0))))
+        self.assertEqual(None, header.rate, "timecode without rate")
+
+    def test_read_errors(self) -> None:
+        cases = [
+            ("a.png", b"\x89PNG\r\n", "is not a DPX or OpenEXR image"),
+            ("a.dpx", b"SDPX" + bytes(100), "has a truncated header"),
+            ("c.dpx", _dpx(_word(1, 0, 0, 0))[:1943], "has a truncated header"),
+            (
+                "a.exr",
+                _exr(_word(1, 0, 0, 0), padding=100)[:60],
+                "has a truncated header",
+            ),
+            (
+                "b.dpx",
+                _dpx(_word(1, 0, 0, 0, True), tv_rate=24.0),
+                "has a drop-frame timecode at 24.0 fps",
+            ),
+        ]
+
+        for name, data, message in cases:
+            with self.subTest(message):
+                path = self.write(name, data)
+                with self.assertRaises(ValueError) as error:
+                    vtc.image.read_header(path)
+                self.assertEqual(f"{path} {message}", str(error.exception))
+
+    def test_read_headers(self) -> None:
+        paths = [
+            self.write(f"shot.{index:04}.dpx", _dpx(_word(1, 0, 0, index), 24.0))
+            for index in range(20)
+        ]
+
+        headers = vtc.image.read_headers(paths, max_workers=4)
+        self.assertEqual([str(path) for path in paths], [h.path for h in headers])
+        self.assertEqual(
+            list(range(86400, 86420)), [h.timecode().frames for h in headers]
+        )
+
+
+class TestTimeWords(unittest.TestCase):
+    def test_decode_sections(self) -> None:
+        words = [_word(1, 2, 3, 4), _word(23, 59, 59, 29, True), 0]
+        expected = [
+            vtc.TimecodeSections(False, 1, 2, 3, 4),
+            vtc.TimecodeSections(False, 23, 59, 59, 29),
+            vtc.TimecodeSections(False, 0, 0, 0, 0),
+        ]
+        self.assertEqual(expected, vtc.image.decode_sections(words))
+
+        if numpy is not None:
+            array = numpy.array(words, dtype=numpy.uint32)
+            self.assertEqual(expected, vtc.image.decode_sections(array))
+
+    def test_frames_from_words(self) -> None:
+        cases = [vtc.RATE.F24, vtc.RATE.F23_98, vtc.RATE.F29_97_DF, vtc.RATE.F30]
+        for rate in cases:
+            with self.subTest(str(rate)):
+                expected = list(range(0, 10**6, 997))
+                words = [
+                    _word(*vtc.Timecode(frames, rate=rate).sections[1:])
+                    for frames in expected
+                ]
+
+                result = vtc.image.frames_from_words(words, rate=rate)
+                self.assertEqual(expected, result, "list")
+
+                if numpy is None:
+                    continue
+
+                array: Any = vtc.image.frames_from_words(
+                    numpy.array(words, dtype=numpy.uint32), rate=rate
+                )
+                self.assertEqual(expected, array.tolist(), "array")
+
+    def test_frames_from_words_bad_rate(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.image.frames_from_words([0], rate=(47, 2))
+        self.assertEqual(
+            "timecode sections require a whole-number timebase, got 47/2",
+            str(error.exception),
+        )
+
+
+class TestCheckContinuity(unittest.TestCase):
+    @staticmethod
+    def _headers(words: List[int]) -> List[vtc.image.FrameHeader]:
+        return [
+            vtc.image.FrameHeader(
+                path=f"shot.{index}.dpx", time_word=word, user_bits=None, rate=None
+            )
+            for index, word in enumerate(words)
+        ]
+
+    def test_continuous(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        words = [
+            _word(*vtc.Timecode(frames, rate=rate).sections[1:])
+            for frames in range(1700, 1900)
+        ]
+        self.assertEqual(
+            [], vtc.image.check_continuity(self._headers(words), rate=rate)
+        )
+        self.assertEqual([], vtc.image.check_continuity([]))
+
+    def test_breaks(self) -> None:
+        words = [
+            _word(1, 0, 0, 0),
+            _word(1, 0, 0, 1),
+            _word(1, 0, 0, 3),
+            _word(1, 0, 0, 4),
+            _word(1, 0, 0, 4),
+        ]
+        headers = self._headers(words)
+        headers[0] = headers[0]._replace(rate=vtc.RATE.F24)
+
+        result = vtc.image.check_continuity(headers)
+        self.assertEqual(
+            [
+                vtc.image.TimecodeBreak(
+                    header_index=2,
+                    header=headers[2],
+                    expected=vtc.Timecode("01:00:00:02", rate=24),
+                    found=vtc.Timecode("01:00:00:03", rate=24),
+                ),
+                vtc.image.TimecodeBreak(
+                    header_index=4,
+                    header=headers[4],
+                    expected=vtc.Timecode("01:00:00:05", rate=24),
+                    found=vtc.Timecode("01:00:00:04", rate=24),
+                ),
+            ],
+            result,
+        )
+
+    def test_missing_timecode(self) -> None:
+        headers = self._headers([0, 1])
+        headers[1] = headers[1]._replace(time_word=None)
+
+        with self.assertRaises(ValueError) as error:
+            vtc.image.check_continuity(headers, rate=24)
+        self.assertEqual("shot.1.dpx has no timecode", str(error.exception))
+
+
+class TestScanSequences(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def touch(self, *names: str) -> None:
+        for name in names:
+            path = self.dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def test_scan(self) -> None:
+        self.touch(
+            *(f"shot_010.{frame:07}.exr" for frame in [1001, 1002, 1003, 1005, 1008]),
+            *(f"shot_010.{frame:07}.EXR" for frame in [1, 2]),
+            "shot_020_v2.9.dpx",
+            "100%_0001.exr",
+            "render_0001.txt",
+            "notes.exr",
+            "sub/shot_030.0001.exr",
+        )
+
+        sequences = vtc.image.scan_sequences(
+            self.dir, rate=24, offset="01:00:00:00", extensions=[".exr", ".DPX"]
+        )
+
+        directory = str(self.dir)
+        self.assertEqual(
+            [
+                vtc.image.ImageSequence(
+                    directory=directory,
+                    pattern="100%%_%04d.exr",
+                    frame_count=1,
+                    ranges=[vtc.Range.from_frames(86401, 86402, rate=24)],
+                    gaps=[],
+                ),
+                vtc.image.ImageSequence(
+                    directory=directory,
+                    pattern="shot_010.%07d.EXR",
+                    frame_count=2,
+                    ranges=[vtc.Range.from_frames(86401, 86403, rate=24)],
+                    gaps=[],
+                ),
+                vtc.image.ImageSequence(
+                    directory=directory,
+                    pattern="shot_010.%07d.exr",
+                    frame_count=5,
+                    ranges=[
+                        vtc.Range.from_frames(87401, 87404, rate=24),
+                        vtc.Range.from_frames(87405, 87406, rate=24),
+                        vtc.Range.from_frames(87408, 87409, rate=24),
+                    ],
+                    gaps=[
+                        vtc.Range.from_frames(87404, 87405, rate=24),
+                        vtc.Range.from_frames(87406, 87408, rate=24),
+                    ],
+                ),
+                vtc.image.ImageSequence(
+                    directory=directory,
+                    pattern="shot_020_v2.%01d.dpx",
+                    frame_count=1,
+                    ranges=[vtc.Range.from_frames(86409, 86410, rate=24)],
+                    gaps=[],
+                ),
+            ],
+            sequences,
+        )
+
+        self.assertEqual(
+            str(self.dir / "shot_010.0001001.exr"), sequences[2].path(1001), "path"
+        )
+        self.assertEqual(
+            str(self.dir / "100%_0007.exr"), sequences[0].path(7), "escaped path"
+        )
+
+    def test_scan_recursive(self) -> None:
+        self.touch("a.0001.exr", "sub/b.0001.exr", "sub/b.0002.exr", "notes.txt")
+
+        sequences = vtc.image.scan_sequences(self.dir, rate=24, recursive=True)
+        self.assertEqual(
+            [
+                (str(self.dir), "a.%04d.exr", [vtc.Range.from_frames(1, 2, rate=24)]),
+                (
+                    str(self.dir / "sub"),
+                    "b.%04d.exr",
+                    [vtc.Range.from_frames(1, 3, rate=24)],
+                ),
+            ],
+            [
+                (sequence.directory, sequence.pattern, sequence.ranges)
+                for sequence in sequences
+            ],
+        )
+
+    def test_scan_missing_directory(self) -> None:
+        with self.assertRaises(OSError):
+            vtc.image.scan_sequences(self.dir / "missing", rate=24)
@@ -0,0 +1,492 @@
+import array
+import fractions
+import math
+import pathlib
+import struct
+import tempfile
+import unittest
+import unittest.mock
+import vtc
+
+from typing import Any, List, NamedTuple, Optional
+
+from vtc._compat import numpy
+
+_SYNC_BITS = [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1]
+
+# Bits of signal sent before the first frame, so the first frame has a level change
+# at its start.
+_PREROLL_BITS = 8
+
+
+def _ltc_signal(
+    words: List[int], samples_per_bit: fractions.Fraction, amplitude: float
+) -> List[float]:
+    """Encodes words as a square-wave biphase-mark LTC signal."""
+    bits = [0] * _PREROLL_BITS
+    for word in words:
+        bits.extend((word >> index) & 1 for index in range(64))
+        bits.extend(_SYNC_BITS)
+
+    half_levels: List[int] = list()
+    level = 1
+    for bit in bits:
+        level = -level
+        half_levels.append(level)
+        if bit:
+            level = -level
+        half_levels.append(level)
+
+    samples_per_half = samples_per_bit / 2
+    count = math.floor(len(bits) * samples_per_bit)
+    return [
+        amplitude * half_levels[math.floor(index / samples_per_half)]
+        for index in range(count)
+    ]
+
+
+def _expected_frames(
+    start: vtc.Timecode,
+    count: int,
+    user_bits: int,
+    samples_per_bit: fractions.Fraction,
+    offset: int = 0,
+    preroll_bits: int = _PREROLL_BITS,
+) -> List[vtc.ltc.LTCFrame]:
+    frames_per_day = vtc.Timecode("24:00:00:00", rate=start.rate).frames
+    return [
+        vtc.ltc.LTCFrame(
+            timecode=vtc.Timecode(
+                (start.frames + index) % frames_per_day, rate=start.rate
+            ),
+            sample=offset + math.ceil((preroll_bits + 80 * index) * samples_per_bit),
+            user_bits=user_bits,
+        )
+        for index in range(count)
+    ]
+
+
+class DecodeCase(NamedTuple):
+    rate: vtc.Framerate
+    sample_rate: int
+    start: str
+
+
+class TestDecode(unittest.TestCase):
+
+    cases = [
+        DecodeCase(rate=vtc.RATE.F24, sample_rate=48000, start="00:59:59:20"),
+        DecodeCase(rate=vtc.Framerate(25), sample_rate=44100, start="10:00:00:00"),
+        DecodeCase(rate=vtc.RATE.F29_97_DF, sample_rate=48000, start="00:00:59;25"),
+        DecodeCase(rate=vtc.RATE.F30, sample_rate=96000, start="23:59:59:25"),
+    ]
+
+    def test_decode(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.rate)):
+                start = vtc.Timecode(case.start, rate=case.rate)
+                frames = list(range(start.frames, start.frames + 10))
+                words = vtc.smpte12m.pack_frames(
+                    frames, rate=case.rate, user_bits=0x1234ABCD
+                )
+                samples_per_bit = case.sample_rate / (case.rate.playback * 80)
+                signal = _ltc_signal(list(words), samples_per_bit, 0.5)
+                expected = _expected_frames(start, 10, 0x1234ABCD, samples_per_bit)
+
+                with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                    result = vtc.ltc.decode(
+                        signal, rate=case.rate, sample_rate=case.sample_rate
+                    )
+                self.assertEqual(expected, result, "list")
+
+                if numpy is None:
+                    continue
+
+                result = vtc.ltc.decode(
+                    numpy.array(signal), rate=case.rate, sample_rate=case.sample_rate
+                )
+                self.assertEqual(expected, result, "array")
+
+    def test_decode_noisy(self) -> None:
+        """
+        Tests decoding a signal played off speed, with low-level noise, leading silence,
+        a dropout, a glitch and a cut-off end.
+        """
+        rate = vtc.Framerate(25)
+        start = vtc.Timecode("01:00:00:00", rate=rate)
+        words = vtc.smpte12m.pack_frames(range(start.frames, start.frames + 6), rate=25)
+
+        # Play the signal 10% slow.
+        samples_per_bit = fractions.Fraction(48000, 25 * 80) * fractions.Fraction(
+            11, 10
+        )
+        signal = [0.0] * 1000 + _ltc_signal(list(words), samples_per_bit, 10000)
+        signal = [
+            sample + (500 if index % 3 else -500) for index, sample in enumerate(signal)
+        ]
+
+        # Drop out the middle of the fourth frame.
+        dropout_start = 1000 + int((_PREROLL_BITS + 80 * 3 + 20) * samples_per_bit)
+        dropout_end = dropout_start + int(samples_per_bit * 4)
+        for index in range(dropout_start, dropout_end):
+            signal[index] = 0.0
+
+        # Glitch the first sync bit of the second frame into three half bits.
+        glitch_start = 1000 + (_PREROLL_BITS + 80 + 64) * samples_per_bit
+        glitch = range(
+            math.ceil(glitch_start + samples_per_bit / 4),
+            math.ceil(glitch_start + samples_per_bit / 2),
+        )
+        for index in glitch:
+            signal[index] = -signal[index]
+
+        # Cut the signal off in the first half of the last bit.
+        end = 1000 + (_PREROLL_BITS + 80 * 6) * samples_per_bit
+        signal = signal[: math.floor(end - samples_per_bit * 3 / 4)]
+
+        expected = _expected_frames(start, 6, 0, samples_per_bit, offset=1000)
+        expected = [expected[0], expected[2], expected[4]]
+
+        with unittest.mock.patch.object(vtc._compat, "numpy", None):
+            result = vtc.ltc.decode(signal, rate=rate, sample_rate=48000)
+        self.assertEqual(expected, result, "list")
+
+        if numpy is None:
+            return
+
+        result = vtc.ltc.decode(numpy.array(signal), rate=rate, sample_rate=48000)
+        self.assertEqual(expected, result, "array")
+
+    def test_decode_empty(self) -> None:
+        cases: List[Any] = [[], [0] * 100]
+        if numpy is not None:
+            cases.extend([numpy.zeros(0), numpy.zeros(100, dtype=numpy.int16)])
+
+        for samples in cases:
+            with self.subTest(type(samples).__name__):
+                result = vtc.ltc.decode(samples, rate=24, sample_rate=48000)
+                self.assertEqual([], result)
+
+    def test_decode_errors(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.ltc.decode([], rate=vtc.RATE.F59_94_DF, sample_rate=48000)
+        self.assertEqual(
+            "SMPTE 12M words require a whole-number timebase of 30 frames or less, got"
+            " 60",
+            str(error.exception),
+        )
+
+        with self.assertRaises(ValueError) as error:
+            vtc.ltc.decode([], rate=24, sample_rate=0)
+        self.assertEqual("sample rate must be positive, got 0", str(error.exception))
+
+
+def _wav(
+    samples: List[float],
+    *,
+    channels: int = 1,
+    channel: int = 0,
+    sample_format: str = "<h",
+    tag: int = 1,
+    extensible: bool = False,
+    rf64: bool = False,
+    data_size: Optional[int] = None,
+) -> bytes:
+    """
+    Builds a WAVE file with samples in one of its channels and silence in the others.
+    """
+    size = 3 if sample_format == "i24" else struct.calcsize(sample_format)
+
+    data = bytearray()
+    for sample in samples:
+        for index in range(channels):
+            value = sample if index == channel else 0
+            if sample_format == "i24":
+                data += int(value).to_bytes(3, "little", signed=True)
+            elif sample_format == "B":
+                data += struct.pack("B", int(value) + 128)
+            elif sample_format in ("<f", "<d"):
+                data += struct.pack(sample_format, value)
+            else:
+                data += struct.pack(sample_format, int(value))
+
+    fmt_tag = 0xFFFE if extensible else tag
+    fmt = struct.pack(
+        "<HHIIHH", fmt_tag, channels, 48000, 48000 * size * channels, size, size * 8
+    )
+    if extensible:
+        fmt += struct.pack("<HHI", 22, size * 8, 0) + struct.pack("<H", tag)
+        fmt += bytes(14)
+
+    chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    chunks += b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+
+    if data_size is None:
+        data_size = len(data)
+    if rf64:
+        chunks = b"ds64" + struct.pack("<IQQQI", 28, 0, data_size, 0, 0) + chunks
+        data_size = 0xFFFFFFFF
+
+    chunks += b"data" + struct.pack("<I", data_size) + data
+    riff_id = b"RF64" if rf64 else b"RIFF"
+    return riff_id + struct.pack("<I", len(chunks) + 4) + b"WAVE" + chunks
+
+
+class TestDecodeWav(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+        self.start = vtc.Timecode("01:00:00:00", rate=24)
+        words = vtc.smpte12m.pack_frames(range(86400, 86405), rate=24, user_bits=7)
+        self.samples_per_bit = fractions.Fraction(48000, 24 * 80)
+        self.signal = _ltc_signal(list(words), self.samples_per_bit, 1)
+        self.expected = _expected_frames(self.start, 5, 7, self.samples_per_bit)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, data: bytes) -> pathlib.Path:
+        path = self.dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_decode_wav(self) -> None:
+        signal = self.signal
+        cases = [
+            ("16-bit", _wav([s * 16000 for s in signal])),
+            ("8-bit", _wav([s * 100 for s in signal], sample_format="B")),
+            ("24-bit", _wav([s * 4000000 for s in signal], sample_format="i24")),
+            ("32-bit", _wav([s * 10**9 for s in signal], sample_format="<i")),
+            ("float", _wav(signal, sample_format="<f", tag=3)),
+            (
+                "extensible",
+                _wav(signal, sample_format="<d", tag=3, extensible=True),
+            ),
+            ("rf64", _wav([s * 16000 for s in signal], rf64=True)),
+            (
+                "stereo",
+                _wav([s * 16000 for s in signal], channels=2, channel=1),
+            ),
+            (
+                "truncated data",
+                _wav([s * 16000 for s in signal], data_size=10**9),
+            ),
+        ]
+
+        for name, data in cases:
+            with self.subTest(name):
+                path = self.write("ltc.wav", data)
+                channel = 1 if name == "stereo" else 0
+
+                with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                    result = vtc.ltc.decode_wav(path, rate=24, channel=channel)
+                self.assertEqual(self.expected, result, "pure python")
+
+                if numpy is None:
+                    continue
+
+                result = vtc.ltc.decode_wav(path, rate=24, channel=channel)
+                self.assertEqual(self.expected, result, "numpy")
+
+    def test_decode_wav_empty(self) -> None:
+        path = self.write("empty.wav", _wav([]))
+        self.assertEqual([], vtc.ltc.decode_wav(path, rate=24))
+
+    def test_decode_wav_error_mid_stream(self) -> None:
+        """
+        test_decode_wav_error_mid_stream tests that an error raised while views of the
+        mapped file are alive is not replaced by an error closing the map.
+        """
+        path = self.write("ltc.wav", _wav([s * 16000 for s in self.signal]))
+
+        def fail(samples: Any, **kwargs: Any) -> None:
+            raise ValueError("bad signal")
+
+        for name, numpy_module in [("pure python", None), ("numpy", numpy)]:
+            with self.subTest(name):
+                with unittest.mock.patch.object(vtc._compat, "numpy", numpy_module):
+                    with unittest.mock.patch.object(vtc.ltc._decode, "decode", fail):
+                        with self.assertRaises(ValueError) as error:
+                            vtc.ltc.decode_wav(path, rate=24)
+
+                self.assertEqual("bad signal", str(error.exception))
+
+    def test_decode_wav_errors(self) -> None:
+        wav = _wav([0, 1])
+        cases = [
+            (b"RIFF", "is not a RIFF WAVE file"),
+            (wav[:12] + wav[36:48], "has no data chunk"),
+            (wav[:12] + wav[36:], "has no fmt chunk"),
+            (
+                wav[:12] + b"fmt " + struct.pack("<I", 8) + bytes(8) + wav[36:],
+                "has a truncated chunk",
+            ),
+            (
+                wav[:12] + b"ds64" + struct.pack("<I", 28) + bytes(4),
+                "has a truncated chunk",
+            ),
+            (_wav([0, 1], tag=2), "has unsupported audio format 0x0002"),
+            (_wav([0, 1], sample_format="<q"), "has unsupported 64-bit audio samples"),
+            (_wav([0, 1], channels=2), "channel must be between 0 and 1, got 2"),
+        ]
+
+        for data, message in cases:
+            with self.subTest(message):
+                path = self.write("bad.wav", data)
+                with self.assertRaises(ValueError) as error:
+                    vtc.ltc.decode_wav(path, rate=24, channel=2)
+
+                expected = (
+                    message if message.startswith("channel") else f"{path} {message}"
+                )
+                self.assertEqual(expected, str(error.exception))
+
+
+class TestEncode(unittest.TestCase):
+
+    cases = [
+        DecodeCase(rate=vtc.RATE.F24, sample_rate=48000, start="00:59:59:20"),
+        DecodeCase(rate=vtc.RATE.F23_98, sample_rate=48000, start="01:00:00:00"),
+        DecodeCase(rate=vtc.Framerate(25), sample_rate=44100, start="10:00:00:00"),
+        DecodeCase(rate=vtc.RATE.F29_97_DF, sample_rate=48000, start="00:00:59;25"),
+        DecodeCase(rate=vtc.RATE.F30, sample_rate=96000, start="23:59:59:25"),
+    ]
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_encode(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.rate)):
+                start = vtc.Timecode(case.start, rate=case.rate)
+                tc_range = vtc.Range.from_frames(
+                    start.frames, start.frames + 10, rate=case.rate
+                )
+                samples_per_bit = case.sample_rate / (case.rate.playback * 80)
+                expected = _expected_frames(
+                    start, 10, 5, samples_per_bit, preroll_bits=0
+                )
+
+                with unittest.mock.patch.object(vtc.ltc._encode, "_CHUNK_FRAMES", 3):
+                    with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                        signal = vtc.ltc.encode(
+                            tc_range, sample_rate=case.sample_rate, user_bits=5
+                        )
+                        result = vtc.ltc.decode(
+                            signal, rate=case.rate, sample_rate=case.sample_rate
+                        )
+
+                self.assertIsInstance(signal, array.array, "array type")
+                self.assertEqual(
+                    math.ceil(10 * 80 * samples_per_bit), len(signal), "length"
+                )
+                self.assertEqual(expected, result, "pure python")
+
+                # Every frame starts with the same polarity.
+                self.assertEqual(
+                    {16384},
+                    {signal[frame.sample] for frame in result},
+                    "polarity",
+                )
+
+                if numpy is None:
+                    continue
+
+                with unittest.mock.patch.object(vtc.ltc._encode, "_CHUNK_FRAMES", 3):
+                    array_signal: Any = vtc.ltc.encode(
+                        tc_range, sample_rate=case.sample_rate, user_bits=5
+                    )
+
+                self.assertEqual(numpy.int16, array_signal.dtype, "dtype")
+                self.assertEqual(list(signal), array_signal.tolist(), "numpy")
+
+    def test_encode_empty(self) -> None:
+        tc_range = vtc.Range.from_frames(0, 0, rate=24)
+        self.assertEqual(0, len(vtc.ltc.encode(tc_range, sample_rate=48000)))
+
+    def test_encode_wav(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        tc_range = vtc.Range.from_frames(17970, 18000, rate=rate)
+        expected = vtc.ltc.encode(tc_range, sample_rate=48000, level=0.25)
+
+        for rf64 in [False, True]:
+            with self.subTest(rf64=rf64):
+                path = self.dir / "ltc.wav"
+                max_size = 100 if rf64 else 0xFFFFFFFF
+
+                with unittest.mock.patch.object(
+                    vtc.ltc._wav, "_MAX_RIFF_SIZE", max_size
+                ):
+                    with unittest.mock.patch.object(
+                        vtc.ltc._encode, "_CHUNK_FRAMES", 7
+                    ):
+                        vtc.ltc.encode_wav(
+                            path, tc_range, sample_rate=48000, level=0.25
+                        )
+
+                data = path.read_bytes()
+                self.assertEqual(b"RF64" if rf64 else b"RIFF", data[:4], "riff id")
+                self.assertEqual(
+                    list(expected),
+                    list(
+                        struct.unpack(f"<{len(expected)}h", data[-len(expected) * 2 :])
+                    ),
+                    "samples",
+                )
+
+                result = vtc.ltc.decode_wav(path, rate=rate)
+                self.assertEqual(
+                    [vtc.Timecode(f, rate=rate) for f in range(17970, 18000)],
+                    [frame.timecode for frame in result],
+                    "decoded",
+                )
+
+                with unittest.mock.patch.object(
+                    vtc.ltc._wav, "_MAX_RIFF_SIZE", max_size
+                ):
+                    with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                        vtc.ltc.encode_wav(
+                            path, tc_range, sample_rate=48000, level=0.25
+                        )
+                self.assertEqual(data, path.read_bytes(), "pure python")
+
+    def test_encode_errors(self) -> None:
+        cases = [
+            (
+                vtc.Range.from_frames(0, 1, rate=vtc.RATE.F59_94_NDF),
+                48000,
+                0.5,
+                "SMPTE 12M words require a whole-number timebase of 30 frames or less,"
+                " got 60",
+            ),
+            (
+                vtc.Range.from_frames(0, 1, rate=24),
+                48000,
+                1.5,
+                "level must be between 0 and 1, got 1.5",
+            ),
+            (
+                vtc.Range.from_frames(0, 1, rate=24),
+                -1,
+                0.5,
+                "sample rate must be positive, got -1",
+            ),
+        ]
+
+        for tc_range, sample_rate, level, message in cases:
+            with self.subTest(message):
+                with self.assertRaises(ValueError) as error:
+                    vtc.ltc.encode(tc_range, sample_rate=sample_rate, level=level)
+                self.assertEqual(message, str(error.exception))
+
+                path = self.dir / "bad.wav"
+                with self.assertRaises(ValueError):
+                    vtc.ltc.encode_wav(
+                        path, tc_range, sample_rate=sample_rate, level=level
+                    )
+                self.assertFalse(path.exists(), "file not created")
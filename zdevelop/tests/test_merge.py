@@ -0,0 +1,69 @@
+import random
+import unittest
+import vtc
+
+from typing import List, NamedTuple
+
+
+class TestMerge(unittest.TestCase):
+    def test_merge_same_rate(self) -> None:
+        rng = random.Random(34)
+        streams: List[List[vtc.Timecode]] = [
+            [
+                vtc.Timecode(f, rate=vtc.RATE.F24)
+                for f in sorted(rng.sample(range(1000), 50))
+            ]
+            for _ in range(5)
+        ]
+
+        result = list(vtc.merge(*streams))
+        expected = sorted(tc for stream in streams for tc in stream)
+
+        self.assertEqual(
+            [tc.frames for tc in expected],
+            [tc.frames for tc in result],
+        )
+
+    def test_merge_mixed_rates(self) -> None:
+        stream_24 = [
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24),
+            vtc.Timecode("01:00:01:00", rate=vtc.RATE.F24),
+            vtc.Timecode("01:00:03:00", rate=vtc.RATE.F24),
+        ]
+        stream_23_98 = [
+            vtc.Timecode("00:59:56:10", rate=vtc.RATE.F23_98),
+            vtc.Timecode("00:59:57:10", rate=vtc.RATE.F23_98),
+        ]
+        stream_48 = [
+            vtc.Timecode("01:00:00:24", rate=vtc.RATE.F48),
+            vtc.Timecode("01:00:02:00", rate=vtc.RATE.F48),
+        ]
+
+        result = list(vtc.merge(stream_24, stream_23_98, stream_48))
+        expected = sorted(stream_24 + stream_23_98 + stream_48)
+
+        self.assertEqual([repr(tc) for tc in expected], [repr(tc) for tc in result])
+        self.assertEqual(
+            "[01:00:00:00 @ [24]]", repr(result[0]), "rational ordering used"
+        )
+
+    def test_merge_key_stable(self) -> None:
+        class Event(NamedTuple):
+            name: str
+            tc: vtc.Timecode
+
+        def event(name: str, frames: int) -> Event:
+            return Event(name, vtc.Timecode(frames, rate=vtc.RATE.F24))
+
+        track1 = [event("a", 0), event("b", 10), event("c", 20)]
+        track2 = iter([event("d", 10), event("e", 15)])
+        track3: List[Event] = []
+
+        result = vtc.merge(track1, track2, track3, key=lambda e: e.tc)
+        self.assertEqual(
+            ["a", "b", "d", "e", "c"],
+            [e.name for e in result],
+        )
+
+    def test_merge_empty(self) -> None:
+        self.assertEqual([], list(vtc.merge()))
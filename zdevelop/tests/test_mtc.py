@@ -0,0 +1,277 @@
+import unittest
+import vtc
+
+from typing import List, NamedTuple
+
+
+class MessageCase(NamedTuple):
+    timecode: vtc.Timecode
+    full_frame: bytes
+    quarter_frames: bytes
+
+
+def _split(quarter_frames: bytes) -> List[bytes]:
+    return [quarter_frames[i : i + 2] for i in range(0, len(quarter_frames), 2)]
+
+
+class TestMessages(unittest.TestCase):
+
+    cases = [
+        MessageCase(
+            timecode=vtc.Timecode("01:02:03:04", rate=vtc.RATE.F24),
+            full_frame=bytes.fromhex("f07f7f010101020304f7"),
+            quarter_frames=bytes.fromhex("f104f110f123f130f142f150f161f170"),
+        ),
+        MessageCase(
+            timecode=vtc.Timecode("12:34:56:24", rate=25),
+            full_frame=bytes.fromhex("f07f7f01012c223818f7"),
+            quarter_frames=bytes.fromhex("f108f111f128f133f142f152f16cf172"),
+        ),
+        MessageCase(
+            timecode=vtc.Timecode("23:59:59;29", rate=vtc.RATE.F29_97_DF),
+            full_frame=bytes.fromhex("f07f7f0101573b3b1df7"),
+            quarter_frames=bytes.fromhex("f10df111f12bf133f14bf153f167f175"),
+        ),
+        MessageCase(
+            timecode=vtc.Timecode("10:00:00:00", rate=vtc.RATE.F30),
+            full_frame=bytes.fromhex("f07f7f01016a000000f7"),
+            quarter_frames=bytes.fromhex("f100f110f120f130f140f150f16af176"),
+        ),
+    ]
+
+    def test_full_frame(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                message = vtc.mtc.full_frame(case.timecode)
+                self.assertEqual(case.full_frame.hex(), message.hex())
+
+    def test_parse_full_frame(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                timecode = vtc.mtc.parse_full_frame(case.full_frame)
+                self.assertEqual(case.timecode.rate, timecode.rate)
+                self.assertEqual(case.timecode.frames, timecode.frames)
+
+    def test_quarter_frames(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                messages = vtc.mtc.quarter_frames(case.timecode)
+                self.assertEqual(_split(case.quarter_frames), messages)
+
+    def test_parse_quarter_frames(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                messages = _split(case.quarter_frames)
+                timecode = vtc.mtc.parse_quarter_frames(messages)
+                self.assertEqual(case.timecode.rate, timecode.rate)
+                self.assertEqual(case.timecode.frames, timecode.frames)
+
+    def test_full_frame_device_id(self) -> None:
+        timecode = vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24)
+        message = vtc.mtc.full_frame(timecode, device_id=0x10)
+        self.assertEqual("f07f10010101000000f7", message.hex())
+
+        parsed = vtc.mtc.parse_full_frame(message)
+        self.assertEqual(timecode.frames, parsed.frames)
+
+    def test_ntsc_rates(self) -> None:
+        cases = [
+            (vtc.Timecode("01:00:00:00", rate=vtc.RATE.F23_98), vtc.RATE.F24),
+            (vtc.Timecode("01:00:00:00", rate=vtc.RATE.F29_97_NDF), vtc.RATE.F30),
+        ]
+
+        for timecode, mtc_rate in cases:
+            with self.subTest(str(timecode.rate)):
+                parsed = vtc.mtc.parse_full_frame(vtc.mtc.full_frame(timecode))
+                self.assertEqual(mtc_rate, parsed.rate)
+                self.assertEqual(timecode.timecode, parsed.timecode)
+
+    def test_wraps_at_24_hours(self) -> None:
+        timecode = vtc.Timecode("25:00:00:01", rate=vtc.RATE.F24)
+
+        parsed = vtc.mtc.parse_full_frame(vtc.mtc.full_frame(timecode))
+        self.assertEqual("01:00:00:01", parsed.timecode)
+
+        parsed = vtc.mtc.parse_quarter_frames(vtc.mtc.quarter_frames(timecode))
+        self.assertEqual("01:00:00:01", parsed.timecode)
+
+    def test_unsupported_rate(self) -> None:
+        timecode = vtc.Timecode("01:00:00:00", rate=vtc.RATE.F48)
+
+        with self.assertRaises(ValueError) as error:
+            vtc.mtc.full_frame(timecode)
+        self.assertEqual(
+            "MTC only supports 24, 25 and 30 fps timebases, got 48",
+            str(error.exception),
+        )
+
+        with self.assertRaises(ValueError):
+            vtc.mtc.quarter_frames(timecode)
+
+        with self.assertRaises(ValueError):
+            vtc.mtc.quarter_frame_stream(vtc.Range(timecode, timecode + 10))
+
+    def test_parse_full_frame_invalid(self) -> None:
+        cases = [
+            "f07f7f010101000000",
+            "f07f7f01010100000000f7",
+            "f07e7f010101000000f7",
+            "f07f7f010201000000f7",
+            "f07f7f01010100000000",
+        ]
+
+        for case in cases:
+            with self.subTest(case):
+                with self.assertRaises(ValueError) as error:
+                    vtc.mtc.parse_full_frame(bytes.fromhex(case))
+                self.assertIn("is not an MTC full-frame message", str(error.exception))
+
+    def test_parse_quarter_frames_invalid(self) -> None:
+        messages = _split(self.cases[0].quarter_frames)
+
+        with self.assertRaises(ValueError) as error:
+            vtc.mtc.parse_quarter_frames(messages[1:])
+        self.assertEqual(
+            "f1 10 is not an MTC quarter-frame message for piece 0",
+            str(error.exception),
+        )
+
+        with self.assertRaises(ValueError) as error:
+            vtc.mtc.parse_quarter_frames(messages[:7])
+        self.assertEqual(
+            "expected 8 MTC quarter-frame messages, got 7", str(error.exception)
+        )
+
+        with self.assertRaises(ValueError):
+            vtc.mtc.parse_quarter_frames([b"\xf2\x04"] + messages[1:])
+
+        with self.assertRaises(ValueError):
+            vtc.mtc.parse_quarter_frames([b"\xf1\x04\x00"] + messages[1:])
+
+        with self.assertRaises(ValueError):
+            vtc.mtc.parse_quarter_frames(messages + messages[:1])
+
+
+class TestQuarterFrameStream(unittest.TestCase):
+    def test_stream(self) -> None:
+        cases = [
+            vtc.Range(
+                vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24),
+                vtc.Timecode("01:00:00:05", rate=vtc.RATE.F24),
+            ),
+            vtc.Range(
+                vtc.Timecode("00:00:59;28", rate=vtc.RATE.F29_97_DF),
+                vtc.Timecode("00:01:00;04", rate=vtc.RATE.F29_97_DF),
+            ),
+            vtc.Range(
+                vtc.Timecode("23:59:59:24", rate=25),
+                vtc.Timecode("24:00:00:02", rate=25),
+            ),
+            vtc.Range(
+                vtc.Timecode("01:00:00:00", rate=vtc.RATE.F30),
+                vtc.Timecode("01:00:00:00", rate=vtc.RATE.F30),
+            ),
+        ]
+
+        for tc_range in cases:
+            with self.subTest(str(tc_range)):
+                expected: List[bytes] = list()
+                for offset in range(0, len(tc_range), 2):
+                    expected.extend(vtc.mtc.quarter_frames(tc_range.tc_in + offset))
+                expected = expected[: len(tc_range) * 4]
+
+                messages = list(vtc.mtc.quarter_frame_stream(tc_range))
+                self.assertEqual(expected, messages)
+
+    def test_wraps_at_24_hours(self) -> None:
+        tc_range = vtc.Range(
+            vtc.Timecode("23:59:59:24", rate=25), vtc.Timecode("24:00:00:03", rate=25)
+        )
+
+        timecodes = vtc.mtc.decode(b"".join(vtc.mtc.quarter_frame_stream(tc_range)))
+        self.assertEqual(
+            ["23:59:59:24", "00:00:00:01"], [tc.timecode for tc in timecodes]
+        )
+
+
+class TestMTCDecoder(unittest.TestCase):
+
+    tc_range = vtc.Range(
+        vtc.Timecode("00:09:59;26", rate=vtc.RATE.F29_97_DF),
+        vtc.Timecode("00:10:00;08", rate=vtc.RATE.F29_97_DF),
+    )
+
+    def stream(self) -> bytes:
+        return b"".join(vtc.mtc.quarter_frame_stream(self.tc_range))
+
+    def expected(self) -> List[str]:
+        return [
+            (self.tc_range.tc_in + offset).timecode
+            for offset in range(0, len(self.tc_range) - 1, 2)
+        ]
+
+    def test_decode(self) -> None:
+        timecodes = vtc.mtc.decode(self.stream())
+        self.assertEqual(self.expected(), [tc.timecode for tc in timecodes])
+        for timecode in timecodes:
+            self.assertEqual(vtc.RATE.F29_97_DF, timecode.rate)
+
+    def test_feed_byte_at_a_time(self) -> None:
+        decoder = vtc.mtc.MTCDecoder()
+
+        timecodes: List[vtc.Timecode] = list()
+        for byte in self.stream():
+            timecodes.extend(decoder.feed(bytes([byte])))
+
+        self.assertEqual(self.expected(), [tc.timecode for tc in timecodes])
+
+    def test_interleaved_messages(self) -> None:
+        # Clock messages inside quarter-frame messages, and a note-on and another
+        # SysEx message between them.
+        stream = bytearray()
+        for message in vtc.mtc.quarter_frame_stream(self.tc_range):
+            stream.extend(message[:1] + b"\xf8" + message[1:])
+            stream.extend(b"\x90\x3c\x7f")
+            stream.extend(b"\xf0\x7e\x7f\x06\x01\xf7")
+
+        timecodes = vtc.mtc.decode(bytes(stream))
+        self.assertEqual(self.expected(), [tc.timecode for tc in timecodes])
+
+    def test_full_frame(self) -> None:
+        timecode = vtc.Timecode("01:00:00:00", rate=25)
+        messages = vtc.mtc.quarter_frames(timecode)
+
+        stream = (
+            b"".join(messages[:4])
+            + b"\xf0\x7e\x7f\x01\x01\x21\x00\x00\x00\xf7"
+            + b"\xf0\x7f\x7f\x01\x01\x21\x00\x00\x00\x00\x00\xf7"
+            + vtc.mtc.full_frame(timecode + 10)
+            # The rest of the sequence interrupted by the full-frame message.
+            + b"".join(messages[4:])
+            + b"".join(messages)
+        )
+
+        timecodes = vtc.mtc.decode(stream)
+        self.assertEqual(
+            ["01:00:00:10", "01:00:00:00"], [tc.timecode for tc in timecodes]
+        )
+
+    def test_skipped_piece(self) -> None:
+        messages = vtc.mtc.quarter_frames(vtc.Timecode("01:00:00:00", rate=25))
+        following = vtc.mtc.quarter_frames(vtc.Timecode("01:00:00:02", rate=25))
+
+        stream = b"".join(messages[:3] + messages[4:] + following)
+
+        timecodes = vtc.mtc.decode(stream)
+        self.assertEqual(["01:00:00:02"], [tc.timecode for tc in timecodes])
+
+    def test_reset(self) -> None:
+        messages = vtc.mtc.quarter_frames(vtc.Timecode("01:00:00:00", rate=25))
+        decoder = vtc.mtc.MTCDecoder()
+
+        self.assertEqual([], decoder.feed(b"".join(messages[:4])))
+        decoder.reset()
+        self.assertEqual([], decoder.feed(b"".join(messages[4:])))
+
+        timecodes = decoder.feed(b"".join(messages))
+        self.assertEqual(["01:00:00:00"], [tc.timecode for tc in timecodes])
@@ -0,0 +1,292 @@
+import fractions
+import pathlib
+import struct
+import tempfile
+import unittest
+import vtc
+
+from typing import List, Optional, Tuple
+
+_PARTITION_KEY = bytes.fromhex("060e2b34020501010d01020101020400")
+_BODY_PARTITION_KEY = bytes.fromhex("060e2b34020501010d01020101030400")
+_PRIMER_KEY = bytes.fromhex("060e2b34020501010d01020101050100")
+_FILL_KEY = bytes.fromhex("060e2b34010101020301021001000000")
+_FILL_KEY_V1 = bytes.fromhex("060e2b34010101010301021001000000")
+_SET_KEY_PREFIX = bytes.fromhex("060e2b3402530101")
+
+_MATERIAL_PACKAGE = bytes.fromhex("0d01010101013600")
+_SOURCE_PACKAGE = bytes.fromhex("0d01010101013700")
+_TRACK = bytes.fromhex("0d01010101013b00")
+_SEQUENCE = bytes.fromhex("0d01010101010f00")
+_TIMECODE_COMPONENT = bytes.fromhex("0d01010101011400")
+_DESCRIPTOR = bytes.fromhex("0d01010101014400")
+
+
+def _klv(key: bytes, value: bytes) -> bytes:
+    # Use the 4-byte long form length most MXF writers use for everything but short
+    # values, so both forms are covered.
+    if len(value) < 0x10:
+        return key + bytes([len(value)]) + value
+    return key + b"\x83" + len(value).to_bytes(3, "big") + value
+
+
+def _local_set(kind: bytes, *tags: Tuple[int, bytes]) -> bytes:
+    value = b"".join(struct.pack(">HH", tag, len(data)) + data for tag, data in tags)
+    return _klv(_SET_KEY_PREFIX + kind, value)
+
+
+def _uid(number: int) -> bytes:
+    return number.to_bytes(16, "big")
+
+
+def _batch(*uids: bytes) -> bytes:
+    return struct.pack(">II", len(uids), 16) + b"".join(uids)
+
+
+def _timecode_track(
+    number: int,
+    base: int,
+    dropframe: bool,
+    start: int,
+    edit_rate: Optional[Tuple[int, int]],
+    in_sequence: bool = True,
+) -> List[bytes]:
+    """
+    _timecode_track returns the track, sequence and timecode component sets of a
+    timecode track with uids starting at number.
+    """
+    component = _local_set(
+        _TIMECODE_COMPONENT,
+        (0x3C0A, _uid(number + 2)),
+        (0x1501, struct.pack(">q", start)),
+        (0x1502, struct.pack(">H", base)),
+        (0x1503, bytes([dropframe])),
+    )
+    sequence = _local_set(
+        _SEQUENCE,
+        (0x3C0A, _uid(number + 1)),
+        (0x1001, _batch(_uid(number + 2))),
+    )
+
+    track_tags = [(0x3C0A, _uid(number))]
+    if edit_rate is not None:
+        track_tags.append((0x4B01, struct.pack(">ii", *edit_rate)))
+    track_tags.append((0x4803, _uid(number + (1 if in_sequence else 2))))
+
+    return [_local_set(_TRACK, *track_tags), sequence, component]
+
+
+def _mxf(*sets: bytes, run_in: bytes = b"", fill: bytes = b"") -> bytes:
+    metadata = _klv(_PRIMER_KEY, struct.pack(">II", 0, 18)) + b"".join(sets)
+    metadata += _klv(_FILL_KEY, bytes(64))
+    return _header_partition(metadata, run_in, fill)
+
+
+def _header_partition(metadata: bytes, run_in: bytes = b"", fill: bytes = b"") -> bytes:
+    """
+    _header_partition returns a header partition holding metadata, followed by a body
+    partition. The fill goes between the partition pack and the metadata, and like the
+    fill KAG aligned writers put there, is not counted in the header byte count.
+    """
+    pack = struct.pack(">HHIQQQQQIQI", 1, 3, 512, 0, 0, 0, len(metadata), 0, 0, 0, 1)
+    pack += bytes(16) + struct.pack(">II", 0, 16)
+
+    essence = _klv(_BODY_PARTITION_KEY, bytes(100)) + bytes(10000)
+    return run_in + _klv(_PARTITION_KEY, pack) + fill + metadata + essence
+
+
+class TestMXF(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, data: bytes) -> pathlib.Path:
+        path = self.dir / "clip.mxf"
+        path.write_bytes(data)
+        return path
+
+    def test_read(self) -> None:
+        material_uid = bytes(range(32))
+        file_uid = bytes(range(32, 64))
+
+        path = self.write(
+            _mxf(
+                # Sets may come in any order, so put the file package first.
+                _local_set(
+                    _SOURCE_PACKAGE,
+                    (0x3C0A, _uid(20)),
+                    (0x4401, file_uid),
+                    (0x4403, _batch(_uid(21), _uid(99))),
+                    (0x4701, _uid(30)),
+                ),
+                *_timecode_track(21, 30, True, 107892, (30000, 1001)),
+                _local_set(_DESCRIPTOR, (0x3C0A, _uid(30))),
+                _local_set(
+                    _MATERIAL_PACKAGE,
+                    (0x3C0A, _uid(10)),
+                    (0x4401, material_uid),
+                    (0x4403, _batch(_uid(11))),
+                ),
+                *_timecode_track(11, 30, True, 107910, (30000, 1001)),
+            )
+        )
+
+        components = vtc.mxf.read(path)
+        self.assertEqual(
+            [
+                vtc.mxf.TimecodeComponent(
+                    package="material",
+                    package_uid=material_uid,
+                    rounded_timecode_base=30,
+                    dropframe=True,
+                    start_frame=107910,
+                    edit_rate=fractions.Fraction(30000, 1001),
+                ),
+                vtc.mxf.TimecodeComponent(
+                    package="file",
+                    package_uid=file_uid,
+                    rounded_timecode_base=30,
+                    dropframe=True,
+                    start_frame=107892,
+                    edit_rate=fractions.Fraction(30000, 1001),
+                ),
+            ],
+            components,
+        )
+
+        self.assertEqual(vtc.RATE.F29_97_DF, components[0].rate, "rate")
+        self.assertTrue(components[0].rate.dropframe, "dropframe")
+        self.assertEqual("01:00:00;18", components[0].timecode.timecode, "material")
+        self.assertEqual("01:00:00;00", components[1].timecode.timecode, "file")
+
+        tc = vtc.mxf.start_timecode(path)
+        self.assertEqual("01:00:00;18", tc.timecode, "start timecode")
+
+    def test_read_rates(self) -> None:
+        cases = [
+            (24, False, (24000, 1001), vtc.RATE.F23_98, "01:00:00:00"),
+            (24, False, (24, 1), vtc.RATE.F24, "01:00:00:00"),
+            (25, False, None, vtc.Framerate(25), "01:00:00:00"),
+            (30, True, None, vtc.RATE.F29_97_DF, "01:00:03;18"),
+            (30, False, (25, 1), vtc.RATE.F30, "01:00:00:00"),
+            (60, False, (60000, 1001), vtc.RATE.F59_94_NDF, "01:00:00:00"),
+            (24, False, (0, 0), vtc.RATE.F24, "01:00:00:00"),
+        ]
+
+        for base, dropframe, edit_rate, rate, timecode in cases:
+            with self.subTest(f"{base} {dropframe} {edit_rate}"):
+                path = self.write(
+                    _mxf(
+                        _local_set(
+                            _MATERIAL_PACKAGE,
+                            (0x3C0A, _uid(10)),
+                            (0x4403, _batch(_uid(11))),
+                        ),
+                        *_timecode_track(
+                            11, base, dropframe, base * 3600, edit_rate, False
+                        ),
+                        run_in=b"run in",
+                    )
+                )
+                tc = vtc.mxf.start_timecode(path)
+                self.assertEqual(rate, tc.rate, "rate")
+                self.assertEqual(rate.dropframe, tc.rate.dropframe, "dropframe")
+                self.assertEqual(timecode, tc.timecode, "timecode")
+
+    def test_read_kag_fill(self) -> None:
+        """
+        test_read_kag_fill tests that the KLV fill that aligns the primer pack to the
+        KAG is skipped.
+        """
+        # Pad the 108 byte partition pack out to the 512 byte KAG.
+        cases = [
+            ("version 2", _klv(_FILL_KEY, bytes(512 - 108 - 20))),
+            ("version 1", _klv(_FILL_KEY_V1, bytes(512 - 108 - 20))),
+            ("short", _klv(_FILL_KEY, bytes(4))),
+        ]
+
+        for name, fill in cases:
+            with self.subTest(name):
+                path = self.write(
+                    _mxf(
+                        _local_set(
+                            _MATERIAL_PACKAGE,
+                            (0x3C0A, _uid(10)),
+                            (0x4403, _batch(_uid(11))),
+                        ),
+                        *_timecode_track(11, 25, False, 90000, (25, 1)),
+                        fill=fill,
+                    )
+                )
+                tc = vtc.mxf.start_timecode(path)
+                self.assertEqual("01:00:00:00", tc.timecode)
+
+    def test_read_skips(self) -> None:
+        """
+        test_read_skips tests that tape packages and tracks without timecode are
+        skipped.
+        """
+        path = self.write(
+            _mxf(
+                _local_set(
+                    _SOURCE_PACKAGE,
+                    (0x3C0A, _uid(20)),
+                    (0x4403, _batch(_uid(21))),
+                ),
+                *_timecode_track(21, 25, False, 0, None),
+                _local_set(
+                    _MATERIAL_PACKAGE,
+                    (0x3C0A, _uid(10)),
+                    (0x4403, _batch(_uid(11), _uid(12), _uid(13), _uid(14))),
+                ),
+                _local_set(_TRACK, (0x3C0A, _uid(11)), (0x4803, _uid(50))),
+                _local_set(_TRACK, (0x3C0A, _uid(12))),
+                _local_set(_TRACK, (0x3C0A, _uid(13)), (0x4803, _uid(51))),
+                _local_set(_SEQUENCE, (0x3C0A, _uid(51)), (0x1001, b"")),
+                _local_set(_TRACK, (0x3C0A, _uid(14)), (0x4803, _uid(52))),
+                _local_set(
+                    _SEQUENCE,
+                    (0x3C0A, _uid(52)),
+                    (0x1001, struct.pack(">II", 2, 0)),
+                ),
+                _local_set(_SOURCE_PACKAGE, (0x4701, _uid(0))),
+            )
+        )
+
+        self.assertEqual([], vtc.mxf.read(path))
+
+        with self.assertRaises(ValueError) as error:
+            vtc.mxf.start_timecode(path)
+        self.assertEqual(f"{path} has no timecode component", str(error.exception))
+
+    def test_read_errors(self) -> None:
+        partition_end = 16 + 4 + 88
+        cases = [
+            (b"not an mxf file", "has no MXF header partition"),
+            (_PARTITION_KEY, "has an invalid KLV at byte 0"),
+            (_PARTITION_KEY + b"\x88\x00", "has an invalid KLV at byte 0"),
+            (_klv(_PARTITION_KEY, bytes(20)), "has a truncated partition pack"),
+            (_mxf()[: partition_end + 10], "has a truncated header partition"),
+            (
+                _klv(_PARTITION_KEY, bytes(88)) + _FILL_KEY,
+                f"has an invalid KLV at byte {partition_end}",
+            ),
+            (
+                _header_partition(_PRIMER_KEY + b"\x83\x00\x10"),
+                f"has an invalid KLV at byte {partition_end}",
+            ),
+            (
+                _header_partition(_PRIMER_KEY + b"\x83\xff\xff\xff" + bytes(100)),
+                f"has an invalid KLV at byte {partition_end}",
+            ),
+        ]
+
+        for data, message in cases:
+            with self.subTest(message):
+                path = self.write(data)
+                with self.assertRaises(ValueError) as error:
+                    vtc.mxf.read(path)
+                self.assertEqual(f"{path} {message}", str(error.exception))
@@ -0,0 +1,180 @@
+import pathlib
+import struct
+import tempfile
+import unittest
+import vtc
+
+
+def _atom(atom_type: bytes, *children: bytes) -> bytes:
+    body = b"".join(children)
+    return struct.pack(">I4s", len(body) + 8, atom_type) + body
+
+
+def _tmcd_stsd(timescale: int, frame_duration: int, frames: int, flags: int) -> bytes:
+    entry = struct.pack(
+        ">6sHIIIIBB", bytes(6), 1, 0, flags, timescale, frame_duration, frames, 0
+    )
+    return _atom(b"stsd", struct.pack(">II", 0, 1), _atom(b"tmcd", entry))
+
+
+def _video_stsd() -> bytes:
+    return _atom(b"stsd", struct.pack(">II", 0, 1), _atom(b"avc1", bytes(78)))
+
+
+def _stco(offset: int) -> bytes:
+    return _atom(b"stco", struct.pack(">III", 0, 1, offset))
+
+
+def _co64(offset: int) -> bytes:
+    return _atom(b"co64", struct.pack(">IIQ", 0, 1, offset))
+
+
+def _trak(*stbl: bytes) -> bytes:
+    return _atom(
+        b"trak",
+        _atom(b"tkhd", bytes(84)),
+        _atom(b"mdia", _atom(b"minf", _atom(b"stbl", *stbl))),
+    )
+
+
+# The ftyp atom is 20 bytes, and the mdat header 8, so the media data starts at 28.
+_FTYP = _atom(b"ftyp", b"qt  ", bytes(4), b"qt  ")
+_SAMPLE_OFFSET = 28 + 16
+
+
+def _movie(sample: bytes, *traks: bytes) -> bytes:
+    mdat = _atom(b"mdat", bytes(16), sample, bytes(100))
+    return _FTYP + mdat + _atom(b"moov", _atom(b"mvhd", bytes(100)), *traks)
+
+
+class TestQuickTime(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, data: bytes) -> pathlib.Path:
+        path = self.dir / "clip.mov"
+        path.write_bytes(data)
+        return path
+
+    def test_read(self) -> None:
+        # 01:00:00:00 @ 23.98.
+        path = self.write(
+            _movie(
+                struct.pack(">I", 86400),
+                _trak(_video_stsd(), _stco(1000)),
+                _trak(_tmcd_stsd(24000, 1001, 24, 0), _stco(_SAMPLE_OFFSET)),
+            )
+        )
+
+        track = vtc.quicktime.read(path)
+        self.assertEqual(
+            vtc.quicktime.TimecodeTrack(
+                path=str(path),
+                timescale=24000,
+                frame_duration=1001,
+                number_of_frames=24,
+                dropframe=False,
+                frame=86400,
+            ),
+            track,
+        )
+        self.assertEqual(vtc.RATE.F23_98, track.rate, "rate")
+        self.assertTrue(track.rate.ntsc, "ntsc")
+
+        tc = vtc.quicktime.start_timecode(path)
+        self.assertEqual("01:00:00:00", tc.timecode, "timecode")
+        self.assertEqual(vtc.RATE.F23_98, tc.rate, "timecode rate")
+
+    def test_read_rates(self) -> None:
+        cases = [
+            (30000, 1001, 30, 1, vtc.RATE.F29_97_DF, "00:10:00;00", 17982),
+            (2997, 100, 30, 1, vtc.RATE.F29_97_DF, "00:10:00;00", 17982),
+            (2997, 100, 30, 0, vtc.RATE.F29_97_NDF, "00:10:00:00", 18000),
+            (60000, 1001, 60, 1, vtc.RATE.F59_94_DF, "00:01:00;04", 3600),
+            (25, 1, 25, 0, vtc.Framerate(25), "10:00:00:00", 900000),
+            (600, 25, 24, 0, vtc.RATE.F24, "00:00:01:00", 24),
+        ]
+
+        for timescale, duration, frames, flags, rate, timecode, sample in cases:
+            with self.subTest(f"{timescale}/{duration} {flags}"):
+                path = self.write(
+                    _movie(
+                        struct.pack(">I", sample),
+                        _trak(
+                            _tmcd_stsd(timescale, duration, frames, flags),
+                            _co64(_SAMPLE_OFFSET),
+                        ),
+                    )
+                )
+                tc = vtc.quicktime.start_timecode(path)
+                self.assertEqual(rate, tc.rate, "rate")
+                self.assertEqual(rate.dropframe, tc.rate.dropframe, "dropframe")
+                self.assertEqual(timecode, tc.timecode, "timecode")
+
+    def test_read_negative(self) -> None:
+        path = self.write(
+            _movie(
+                struct.pack(">i", -24),
+                _trak(_tmcd_stsd(24, 1, 24, 0x4), _stco(_SAMPLE_OFFSET)),
+            )
+        )
+        self.assertEqual("-00:00:01:00", vtc.quicktime.start_timecode(path).timecode)
+
+    def test_read_large_atoms(self) -> None:
+        """
+        test_read_large_atoms tests atoms with 64-bit sizes and atoms that run to the
+        end of the file.
+        """
+        mdat_body = bytes(16) + struct.pack(">I", 48)
+        mdat = struct.pack(">I4sQ", 1, b"mdat", len(mdat_body) + 16) + mdat_body
+        moov = _atom(
+            b"moov", _trak(_tmcd_stsd(24, 1, 24, 0), _stco(len(_FTYP) + 16 + 16))
+        )
+        moov = struct.pack(">I", 0) + moov[4:]
+
+        path = self.write(_FTYP + mdat + moov)
+        self.assertEqual(48, vtc.quicktime.read(path).frame)
+
+    def test_read_errors(self) -> None:
+        sample = struct.pack(">I", 0)
+        cases = [
+            (
+                _movie(sample, _trak(_video_stsd(), _stco(_SAMPLE_OFFSET))),
+                "has no tmcd timecode track",
+            ),
+            (
+                _movie(sample, _trak(_tmcd_stsd(24, 1, 24, 0))),
+                "has no tmcd timecode track",
+            ),
+            (
+                _movie(
+                    sample,
+                    _trak(_tmcd_stsd(24, 1, 24, 0), _atom(b"stco", bytes(4))),
+                    _trak(_tmcd_stsd(24, 1, 24, 0), _atom(b"stco", bytes(12))),
+                    _trak(_atom(b"stsd", bytes(8)), _stco(_SAMPLE_OFFSET)),
+                    _atom(b"trak", _atom(b"mdia")),
+                ),
+                "has no tmcd timecode track",
+            ),
+            (
+                _movie(sample, _trak(_tmcd_stsd(24, 1, 24, 0), _stco(10**6))),
+                "ends unexpectedly at byte 1000000",
+            ),
+            (_FTYP + struct.pack(">I4s", 4, b"moov"), "has an invalid atom at byte 20"),
+            (
+                _FTYP + struct.pack(">I4s", 100, b"moov"),
+                "has an invalid atom at byte 20",
+            ),
+            (_FTYP + struct.pack(">I4s", 1, b"moov"), "ends unexpectedly at byte 28"),
+        ]
+
+        for data, message in cases:
+            with self.subTest(message):
+                path = self.write(data)
+                with self.assertRaises(ValueError) as error:
+                    vtc.quicktime.read(path)
+                self.assertEqual(f"{path} {message}", str(error.exception))
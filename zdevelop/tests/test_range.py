@@ -1,7 +1,10 @@
 import unittest
+import unittest.mock
 import vtc
 
-from typing import NamedTuple, List, Optional, Union
+from vtc._compat import numpy
+
+from typing import NamedTuple, List, Optional, Tuple, Union
 
 
 class TestRange(unittest.TestCase):
@@ -372,3 +375,350 @@ class TestRange(unittest.TestCase):
             tc2=vtc.Timecode("02:00:00:00", rate=vtc.RATE.F23_98),
         )
         self.assertEqual("[01:00:00:00 - 02:00:00:00 @ [23.98 NTSC]]", repr(tc_range))
+
+    def test_from_frames(self) -> None:
+        tc_range = vtc.Range.from_frames(86400, 172800, rate="24000/1001")
+        expected = vtc.Range(
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F23_98),
+            vtc.Timecode("02:00:00:00", rate=vtc.RATE.F23_98),
+        )
+        self.assertEqual(expected, tc_range, "range expected")
+        self.assertEqual(vtc.RATE.F23_98, tc_range.rate, "rate expected")
+        self.assertEqual(86400, tc_range.frame_in, "frame in expected")
+        self.assertEqual(172800, tc_range.frame_out, "frame out expected")
+
+        flipped = vtc.Range.from_frames(172800, 86400, rate=vtc.RATE.F23_98)
+        self.assertEqual(expected, flipped, "flipped range expected")
+
+    def test_slots(self) -> None:
+        tc_range = vtc.Range.from_frames(0, 24, rate=vtc.RATE.F24)
+        self.assertFalse(hasattr(tc_range, "__dict__"), "range has no __dict__")
+
+    def test_contains_frame_sources(self) -> None:
+        tc_range = vtc.Range.from_frames(86400, 172800, rate=vtc.RATE.F24)
+
+        self.assertIn(86400, tc_range, "int in point")
+        self.assertNotIn(172800, tc_range, "int out point")
+        self.assertIn(vtc.PremiereTicks(914457600000000), tc_range, "ticks in point")
+        self.assertNotIn(vtc.PremiereTicks(0), tc_range, "ticks before in point")
+
+    def test_mixed_framerates(self) -> None:
+        range_24 = vtc.Range(
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24),
+            vtc.Timecode("02:00:00:00", rate=vtc.RATE.F24),
+        )
+        range_48 = vtc.Range(
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F48),
+            vtc.Timecode("02:00:00:00", rate=vtc.RATE.F48),
+        )
+        range_48_later = vtc.Range(
+            vtc.Timecode("01:30:00:00", rate=vtc.RATE.F48),
+            vtc.Timecode("02:30:00:00", rate=vtc.RATE.F48),
+        )
+        range_48_after = vtc.Range(
+            vtc.Timecode("03:00:00:00", rate=vtc.RATE.F48),
+            vtc.Timecode("04:00:00:00", rate=vtc.RATE.F48),
+        )
+
+        self.assertEqual(range_24, range_48, "equal across framerates")
+        self.assertNotEqual(range_24, range_48_later, "not equal across framerates")
+
+        self.assertIn(range_48_later, range_24, "overlaps across framerates")
+        self.assertNotIn(range_48_after, range_24, "no overlap across framerates")
+
+        self.assertIn(
+            vtc.Timecode("01:30:00:00", rate=vtc.RATE.F48), range_24, "tc contained"
+        )
+        self.assertNotIn(
+            vtc.Timecode("02:00:00:00", rate=vtc.RATE.F48), range_24, "tc not contained"
+        )
+
+        self.assertEqual(
+            vtc.Range(
+                vtc.Timecode("01:30:00:00", rate=vtc.RATE.F48),
+                vtc.Timecode("02:00:00:00", rate=vtc.RATE.F48),
+            ),
+            range_48.intersection(range_48_later),
+            "intersection",
+        )
+
+        self.assertEqual(
+            vtc.Range(
+                vtc.Timecode("02:00:00:00", rate=vtc.RATE.F48),
+                vtc.Timecode("03:00:00:00", rate=vtc.RATE.F48),
+            ),
+            range_48.separation(range_48_after),
+            "separation",
+        )
+
+        with self.assertRaises(ValueError):
+            range_24.intersection(range_48_later)
+
+        with self.assertRaises(ValueError):
+            range_24.separation(range_48_after)
+
+
+class TestRangeChunks(unittest.TestCase):
+    class TestCase(NamedTuple):
+        name: str
+        range_frames: Tuple[int, int]
+        chunk_size: Optional[int]
+        chunk_count: Optional[int]
+        align: Optional[int]
+        expected: List[Tuple[int, int]]
+
+    def test_chunks(self) -> None:
+        cases: List[TestRangeChunks.TestCase] = [
+            TestRangeChunks.TestCase(
+                name="size even",
+                range_frames=(100, 400),
+                chunk_size=100,
+                chunk_count=None,
+                align=None,
+                expected=[(100, 200), (200, 300), (300, 400)],
+            ),
+            TestRangeChunks.TestCase(
+                name="size remainder",
+                range_frames=(100, 350),
+                chunk_size=100,
+                chunk_count=None,
+                align=None,
+                expected=[(100, 200), (200, 300), (300, 350)],
+            ),
+            TestRangeChunks.TestCase(
+                name="size larger than range",
+                range_frames=(100, 150),
+                chunk_size=100,
+                chunk_count=None,
+                align=None,
+                expected=[(100, 150)],
+            ),
+            TestRangeChunks.TestCase(
+                name="count even",
+                range_frames=(0, 90),
+                chunk_size=None,
+                chunk_count=3,
+                align=None,
+                expected=[(0, 30), (30, 60), (60, 90)],
+            ),
+            TestRangeChunks.TestCase(
+                name="count remainder",
+                range_frames=(0, 10),
+                chunk_size=None,
+                chunk_count=3,
+                align=None,
+                expected=[(0, 3), (3, 6), (6, 10)],
+            ),
+            TestRangeChunks.TestCase(
+                name="count more than frames",
+                range_frames=(5, 8),
+                chunk_size=None,
+                chunk_count=10,
+                align=None,
+                expected=[(5, 6), (6, 7), (7, 8)],
+            ),
+            TestRangeChunks.TestCase(
+                name="size aligned",
+                range_frames=(10, 100),
+                chunk_size=30,
+                chunk_count=None,
+                align=24,
+                expected=[(10, 48), (48, 72), (72, 100)],
+            ),
+            TestRangeChunks.TestCase(
+                name="count aligned collapses",
+                range_frames=(0, 30),
+                chunk_size=None,
+                chunk_count=6,
+                align=12,
+                expected=[(0, 12), (12, 24), (24, 30)],
+            ),
+            TestRangeChunks.TestCase(
+                name="negative aligned",
+                range_frames=(-50, 10),
+                chunk_size=25,
+                chunk_count=None,
+                align=10,
+                expected=[(-50, -30), (-30, -10), (-10, 10)],
+            ),
+            TestRangeChunks.TestCase(
+                name="empty range",
+                range_frames=(100, 100),
+                chunk_size=10,
+                chunk_count=None,
+                align=None,
+                expected=[],
+            ),
+        ]
+
+        for case in cases:
+            with self.subTest(case.name):
+                tc_range = vtc.Range(
+                    vtc.Timecode(case.range_frames[0], rate=vtc.RATE.F23_98),
+                    vtc.Timecode(case.range_frames[1], rate=vtc.RATE.F23_98),
+                )
+                chunks = list(
+                    tc_range.chunks(
+                        size=case.chunk_size,
+                        count=case.chunk_count,
+                        align=case.align,
+                    )
+                )
+
+                self.assertEqual(
+                    case.expected,
+                    [(c.tc_in.frames, c.tc_out.frames) for c in chunks],
+                    "chunk frames",
+                )
+
+                for chunk in chunks:
+                    self.assertEqual(vtc.RATE.F23_98, chunk.tc_in.rate, "in rate")
+                    self.assertEqual(vtc.RATE.F23_98, chunk.tc_out.rate, "out rate")
+
+    def test_chunks_size_aligned_max_length(self) -> None:
+        """
+        Tests that chunks split on size and align are never longer than
+        size + align - 1 frames.
+        """
+        for size in (1, 5, 24, 30, 100):
+            for align in (1, 7, 24, 48):
+                with self.subTest(f"size {size} align {align}"):
+                    tc_range = vtc.Range(
+                        vtc.Timecode(13, rate=vtc.RATE.F24),
+                        vtc.Timecode(2000, rate=vtc.RATE.F24),
+                    )
+                    chunks = list(tc_range.chunks(size=size, align=align))
+
+                    self.assertEqual(13, chunks[0].tc_in.frames, "first in")
+                    self.assertEqual(2000, chunks[-1].tc_out.frames, "last out")
+                    for chunk in chunks:
+                        self.assertLessEqual(len(chunk), size + align - 1, "length")
+                    for chunk in chunks[1:]:
+                        self.assertEqual(0, chunk.tc_in.frames % align, "aligned")
+                    for chunk, following in zip(chunks, chunks[1:]):
+                        self.assertEqual(chunk.tc_out, following.tc_in, "contiguous")
+
+    def test_chunks_timecode(self) -> None:
+        tc_range = vtc.Range(
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F23_98),
+            vtc.Timecode("01:00:02:12", rate=vtc.RATE.F23_98),
+        )
+
+        chunks = list(tc_range.chunks(size=24, align=24))
+        self.assertEqual(
+            [
+                vtc.Range(
+                    vtc.Timecode("01:00:00:00", rate=vtc.RATE.F23_98),
+                    vtc.Timecode("01:00:01:00", rate=vtc.RATE.F23_98),
+                ),
+                vtc.Range(
+                    vtc.Timecode("01:00:01:00", rate=vtc.RATE.F23_98),
+                    vtc.Timecode("01:00:02:00", rate=vtc.RATE.F23_98),
+                ),
+                vtc.Range(
+                    vtc.Timecode("01:00:02:00", rate=vtc.RATE.F23_98),
+                    vtc.Timecode("01:00:02:12", rate=vtc.RATE.F23_98),
+                ),
+            ],
+            chunks,
+        )
+
+    def test_chunks_errors(self) -> None:
+        class ErrorCase(NamedTuple):
+            chunk_size: Optional[int]
+            chunk_count: Optional[int]
+            align: Optional[int]
+            message: str
+
+        cases: List[ErrorCase] = [
+            ErrorCase(None, None, None, "one of size or count must be set"),
+            ErrorCase(10, 2, None, "only one of size or count may be set"),
+            ErrorCase(0, None, None, "chunk size must be at least 1, got 0"),
+            ErrorCase(None, -1, None, "chunk count must be at least 1, got -1"),
+            ErrorCase(10, None, 0, "chunk align must be at least 1, got 0"),
+        ]
+
+        tc_range = vtc.Range(
+            vtc.Timecode(0, rate=vtc.RATE.F24),
+            vtc.Timecode(100, rate=vtc.RATE.F24),
+        )
+
+        for case in cases:
+            with self.subTest(case.message):
+                with self.assertRaises(ValueError) as error:
+                    tc_range.chunks(
+                        size=case.chunk_size,
+                        count=case.chunk_count,
+                        align=case.align,
+                    )
+
+                self.assertEqual(case.message, str(error.exception))
+
+
+class TestRangeContainsMany(unittest.TestCase):
+    RANGE = vtc.Range(
+        vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24),
+        vtc.Timecode("02:00:00:00", rate=vtc.RATE.F24),
+    )
+
+    def test_contains_many(self) -> None:
+        values: List[vtc.TimecodeSource] = [
+            86399,
+            86400,
+            172799,
+            172800,
+            "01:30:00:00",
+            "00:59:59:23",
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24),
+            vtc.Timecode("02:00:00:00", rate=vtc.RATE.F24),
+            vtc.Timecode("01:59:59:47", rate=vtc.RATE.F48),
+            vtc.Timecode("00:59:59:47", rate=vtc.RATE.F48),
+            vtc.PremiereTicks(914457600000000),
+        ]
+
+        expected = [
+            False,
+            True,
+            True,
+            False,
+            True,
+            False,
+            True,
+            False,
+            True,
+            False,
+            True,
+        ]
+
+        self.assertEqual(expected, self.RANGE.contains_many(values))
+        self.assertEqual(
+            [value in self.RANGE for value in values],
+            expected,
+            "matches __contains__",
+        )
+
+    def test_contains_many_bad_type(self) -> None:
+        with self.assertRaises(TypeError):
+            self.RANGE.contains_many([dict()])  # type: ignore
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_contains_many_numpy(self) -> None:
+        values = numpy.array([[86399, 86400], [172799, 172800]], dtype=numpy.int64)
+        result = self.RANGE.contains_many(values)
+
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual([[False, True], [True, False]], numpy.asarray(result).tolist())
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_contains_many_numpy_strings(self) -> None:
+        values = numpy.array(["00:59:59:23", "01:00:00:00"])
+        result = self.RANGE.contains_many(values)
+
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual([False, True], numpy.asarray(result).tolist())
+
+    def test_contains_many_numpy_not_installed(self) -> None:
+        with unittest.mock.patch.object(vtc._compat, "numpy", None):
+            self.assertEqual(
+                [False, True], self.RANGE.contains_many(range(86399, 86401))
+            )
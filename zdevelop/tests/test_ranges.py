@@ -0,0 +1,571 @@
+import random
+import time
+import unittest
+import vtc
+
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+def _random_ranges(
+    rng: random.Random,
+    count: int,
+    rate: vtc.Framerate = vtc.RATE.F24,
+) -> List[vtc.Range]:
+    ranges = list()
+    for _ in range(count):
+        frame_in = rng.randint(0, 500)
+        ranges.append(_frame_range(frame_in, frame_in + rng.randint(0, 60), rate))
+    return ranges
+
+
+def _frame_range(tc_in: int, tc_out: int, rate: vtc.Framerate) -> vtc.Range:
+    return vtc.Range(vtc.Timecode(tc_in, rate=rate), vtc.Timecode(tc_out, rate=rate))
+
+
+class TestChunks(unittest.TestCase):
+    def test_chunks(self) -> None:
+        range1 = _frame_range(0, 250, vtc.RATE.F24)
+        range2 = _frame_range(1000, 1100, vtc.RATE.F29_97_DF)
+
+        result = list(vtc.ranges.chunks(iter([range1, range2]), size=100))
+
+        self.assertEqual(
+            [
+                (range1, _frame_range(0, 100, vtc.RATE.F24)),
+                (range1, _frame_range(100, 200, vtc.RATE.F24)),
+                (range1, _frame_range(200, 250, vtc.RATE.F24)),
+                (range2, _frame_range(1000, 1100, vtc.RATE.F29_97_DF)),
+            ],
+            result,
+        )
+
+    def test_chunks_error_is_eager(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.ranges.chunks([], size=10, count=2)
+
+        self.assertEqual("only one of size or count may be set", str(error.exception))
+
+
+class TestFromFrames(unittest.TestCase):
+    def test_from_frames(self) -> None:
+        result = vtc.ranges.from_frames([(0, 24), (48, 24)], rate="24")
+
+        self.assertEqual(
+            [
+                _frame_range(0, 24, vtc.RATE.F24),
+                _frame_range(24, 48, vtc.RATE.F24),
+            ],
+            result,
+        )
+        self.assertIs(result[0].rate, result[1].rate, "framerate is shared")
+
+
+class TestJoin(unittest.TestCase):
+    def test_join_matches_brute_force(self) -> None:
+        rng = random.Random(29)
+        left = _random_ranges(rng, 200)
+        right = _random_ranges(rng, 150)
+
+        expected = set()
+        for i, left_range in enumerate(left):
+            for j, right_range in enumerate(right):
+                intersection = left_range.intersection(right_range)
+                if intersection is not None:
+                    expected.add(
+                        (i, j, intersection.frame_in, intersection.frame_out),
+                    )
+
+        result = set()
+        for match in vtc.ranges.join(left, right):
+            self.assertIs(left[match.left_index], match.left, "left range")
+            self.assertIs(right[match.right_index], match.right, "right range")
+            result.add(
+                (
+                    match.left_index,
+                    match.right_index,
+                    match.intersection.frame_in,
+                    match.intersection.frame_out,
+                )
+            )
+
+        self.assertEqual(expected, result)
+
+    def test_join_how(self) -> None:
+        left = [_frame_range(0, 100, vtc.RATE.F24)]
+        right = [
+            _frame_range(10, 20, vtc.RATE.F24),
+            _frame_range(90, 110, vtc.RATE.F24),
+            _frame_range(-10, 200, vtc.RATE.F24),
+            _frame_range(100, 110, vtc.RATE.F24),
+        ]
+
+        class TestCase(NamedTuple):
+            how: str
+            expected: List[Tuple[int, int]]
+
+        cases = [
+            TestCase(how="overlap", expected=[(0, 2), (0, 0), (0, 1)]),
+            TestCase(how="contains", expected=[(0, 0)]),
+            TestCase(how="within", expected=[(0, 2)]),
+        ]
+
+        for case in cases:
+            with self.subTest(case.how):
+                result = vtc.ranges.join(left, right, how=case.how)
+                self.assertEqual(
+                    case.expected,
+                    [(match.left_index, match.right_index) for match in result],
+                )
+
+    def test_join_zero_length(self) -> None:
+        left = [
+            _frame_range(10, 10, vtc.RATE.F24),
+            _frame_range(0, 20, vtc.RATE.F24),
+            _frame_range(10, 20, vtc.RATE.F24),
+        ]
+        right = [_frame_range(10, 10, vtc.RATE.F24), _frame_range(10, 11, vtc.RATE.F24)]
+
+        result = vtc.ranges.join(left, right)
+        self.assertEqual(
+            [(1, 0), (1, 1), (2, 1)],
+            [(match.left_index, match.right_index) for match in result],
+        )
+
+        for match in vtc.ranges.join(left, right):
+            self.assertIn(match.right, match.left, "overlapping")
+
+    def test_join_keys(self) -> None:
+        left = [_frame_range(0, 100, vtc.RATE.F24), _frame_range(0, 100, vtc.RATE.F24)]
+        right = [_frame_range(50, 60, vtc.RATE.F24), _frame_range(50, 60, vtc.RATE.F24)]
+
+        result = vtc.ranges.join(
+            left,
+            right,
+            left_keys=["A001", "A002"],
+            right_keys=iter(["A002", "A003"]),
+        )
+
+        self.assertEqual(
+            [(1, 0, _frame_range(50, 60, vtc.RATE.F24))],
+            [(m.left_index, m.right_index, m.intersection) for m in result],
+        )
+
+    def test_join_errors(self) -> None:
+        ranges = [_frame_range(0, 100, vtc.RATE.F24)]
+
+        class ErrorCase(NamedTuple):
+            name: str
+            kwargs: Dict[str, Any]
+            right: List[vtc.Range]
+            message: str
+
+        cases = [
+            ErrorCase(
+                name="bad how",
+                kwargs=dict(how="outer"),
+                right=ranges,
+                message="how must be one of ('overlap', 'contains', 'within'), got "
+                "'outer'",
+            ),
+            ErrorCase(
+                name="one keys",
+                kwargs=dict(left_keys=["A001"]),
+                right=ranges,
+                message="left_keys and right_keys must be set together",
+            ),
+            ErrorCase(
+                name="keys length",
+                kwargs=dict(left_keys=["A001", "A002"], right_keys=["A001"]),
+                right=ranges,
+                message="got 2 keys for 1 ranges, must have one key per range",
+            ),
+            ErrorCase(
+                name="mixed rates",
+                kwargs=dict(),
+                right=[_frame_range(0, 100, vtc.RATE.F23_98)],
+                message="all ranges must have matching framerate",
+            ),
+        ]
+
+        for case in cases:
+            with self.subTest(case.name):
+                with self.assertRaises(ValueError) as error:
+                    vtc.ranges.join(ranges, case.right, **case.kwargs)
+
+                self.assertEqual(case.message, str(error.exception))
+
+
+def _crowded_ranges(rng: random.Random, count: int) -> List[vtc.Range]:
+    ranges = list()
+    for _ in range(count):
+        frame_in = rng.randint(0, 6)
+        ranges.append(
+            _frame_range(frame_in, frame_in + rng.randint(8, 14), vtc.RATE.F24)
+        )
+    return ranges
+
+
+def _best_matching(
+    old: List[vtc.Range], new: List[vtc.Range], tolerance: int
+) -> Tuple[int, int]:
+    """
+    _best_matching returns the number of pairs and negated total distance of the best
+    fuzzy matching, by trying every matching.
+    """
+    if not old:
+        return 0, 0
+
+    first, rest = old[0], old[1:]
+    best = _best_matching(rest, new, tolerance)
+    for index, candidate in enumerate(new):
+        in_distance = abs(candidate.frame_in - first.frame_in)
+        out_distance = abs(candidate.frame_out - first.frame_out)
+        if max(in_distance, out_distance, abs(len(candidate) - len(first))) > tolerance:
+            continue
+
+        count, distance = _best_matching(
+            rest, new[:index] + new[index + 1 :], tolerance
+        )
+        best = max(best, (count + 1, distance - in_distance - out_distance))
+
+    return best
+
+
+class TestFuzzyMatch(unittest.TestCase):
+    def test_fuzzy_match(self) -> None:
+        old = [
+            _frame_range(0, 100, vtc.RATE.F24),
+            _frame_range(200, 300, vtc.RATE.F24),
+            _frame_range(400, 500, vtc.RATE.F24),
+            _frame_range(600, 700, vtc.RATE.F24),
+        ]
+        new = [
+            _frame_range(602, 698, vtc.RATE.F24),
+            _frame_range(201, 300, vtc.RATE.F24),
+            _frame_range(199, 301, vtc.RATE.F24),
+            _frame_range(-2, 102, vtc.RATE.F24),
+            _frame_range(401, 500, vtc.RATE.F24),
+        ]
+
+        result = vtc.ranges.fuzzy_match(old, new, tolerance=2, out_tolerance=1)
+
+        self.assertEqual(
+            [(1, 1, 1, 0), (2, 4, 1, 0)],
+            [(m.left_index, m.right_index, m.in_offset, m.out_offset) for m in result],
+        )
+        self.assertIs(old[1], result[0].left, "left range")
+        self.assertIs(new[1], result[0].right, "right range")
+
+    def test_fuzzy_match_one_to_one(self) -> None:
+        old = [
+            _frame_range(100, 200, vtc.RATE.F24),
+            _frame_range(101, 201, vtc.RATE.F24),
+        ]
+        new = [
+            _frame_range(101, 201, vtc.RATE.F24),
+            _frame_range(100, 200, vtc.RATE.F24),
+        ]
+
+        result = vtc.ranges.fuzzy_match(old, new, tolerance=5)
+
+        self.assertEqual(
+            [(0, 1), (1, 0)],
+            [(m.left_index, m.right_index) for m in result],
+        )
+
+    def test_fuzzy_match_most_pairs(self) -> None:
+        """
+        test_fuzzy_match_most_pairs tests that an exact pair is given up when that lets
+        both of its ranges be matched to others.
+        """
+        old = [
+            _frame_range(100, 200, vtc.RATE.F24),
+            _frame_range(99, 200, vtc.RATE.F24),
+        ]
+        new = [
+            _frame_range(100, 200, vtc.RATE.F24),
+            _frame_range(101, 200, vtc.RATE.F24),
+        ]
+
+        result = vtc.ranges.fuzzy_match(old, new, tolerance=1)
+
+        self.assertEqual(
+            [(0, 1, 1, 0), (1, 0, 1, 0)],
+            [(m.left_index, m.right_index, m.in_offset, m.out_offset) for m in result],
+        )
+
+    def test_fuzzy_match_optimal(self) -> None:
+        rng = random.Random(31)
+
+        for trial in range(100):
+            old = _crowded_ranges(rng, rng.randint(1, 6))
+            new = _crowded_ranges(rng, rng.randint(1, 6))
+
+            with self.subTest(trial):
+                result = vtc.ranges.fuzzy_match(old, new, tolerance=3)
+                distance = sum(abs(m.in_offset) + abs(m.out_offset) for m in result)
+                self.assertEqual(_best_matching(old, new, 3), (len(result), -distance))
+
+    def test_fuzzy_match_dense_groups(self) -> None:
+        """
+        test_fuzzy_match_dense_groups tests that large groups of repeated and
+        overlapping ranges are matched quickly. Matching every range of the chain means
+        shifting every pair over by one.
+        """
+        old = [_frame_range(frame, frame + 50, vtc.RATE.F24) for frame in range(3000)]
+        new = [
+            _frame_range(frame + 1, frame + 51, vtc.RATE.F24) for frame in range(3000)
+        ]
+        old.extend([_frame_range(10000, 10050, vtc.RATE.F24)] * 1000)
+        new.extend([_frame_range(10001, 10050, vtc.RATE.F24)] * 1000)
+
+        start = time.perf_counter()
+        result = vtc.ranges.fuzzy_match(old, new, tolerance=2)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(4000, len(result))
+        self.assertEqual(
+            7000, sum(abs(m.in_offset) + abs(m.out_offset) for m in result)
+        )
+        self.assertLess(elapsed, 10, "matching time")
+
+    def test_fuzzy_match_duration(self) -> None:
+        old = [_frame_range(100, 200, vtc.RATE.F24)]
+        new = [_frame_range(98, 202, vtc.RATE.F24)]
+
+        self.assertEqual(
+            [], vtc.ranges.fuzzy_match(old, new, tolerance=2, duration_tolerance=3)
+        )
+        self.assertEqual(
+            1, len(vtc.ranges.fuzzy_match(old, new, tolerance=2, duration_tolerance=4))
+        )
+
+    def test_fuzzy_match_against_brute_force(self) -> None:
+        rng = random.Random(30)
+        old = _random_ranges(rng, 300)
+        new = [
+            _frame_range(
+                r.frame_in + rng.randint(-3, 3),
+                r.frame_out + rng.randint(-3, 3),
+                vtc.RATE.F24,
+            )
+            for r in old
+        ]
+        rng.shuffle(new)
+
+        for match in vtc.ranges.fuzzy_match(old, new, tolerance=2):
+            self.assertLessEqual(abs(match.in_offset), 2, "in tolerance")
+            self.assertLessEqual(abs(match.out_offset), 2, "out tolerance")
+            self.assertLessEqual(
+                abs(len(match.right) - len(match.left)), 2, "duration tolerance"
+            )
+
+        matched = vtc.ranges.fuzzy_match(old, new, tolerance=2)
+        self.assertEqual(
+            len(matched),
+            len({m.left_index for m in matched}),
+            "left matched once",
+        )
+        self.assertEqual(
+            len(matched),
+            len({m.right_index for m in matched}),
+            "right matched once",
+        )
+
+    def test_fuzzy_match_negative_tolerance(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.ranges.fuzzy_match([], [], in_tolerance=-1)
+
+        self.assertEqual(
+            "in_tolerance cannot be negative, got -1", str(error.exception)
+        )
+
+
+class TestContinuity(unittest.TestCase):
+    def test_continuity(self) -> None:
+        ranges = [
+            _frame_range(100, 200, vtc.RATE.F24),
+            _frame_range(0, 100, vtc.RATE.F24),
+            _frame_range(190, 260, vtc.RATE.F24),
+            _frame_range(300, 400, vtc.RATE.F24),
+            _frame_range(210, 220, vtc.RATE.F24),
+            _frame_range(400, 410, vtc.RATE.F24),
+        ]
+
+        report = vtc.ranges.continuity(reversed(ranges))
+        reversed_index = len(ranges) - 1
+
+        def summary(junctions: List[vtc.ranges.Junction]) -> List[Tuple[int, ...]]:
+            return [
+                (
+                    reversed_index - j.before_index,
+                    reversed_index - j.after_index,
+                    j.range.frame_in,
+                    j.range.frame_out,
+                    j.frames,
+                )
+                for j in junctions
+            ]
+
+        self.assertEqual([(2, 3, 260, 300, 40)], summary(report.gaps), "gaps")
+        self.assertEqual(
+            [(0, 2, 190, 200, 10), (2, 4, 210, 220, 10)],
+            summary(report.overlaps),
+            "overlaps",
+        )
+        self.assertEqual(
+            [(1, 0, 100, 100, 0), (3, 5, 400, 400, 0)],
+            summary(report.butt_joins),
+            "butt joins",
+        )
+
+        gap = report.gaps[0]
+        self.assertIs(ranges[2], gap.before, "gap before range")
+        self.assertIs(ranges[3], gap.after, "gap after range")
+
+    def test_continuity_empty(self) -> None:
+        report = vtc.ranges.continuity([])
+        self.assertEqual(vtc.ranges.ContinuityReport([], [], []), report)
+
+    def test_continuity_against_brute_force(self) -> None:
+        rng = random.Random(31)
+        ranges = _random_ranges(rng, 200)
+        report = vtc.ranges.continuity(ranges)
+
+        expected_overlaps = set()
+        expected_butts = set()
+        for i, range1 in enumerate(ranges):
+            for j, range2 in enumerate(ranges):
+                if i < j and range1.intersection(range2) is not None:
+                    expected_overlaps.add((i, j))
+                if i != j and range1.frame_out == range2.frame_in:
+                    expected_butts.add((i, j))
+
+        self.assertEqual(
+            expected_overlaps,
+            {tuple(sorted((j.before_index, j.after_index))) for j in report.overlaps},
+            "overlaps",
+        )
+        self.assertEqual(
+            expected_butts,
+            {(j.before_index, j.after_index) for j in report.butt_joins},
+            "butt joins",
+        )
+
+        covered: Set[int] = set()
+        for tc_range in ranges:
+            covered.update(range(tc_range.frame_in, tc_range.frame_out))
+        gap_frames: Set[int] = set()
+        for gap in report.gaps:
+            gap_frames.update(range(gap.range.frame_in, gap.range.frame_out))
+
+        start = min(r.frame_in for r in ranges)
+        end = max(r.frame_out for r in ranges)
+        self.assertEqual(set(range(start, end)) - covered, gap_frames, "gaps")
+
+
+class TestAllocateTracks(unittest.TestCase):
+    def test_allocate_tracks(self) -> None:
+        ranges = [
+            _frame_range(0, 100, vtc.RATE.F24),
+            _frame_range(50, 150, vtc.RATE.F24),
+            _frame_range(100, 200, vtc.RATE.F24),
+            _frame_range(60, 70, vtc.RATE.F24),
+            _frame_range(70, 70, vtc.RATE.F24),
+            _frame_range(150, 160, vtc.RATE.F24),
+        ]
+
+        self.assertEqual([0, 1, 0, 2, 2, 1], vtc.ranges.allocate_tracks(iter(ranges)))
+
+    def test_allocate_tracks_random(self) -> None:
+        rng = random.Random(32)
+        # Zero-length ranges are left out so the depth check below is exact.
+        ranges = [r for r in _random_ranges(rng, 300) if len(r) > 0]
+        tracks = vtc.ranges.allocate_tracks(ranges)
+
+        for i, range1 in enumerate(ranges):
+            for j, range2 in enumerate(ranges):
+                if i != j and tracks[i] == tracks[j]:
+                    self.assertNotIn(range2, range1, "ranges on track overlap")
+
+        # The number of tracks needed is the most ranges overlapping a single point.
+        depth = 0
+        for frame in range(0, 600):
+            frame_depth = sum(1 for r in ranges if frame in r)
+            depth = max(depth, frame_depth)
+
+        self.assertEqual(depth, max(tracks) + 1, "track count is minimal")
+
+
+class TestClusters(unittest.TestCase):
+    RANGES = [
+        _frame_range(100, 200, vtc.RATE.F24),
+        _frame_range(0, 50, vtc.RATE.F24),
+        _frame_range(150, 250, vtc.RATE.F24),
+        _frame_range(250, 300, vtc.RATE.F24),
+        _frame_range(40, 60, vtc.RATE.F24),
+        _frame_range(303, 310, vtc.RATE.F24),
+    ]
+
+    def test_clusters(self) -> None:
+        class TestCase(NamedTuple):
+            max_gap: Optional[int]
+            expected: List[Tuple[List[int], Tuple[int, int]]]
+
+        cases = [
+            TestCase(
+                max_gap=None,
+                expected=[
+                    ([1, 4], (0, 60)),
+                    ([0, 2], (100, 250)),
+                    ([3], (250, 300)),
+                    ([5], (303, 310)),
+                ],
+            ),
+            TestCase(
+                max_gap=0,
+                expected=[
+                    ([1, 4], (0, 60)),
+                    ([0, 2, 3], (100, 300)),
+                    ([5], (303, 310)),
+                ],
+            ),
+            TestCase(
+                max_gap=3,
+                expected=[
+                    ([1, 4], (0, 60)),
+                    ([0, 2, 3, 5], (100, 310)),
+                ],
+            ),
+            TestCase(
+                max_gap=40,
+                expected=[([1, 4, 0, 2, 3, 5], (0, 310))],
+            ),
+        ]
+
+        for case in cases:
+            with self.subTest(f"max_gap: {case.max_gap}"):
+                result = vtc.ranges.clusters(iter(self.RANGES), max_gap=case.max_gap)
+                self.assertEqual(
+                    case.expected,
+                    [
+                        (c.indexes, (c.range.frame_in, c.range.frame_out))
+                        for c in result
+                    ],
+                )
+
+                for cluster in result:
+                    self.assertEqual(
+                        [self.RANGES[i] for i in cluster.indexes],
+                        cluster.ranges,
+                        "members",
+                    )
+
+    def test_clusters_empty(self) -> None:
+        self.assertEqual([], vtc.ranges.clusters([]))
+
+    def test_clusters_negative_gap(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.ranges.clusters([], max_gap=-1)
+
+        self.assertEqual("max_gap cannot be negative, got -1", str(error.exception))
@@ -0,0 +1,45 @@
+import copy
+import pickle
+import unittest
+import vtc
+
+
+class TestSamples(unittest.TestCase):
+    """
+    TestSamples tests that the results of Samples magic methods keep the sample rate of
+    the left operand.
+    """
+
+    A = vtc.Samples(1, 48000)
+    B = vtc.Samples(5, 96000)
+
+    def test_add(self) -> None:
+        result = self.A + self.B
+        self.assertEqual(6, result, "result expected")
+        self.assertIsInstance(result, vtc.Samples, "type correct")
+        self.assertEqual(48000, result.sample_rate, "sample rate kept")
+
+    def test_radd(self) -> None:
+        result = 1 + self.B
+        self.assertEqual(6, result, "result expected")
+        self.assertEqual(96000, result.sample_rate, "sample rate kept")
+
+    def test_divmod(self) -> None:
+        result = divmod(self.B, 2)
+        self.assertEqual((2, 1), result, "result expected")
+        self.assertEqual(96000, result[0].sample_rate, "sample rate kept")
+        self.assertEqual(96000, result[1].sample_rate, "sample rate kept")
+
+    def test_copy(self) -> None:
+        for result in [copy.copy(self.B), pickle.loads(pickle.dumps(self.B))]:
+            self.assertEqual(5, result, "result expected")
+            self.assertIsInstance(result, vtc.Samples, "type correct")
+            self.assertEqual(96000, result.sample_rate, "sample rate kept")
+
+    def test_bad_sample_rate(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.Samples(1, -48000)
+
+        self.assertEqual(
+            "sample rate must be positive, got -48000", str(error.exception)
+        )
@@ -0,0 +1,176 @@
+import struct
+import unittest
+import unittest.mock
+import vtc
+
+from typing import Any, List, NamedTuple
+
+from vtc._compat import numpy
+
+
+class WordCase(NamedTuple):
+    timecode: vtc.Timecode
+    user_bits: int
+    color_frame: bool
+    word: int
+
+
+class TestPackUnpack(unittest.TestCase):
+
+    cases = [
+        WordCase(
+            timecode=vtc.Timecode("01:02:03:04", rate=24),
+            user_bits=0x87654321,
+            color_frame=True,
+            word=0x8071605240332814,
+        ),
+        WordCase(
+            timecode=vtc.Timecode("00:10:00;00", rate=vtc.RATE.F29_97_DF),
+            user_bits=0,
+            color_frame=False,
+            word=0x0000010000000400,
+        ),
+        WordCase(
+            timecode=vtc.Timecode("23:59:59;29", rate=vtc.RATE.F29_97_DF),
+            user_bits=0xF0000000,
+            color_frame=False,
+            word=0xF203050905090609,
+        ),
+        WordCase(
+            timecode=vtc.Timecode("12:34:56:24", rate=25),
+            user_bits=0,
+            color_frame=False,
+            word=0x0102030405060204,
+        ),
+    ]
+
+    def test_pack(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                word = vtc.smpte12m.pack(
+                    case.timecode,
+                    user_bits=case.user_bits,
+                    color_frame=case.color_frame,
+                )
+                self.assertEqual(hex(case.word), hex(word))
+
+    def test_unpack(self) -> None:
+        for case in self.cases:
+            with self.subTest(str(case.timecode)):
+                unpacked = vtc.smpte12m.unpack(case.word)
+                self.assertEqual(case.timecode.sections, unpacked.sections, "sections")
+                self.assertEqual(
+                    case.timecode.rate.dropframe, unpacked.dropframe, "dropframe"
+                )
+                self.assertEqual(case.color_frame, unpacked.color_frame, "color frame")
+                self.assertEqual(case.user_bits, unpacked.user_bits, "user bits")
+                self.assertEqual(
+                    case.timecode, unpacked.timecode(case.timecode.rate), "timecode"
+                )
+
+    def test_pack_wraps_day(self) -> None:
+        for timecode in ["24:00:00:01", "-00:00:00:23"]:
+            with self.subTest(timecode):
+                tc = vtc.Timecode(timecode, rate=24)
+                word = vtc.smpte12m.pack(tc)
+                self.assertEqual(
+                    tc.frames % (24 * 86400),
+                    vtc.smpte12m.unpack(word).timecode(24).frames,
+                )
+
+    def test_bad_rate(self) -> None:
+        cases: List[Any] = [vtc.RATE.F48, vtc.RATE.F59_94_DF, (47, 2)]
+        for rate in cases:
+            with self.subTest(str(rate)):
+                with self.assertRaises(ValueError) as error:
+                    vtc.smpte12m.pack_frames([0], rate=rate)
+
+                timebase = vtc.Framerate(rate).timebase
+                self.assertEqual(
+                    "SMPTE 12M words require a whole-number timebase of 30 frames or"
+                    f" less, got {timebase}",
+                    str(error.exception),
+                )
+
+
+class TestBatch(unittest.TestCase):
+
+    rates = [vtc.RATE.F24, vtc.RATE.F23_98, vtc.RATE.F29_97_DF, vtc.Framerate(25)]
+
+    def test_round_trip(self) -> None:
+        for rate in self.rates:
+            with self.subTest(str(rate)):
+                frames = list(range(0, 2_000_000, 997))
+                words = vtc.smpte12m.pack_frames(frames, rate=rate, user_bits=0xABCD)
+
+                expected = [
+                    vtc.smpte12m.pack(vtc.Timecode(f, rate=rate), user_bits=0xABCD)
+                    for f in frames
+                ]
+                self.assertEqual(expected, words, "words")
+
+                with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                    buffer = struct.pack(f"<{len(words)}Q", *words)
+                    result = vtc.smpte12m.unpack_frames(buffer, rate=rate)
+                    self.assertEqual(frames, result, "buffer")
+
+                    result = vtc.smpte12m.unpack_frames(words, rate=rate)
+                    self.assertEqual(frames, result, "list")
+
+    def test_user_bits(self) -> None:
+        words = [
+            vtc.smpte12m.pack(vtc.Timecode(0, rate=24), user_bits=bits)
+            for bits in [0, 0x12345678, 0xFFFFFFFF]
+        ]
+        buffer = memoryview(struct.pack("<3Q", *words))
+
+        with unittest.mock.patch.object(vtc._compat, "numpy", None):
+            result = vtc.smpte12m.unpack_user_bits(buffer)
+            self.assertEqual([0, 0x12345678, 0xFFFFFFFF], result, "buffer")
+
+            result = vtc.smpte12m.unpack_user_bits(words)
+            self.assertEqual([0, 0x12345678, 0xFFFFFFFF], result, "list")
+
+    def test_bad_buffer(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            vtc.smpte12m.unpack_frames(bytes(12), rate=24)
+        self.assertEqual(
+            "word buffer length must be a multiple of 8, got 12", str(error.exception)
+        )
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        for rate in self.rates:
+            with self.subTest(str(rate)):
+                frames = numpy.arange(-1000, 5_000_000, 1009, dtype=numpy.int64)
+                expected = vtc.smpte12m.pack_frames(
+                    frames.tolist(), rate=rate, user_bits=0xF0000001
+                )
+
+                words: Any = vtc.smpte12m.pack_frames(
+                    frames, rate=rate, user_bits=0xF0000001
+                )
+                self.assertEqual(numpy.uint64, words.dtype, "dtype")
+                self.assertEqual(expected, words.tolist(), "words")
+
+                wrapped = numpy.mod(frames, _frames_per_day(rate))
+                buffer = bytearray(words.astype("<u8").tobytes())
+                result: Any = vtc.smpte12m.unpack_frames(buffer, rate=rate)
+                self.assertEqual(wrapped.tolist(), result.tolist(), "buffer")
+
+                result = vtc.smpte12m.unpack_frames(words, rate=rate)
+                self.assertEqual(wrapped.tolist(), result.tolist(), "uint64 array")
+
+                result = vtc.smpte12m.unpack_frames(
+                    words.astype(numpy.int64), rate=rate
+                )
+                self.assertEqual(wrapped.tolist(), result.tolist(), "int64 array")
+
+                user_bits: Any = vtc.smpte12m.unpack_user_bits(buffer)
+                self.assertEqual(
+                    [0xF0000001] * len(frames), user_bits.tolist(), "user bits"
+                )
+
+
+def _frames_per_day(rate: vtc.Framerate) -> int:
+    return vtc.Timecode("24:00:00:00", rate=rate).frames
@@ -560,6 +560,72 @@ class TestParse(unittest.TestCase):
                     str(caught.exception),
                 )
 
+    def test_drop_frame_past_first_second(self) -> None:
+        """
+        Tests that frames are only dropped on the first second of a drop minute.
+        """
+        cases = [
+            (vtc.RATE.F29_97_DF, 1827, "00:01:00;29"),
+            (vtc.RATE.F29_97_DF, 1828, "00:01:01;00"),
+            (vtc.RATE.F29_97_DF, 1829, "00:01:01;01"),
+            (vtc.RATE.F29_97_DF, 2189, "00:01:13;01"),
+            (vtc.RATE.F29_97_DF, 15000, "00:08:20;16"),
+            (vtc.RATE.F59_94_DF, 3656, "00:01:01;00"),
+            (vtc.RATE.F59_94_DF, 3659, "00:01:01;03"),
+        ]
+
+        for rate, frames, timecode in cases:
+            with self.subTest(f"{rate} {timecode}"):
+                self.assertEqual(timecode, vtc.Timecode(frames, rate=rate).timecode)
+                self.assertEqual(frames, vtc.Timecode(timecode, rate=rate).frames)
+
+    def test_drop_frame_boundaries(self) -> None:
+        """
+        Tests the drop-frame timecode either side of dropped frame numbers, at the first
+        and later seconds of drop minutes, and at the 10-minute marks which drop none.
+        Timecode sections read from BCD time words must count the same frames.
+        """
+        cases = [
+            (vtc.RATE.F29_97_DF, 1799, "00:00:59;29"),
+            (vtc.RATE.F29_97_DF, 1800, "00:01:00;02"),
+            (vtc.RATE.F29_97_DF, 1828, "00:01:01;00"),
+            (vtc.RATE.F29_97_DF, 17981, "00:09:59;29"),
+            (vtc.RATE.F29_97_DF, 17982, "00:10:00;00"),
+            (vtc.RATE.F29_97_DF, 18010, "00:10:00;28"),
+            (vtc.RATE.F29_97_DF, 19781, "00:10:59;29"),
+            (vtc.RATE.F29_97_DF, 19782, "00:11:00;02"),
+            (vtc.RATE.F29_97_DF, 107892, "01:00:00;00"),
+            (vtc.RATE.F59_94_DF, 3599, "00:00:59;59"),
+            (vtc.RATE.F59_94_DF, 3600, "00:01:00;04"),
+            (vtc.RATE.F59_94_DF, 3656, "00:01:01;00"),
+            (vtc.RATE.F59_94_DF, 35964, "00:10:00;00"),
+            (vtc.RATE.F59_94_DF, 39564, "00:11:00;04"),
+        ]
+
+        for rate, frames, timecode in cases:
+            with self.subTest(f"{rate} {timecode}"):
+                self.assertEqual(timecode, vtc.Timecode(frames, rate=rate).timecode)
+                self.assertEqual(frames, vtc.Timecode(timecode, rate=rate).frames)
+
+                # Time words only have 2 bits for the tens of frames.
+                if int(timecode[-2:]) < 40:
+                    word = int("".join(char for char in timecode if char.isdigit()), 16)
+                    self.assertEqual(
+                        [frames], vtc.image.frames_from_words([word], rate=rate)
+                    )
+
+        dropped = [
+            (vtc.RATE.F29_97_DF, "00:01:00;00"),
+            (vtc.RATE.F29_97_DF, "00:01:00;01"),
+            (vtc.RATE.F29_97_DF, "00:11:00;01"),
+            (vtc.RATE.F59_94_DF, "00:01:00;03"),
+        ]
+
+        for rate, timecode in dropped:
+            with self.subTest(f"{rate} {timecode} dropped"):
+                with self.assertRaises(ValueError):
+                    vtc.Timecode(timecode, rate=rate)
+
     def test_error_on_class_with_rate(self) -> None:
         """Tests that we get an error when supplying a vtc.Timecode and rate."""
         with self.assertRaises(ValueError) as caught:
@@ -1385,3 +1451,136 @@ class TestTimecodeMethods(unittest.TestCase):
 
         self.assertEqual("00:30:00:00", rebased.timecode, "new tc expected")
         self.assertEqual(timecode.frames, rebased.frames, "frames identical")
+
+    def test_time_key(self) -> None:
+        """
+        test_time_key tests that time keys order and compare the same as timecodes
+        across framerates.
+        """
+        timecodes = [
+            vtc.Timecode(frames, rate=rate)
+            for rate in [
+                vtc.RATE.F23_98,
+                vtc.RATE.F24,
+                vtc.RATE.F29_97_DF,
+                vtc.RATE.F29_97_NDF,
+                vtc.RATE.F48,
+                vtc.RATE.F59_94_DF,
+                vtc.Framerate(25),
+                vtc.Framerate(50),
+            ]
+            for frames in range(-3000, 3000, 7)
+        ]
+
+        by_key = sorted(timecodes, key=lambda tc: tc.time_key)
+        by_rational = sorted(timecodes, key=lambda tc: tc.rational)
+        self.assertEqual(
+            [tc.rational for tc in by_rational],
+            [tc.rational for tc in by_key],
+            "sort order matches",
+        )
+
+        for tc1, tc2 in zip(by_key, by_key[1:]):
+            self.assertEqual(tc1 == tc2, tc1.time_key == tc2.time_key, "equality")
+
+        self.assertEqual(
+            2540160000000,
+            vtc.Timecode("01:00:00:00", rate=vtc.RATE.F24).time_key,
+            "flicks value",
+        )
+
+        index = {tc.time_key: tc for tc in timecodes}
+        self.assertEqual(
+            vtc.Timecode("00:00:01:00", rate=vtc.RATE.F48),
+            index[vtc.Timecode("00:00:01:00", rate=vtc.RATE.F24).time_key],
+            "dict lookup across framerates",
+        )
+
+    def test_time_key_not_whole_flicks(self) -> None:
+        """
+        test_time_key_not_whole_flicks tests the error for framerates that do not
+        divide evenly into flicks.
+        """
+        with self.assertRaises(ValueError) as error:
+            _ = vtc.Timecode(1, rate=11).time_key
+
+        self.assertEqual(
+            "time key of [00:00:00:01 @ [11]] is not a whole number of flicks",
+            str(error.exception),
+        )
+
+    def test_flicks(self) -> None:
+        """test_flicks tests exporting and parsing flicks values."""
+        cases = [
+            (vtc.RATE.F24, "01:00:00:00", 2540160000000),
+            (vtc.RATE.F23_98, "01:00:00:00", 2542700160000),
+            (vtc.RATE.F29_97_DF, "00:10:00;00", 423359576640),
+            (vtc.RATE.F59_94_NDF, "-00:00:01:00", -706305600),
+            (vtc.Framerate(25), "00:00:00:01", 28224000),
+        ]
+
+        for rate, timecode, flicks in cases:
+            with self.subTest(f"{timecode} @ {rate}"):
+                tc = vtc.Timecode(timecode, rate=rate)
+                self.assertEqual(flicks, tc.flicks, "flicks expected")
+                self.assertIsInstance(tc.flicks, vtc.Flicks, "flicks type")
+
+                parsed = vtc.Timecode(vtc.Flicks(flicks), rate=rate)
+                self.assertEqual(timecode, parsed.timecode, "parsed timecode")
+
+    def test_flicks_rounded(self) -> None:
+        """
+        test_flicks_rounded tests that flicks are rounded to the nearest frame when
+        parsed and to the nearest flick when exported.
+        """
+        tc = vtc.Timecode(vtc.Flicks(29400000 + 14700001), rate=vtc.RATE.F24)
+        self.assertEqual(2, tc.frames, "parsed frame rounded")
+
+        self.assertEqual(64145455, vtc.Timecode(1, rate=11).flicks, "flicks rounded")
+
+    def test_pts(self) -> None:
+        """test_pts tests exporting and parsing 90 kHz presentation timestamps."""
+        cases = [
+            (vtc.RATE.F24, "01:00:00:00", 324000000),
+            (vtc.RATE.F23_98, "00:00:00:01", 3754),
+            (vtc.RATE.F29_97_DF, "00:10:00;00", 53999946),
+            (vtc.Framerate(25), "-00:00:01:00", -90000),
+        ]
+
+        for rate, timecode, pts in cases:
+            with self.subTest(f"{timecode} @ {rate}"):
+                tc = vtc.Timecode(timecode, rate=rate)
+                self.assertEqual(pts, tc.pts, "pts expected")
+                self.assertIsInstance(tc.pts, vtc.PTS, "pts type")
+
+                parsed = vtc.Timecode(vtc.PTS(pts), rate=rate)
+                self.assertEqual(timecode, parsed.timecode, "parsed timecode")
+
+    def test_samples(self) -> None:
+        """test_samples tests exporting and parsing audio sample counts."""
+        pull_down = fractions.Fraction(48000000, 1001)
+        cases: List[Tuple[vtc.Framerate, str, vtc.SampleRateSource, int]] = [
+            (vtc.RATE.F24, "01:00:00:00", 48000, 172800000),
+            (vtc.RATE.F23_98, "01:00:00:00", 48000, 172972800),
+            (vtc.RATE.F23_98, "01:00:00:00", pull_down, 172800000),
+            (vtc.RATE.F29_97_DF, "00:00:00;01", 48048, 1603),
+            (vtc.RATE.F24, "-00:00:01:00", 96000, -96000),
+        ]
+
+        for rate, timecode, sample_rate, samples in cases:
+            with self.subTest(f"{timecode} @ {rate} @ {sample_rate}"):
+                tc = vtc.Timecode(timecode, rate=rate)
+                result = tc.samples(sample_rate)
+                self.assertEqual(samples, result, "samples expected")
+                self.assertIsInstance(result, vtc.Samples, "samples type")
+                self.assertEqual(sample_rate, result.sample_rate, "sample rate")
+
+                parsed = vtc.Timecode(vtc.Samples(samples, sample_rate), rate=rate)
+                self.assertEqual(timecode, parsed.timecode, "parsed timecode")
+
+    def test_samples_bad_rate(self) -> None:
+        """test_samples_bad_rate tests the error for non-positive sample rates."""
+        with self.assertRaises(ValueError) as error:
+            vtc.Timecode(1, rate=24).samples(0)
+
+        self.assertEqual("sample rate must be positive, got 0", str(error.exception))
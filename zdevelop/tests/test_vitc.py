@@ -0,0 +1,261 @@
+import pathlib
+import random
+import struct
+import tempfile
+import unittest
+import unittest.mock
+import vtc
+
+from typing import Any, List, Optional
+
+from vtc._compat import numpy
+
+_BLACK = 16
+_WHITE = 180
+
+
+def _codeword(word: int) -> List[int]:
+    bits: List[int] = list()
+    for group in range(8):
+        bits.extend([1, 0])
+        bits.extend((word >> (group * 8 + bit)) & 1 for bit in range(8))
+    bits.extend([1, 0])
+
+    # CRC bit n is the XOR of every eighth bit starting from bit n + 2.
+    crc = [sum(bits[(bit + 2) % 8 :: 8]) % 2 for bit in range(8)]
+    return bits + crc
+
+
+def _vitc_line(
+    timecode: Optional[vtc.Timecode],
+    *,
+    width: int = 720,
+    start: int = 10,
+    flip_bit: Optional[int] = None,
+    noise: Optional[random.Random] = None,
+) -> List[int]:
+    line = [_BLACK] * width
+    if timecode is None:
+        return line
+
+    bits = _codeword(vtc.smpte12m.pack(timecode))
+    if flip_bit is not None:
+        bits[flip_bit] ^= 1
+
+    lines_per_frame = 864 if timecode.rate.timebase == 25 else 858
+    bit_width = lines_per_frame / (116 if timecode.rate.timebase == 25 else 115)
+    samples_per_bit = bit_width * width / 720
+
+    for index in range(width):
+        bit = int((index - start) / samples_per_bit)
+        if index >= start and bit < len(bits) and bits[bit]:
+            line[index] = _WHITE
+
+    if noise is not None:
+        line = [sample + noise.randint(-8, 8) for sample in line]
+    return line
+
+
+def _timecodes(lines: Any, rate: vtc.Framerate) -> List[Any]:
+    return [
+        None if timecode is None else timecode.timecode
+        for timecode in vtc.vitc.decode(lines, rate=rate)
+    ]
+
+
+class TestDecode(unittest.TestCase):
+    def frames(self, rate: vtc.Framerate, width: int = 720) -> List[List[List[int]]]:
+        noise = random.Random(12)
+        start = vtc.Timecode("01:00:00:00", rate=rate) - 2
+        blank = _vitc_line(None, width=width)
+        frames: List[List[List[int]]] = list()
+
+        for offset in range(6):
+            timecode = start + offset
+            frames.append(
+                [
+                    _vitc_line(timecode, width=width, noise=noise),
+                    _vitc_line(timecode, width=width, start=30),
+                ]
+            )
+
+        # The first line is blank or corrupt, but the second is valid.
+        frames[1][0] = blank
+        frames[2][0] = _vitc_line(start + 2, width=width, flip_bit=20)
+        # No valid lines, from a bad CRC, bad sync bits and a cut off codeword.
+        frames[3] = [
+            _vitc_line(start + 3, width=width, flip_bit=89),
+            _vitc_line(start + 3, width=width, flip_bit=30),
+        ]
+        frames[5][0] = _vitc_line(start + 5, width=width, flip_bit=41)
+        frames[4] = [blank, _vitc_line(start + 4, width=width, start=width - 100)]
+        return frames
+
+    def expected(self, rate: vtc.Framerate) -> List[Any]:
+        start = vtc.Timecode("01:00:00:00", rate=rate) - 2
+        timecodes: List[Any] = [(start + offset).timecode for offset in range(6)]
+        timecodes[3] = None
+        timecodes[4] = None
+        return timecodes
+
+    def test_decode(self) -> None:
+        cases = [
+            (vtc.RATE.F29_97_DF, 720),
+            (vtc.Framerate(25), 720),
+            (vtc.RATE.F30, 1440),
+        ]
+
+        for rate, width in cases:
+            with self.subTest(f"{rate} {width}"):
+                frames = self.frames(rate, width)
+                self.assertEqual(self.expected(rate), _timecodes(frames, rate))
+
+                if numpy is not None:
+                    array = numpy.array(frames, dtype=numpy.int16)
+                    self.assertEqual(self.expected(rate), _timecodes(array, rate))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_decode_chunks(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        array = numpy.array(self.frames(rate), dtype=numpy.uint16)
+
+        with unittest.mock.patch.object(vtc.vitc._decode, "_CHUNK_FRAMES", 4):
+            timecodes = _timecodes(array, rate)
+
+        self.assertEqual(self.expected(rate), timecodes)
+
+    def test_decode_no_lines(self) -> None:
+        rate = vtc.RATE.F24
+        cases: List[Any] = [[[], []], [[[], []]]]
+        if numpy is not None:
+            cases.append(numpy.zeros((2, 0, 720), dtype=numpy.uint8))
+            cases.append(numpy.zeros((2, 2, 0), dtype=numpy.uint8))
+
+        for case in cases:
+            with self.subTest(str(case)):
+                self.assertEqual([None] * len(case), _timecodes(case, rate))
+
+    def test_decode_flat_line(self) -> None:
+        rate = vtc.RATE.F24
+        self.assertEqual([None], _timecodes([[[_BLACK] * 720]], rate))
+
+    def test_unsupported_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            vtc.vitc.decode([], rate=vtc.RATE.F59_94_DF)
+
+
+def _uyvy(frames: List[List[List[int]]]) -> bytes:
+    data = bytearray()
+    for frame in frames:
+        for line in frame:
+            for sample in line:
+                data.extend((128, sample))
+    return bytes(data)
+
+
+def _v210(frames: List[List[List[int]]], width: int) -> bytes:
+    stride = -(-width // 48) * 128
+    data = bytearray()
+    for frame in frames:
+        for line in frame:
+            luma = [sample * 4 for sample in line]
+            luma.extend([64] * (-len(luma) % 6))
+            row = bytearray()
+            for block in range(0, len(luma), 6):
+                y0, y1, y2, y3, y4, y5 = luma[block : block + 6]
+                row.extend(
+                    struct.pack(
+                        "<4I",
+                        512 | y0 << 10 | 512 << 20,
+                        y1 | 512 << 10 | y2 << 20,
+                        512 | y3 << 10 | 512 << 20,
+                        y4 | 512 << 10 | y5 << 20,
+                    )
+                )
+            row.extend(bytes(stride - len(row)))
+            data.extend(row)
+    return bytes(data)
+
+
+class TestDecodeVideo(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def frames(self, rate: vtc.Framerate, width: int) -> List[List[List[int]]]:
+        start = vtc.Timecode("10:00:00;00", rate=rate)
+        blank = _vitc_line(None, width=width)
+        picture = [_WHITE] * width
+
+        frames: List[List[List[int]]] = list()
+        for offset in range(5):
+            line = _vitc_line(start + offset, width=width)
+            frames.append([blank, line, blank, picture])
+
+        # Corrupt the VITC of one frame.
+        frames[2][1] = _vitc_line(start, width=width, flip_bit=50)
+        return frames
+
+    def expected(self, rate: vtc.Framerate) -> List[Any]:
+        start = vtc.Timecode("10:00:00;00", rate=rate)
+        return [
+            None if offset == 2 else (start + offset).timecode for offset in range(5)
+        ]
+
+    def write(self, name: str, data: bytes) -> pathlib.Path:
+        path = pathlib.Path(self.temp_dir.name) / name
+        # Add a partial frame, which is ignored.
+        path.write_bytes(data + bytes(100))
+        return path
+
+    def decode_all(self, path: pathlib.Path, decode: Any, width: int) -> List[Any]:
+        timecodes = decode(
+            path, rate=vtc.RATE.F29_97_DF, width=width, height=4, lines=[0, 1]
+        )
+        return [None if tc is None else tc.timecode for tc in timecodes]
+
+    def test_decode(self) -> None:
+        rate = vtc.RATE.F29_97_DF
+        cases = [
+            ("uyvy", vtc.vitc.decode_uyvy, 720),
+            ("v210", vtc.vitc.decode_v210, 720),
+            ("v210", vtc.vitc.decode_v210, 700),
+        ]
+
+        for name, decode, width in cases:
+            with self.subTest(f"{name} {width}"):
+                frames = self.frames(rate, width)
+                if name == "uyvy":
+                    data = _uyvy(frames)
+                else:
+                    data = _v210(frames, width)
+                path = self.write(f"frames_{width}.{name}", data)
+
+                self.assertEqual(
+                    self.expected(rate), self.decode_all(path, decode, width)
+                )
+
+                with unittest.mock.patch.object(vtc._compat, "numpy", None):
+                    timecodes = self.decode_all(path, decode, width)
+                self.assertEqual(self.expected(rate), timecodes)
+
+                with unittest.mock.patch.object(vtc.vitc._video, "_CHUNK_FRAMES", 2):
+                    timecodes = self.decode_all(path, decode, width)
+                self.assertEqual(self.expected(rate), timecodes)
+
+    def test_empty_file(self) -> None:
+        path = self.write("empty.uyvy", b"")
+        self.assertEqual([], self.decode_all(path, vtc.vitc.decode_uyvy, 720))
+
+    def test_invalid_line(self) -> None:
+        path = self.write("frames.uyvy", _uyvy(self.frames(vtc.RATE.F29_97_DF, 720)))
+
+        for line in (-1, 4):
+            with self.subTest(line):
+                with self.assertRaises(ValueError) as error:
+                    vtc.vitc.decode_uyvy(
+                        path, rate=vtc.RATE.F29_97_DF, width=720, height=4, lines=[line]
+                    )
+                self.assertEqual(
+                    f"line must be between 0 and 3, got {line}", str(error.exception)
+                )